@@ -54,30 +54,35 @@ Naming conventions can fall under 4 categories:
 from __future__ import annotations  # docstrings
 
 import asyncio
+import bisect
 import calendar
 import contextlib
 import datetime as dt
 import functools
 import inspect
 import itertools
+import json
 import locale
 import logging
 import math
 import os.path
 import queue
 import re
+import shutil
+import tempfile
 import threading
 import tkinter as tk
 import tkinter.font as tkfont
+import warnings
 from abc import ABC, abstractmethod
 from dataclasses import InitVar, dataclass, fields
 from dataclasses import field as field_
 from decimal import Decimal, DecimalException
 from enum import Enum, Flag, auto
-from time import sleep, time
+from pathlib import Path
+from time import perf_counter, sleep, time
 from tkinter import ttk
 from typing import (
-    TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
@@ -96,9 +101,6 @@ import numpy as np
 import pandas as pd
 import PySimpleGUI as sg
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 # Wrap optional imports so that pysimplesql can be imported as a single file if desired:
 with contextlib.suppress(ModuleNotFoundError, ImportError):
     from .language_pack import *  # noqa F403
@@ -497,6 +499,9 @@ class Relationship:
         update_cascade: True if the child's fk_column ON UPDATE rule is 'CASCADE'
         delete_cascade: True if the child's fk_column ON DELETE rule is 'CASCADE'
         driver: A `SQLDriver` instance.
+        db_cascade: True if the ON DELETE CASCADE rule is declared in the database
+            itself, so the database deletes the child records on its own when it
+            enforces foreign keys.
     """
 
     join_type: str
@@ -507,6 +512,7 @@ class Relationship:
     update_cascade: bool
     delete_cascade: bool
     driver: Driver
+    db_cascade: bool = False
 
     @property
     def on_update_cascade(self):
@@ -667,6 +673,20 @@ class RelationshipStore(list):
         }
 
 
+def _same_value(a: Any, b: Any) -> bool:
+    # Values of different types display differently, i.e. 1 and True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, ElementRow):
+        return _same_value((a.pk, a.val), (b.pk, b.val))
+    if isinstance(a, float) and math.isnan(a) and math.isnan(b):
+        return True
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
 @dataclass
 class ElementMap:
     """Map a PySimpleGUI element to a specific `DataSet` column.
@@ -694,8 +714,57 @@ class ElementMap:
     where_column: str = None
     where_value: str = None
 
+    # Tk events that mean the user may have changed what the element shows
+    _EDIT_EVENTS: ClassVar[List[str]] = [
+        "<KeyPress>",
+        "<ButtonRelease>",
+        "<<ComboboxSelected>>",
+        "<<Paste>>",
+        "<<Cut>>",
+    ]
+
     def __post_init__(self) -> None:
         self.table = self.dataset.table
+        # What `Form.update_fields()` last pushed to the element, by kind
+        self._pushed: Dict[str, Any] = {}
+        widget = getattr(self.element, "widget", None)
+        if widget is not None and not isinstance(
+            self.element, (sg.Text, sg.Image, sg.Table)
+        ):
+            # Bind once per widget, to whichever ElementMap the element has now. Mapping
+            # the element again (i.e. `Form.auto_map_elements()`) only swaps the map.
+            if getattr(widget, "_pysimplesql_map", None) is None:
+                for sequence in self._EDIT_EVENTS:
+                    widget.bind(
+                        sequence,
+                        lambda _event: widget._pysimplesql_map.invalidate(),
+                        "+",
+                    )
+            widget._pysimplesql_map = self
+
+    def needs_update(self, kind: str, value: Any) -> bool:
+        """Check if a value differs from what was last pushed to the element, and
+        remember it as pushed.
+
+        Args:
+            kind: What is pushed, i.e. 'value', 'values' or 'marker'
+            value: The value about to be pushed
+
+        Returns:
+            False if the element already shows this value
+        """
+        if kind in self._pushed and _same_value(self._pushed[kind], value):
+            return False
+        self._pushed[kind] = value
+        return True
+
+    def invalidate(self) -> None:
+        """Forget what was pushed to the element, so the next update is always pushed.
+
+        Called when the user edits the element. Call it after updating a mapped element
+        outside of `Form.update_fields()`.
+        """
+        self._pushed.clear()
 
     def __getitem__(self, key):
         return self.__dict__[key]
@@ -867,6 +936,23 @@ class CurrentRow:
             )
 
 
+def _driver_operation(name: str) -> Callable:
+    """Decorator for `DataSet` methods, attributing their queries to an operation.
+
+    See `SQLDriver.operation` and `QueryEvent`.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            with self.driver.operation(name, self):
+                return fn(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 @dataclass(eq=False)
 class DataSet:
     """`DataSet` objects are used for an internal representation of database tables.
@@ -1298,6 +1384,8 @@ class DataSet:
             True or False on whether changed records were found
         """
         logger.debug(f'Checking if records have changed in table "{self.table}"...')
+        # the elements have to show the current record to compare them
+        self.frm.flush()
 
         # Virtual rows wills always be considered dirty
         if self.pk_is_virtual():
@@ -1310,54 +1398,53 @@ class DataSet:
 
         dirty = False
         # First check the current record to see if it's dirty
-        for mapped in self.frm.element_map:
+        for mapped in self.frm.mapped_elements(self.table):
             # Compare the DB version to the GUI version
-            if mapped.table == self.table:
-                # if passed custom column name
-                if column is not None and mapped.column != column:
-                    continue
+            # if passed custom column name
+            if column is not None and mapped.column != column:
+                continue
 
-                # if sg.Text
-                if isinstance(mapped.element, sg.Text):
-                    continue
+            # if sg.Text
+            if isinstance(mapped.element, sg.Text):
+                continue
 
-                # don't check if there aren't any rows. Fixes checkbox = '' when no
-                # rows.
-                if not len(self.frm[mapped.table].rows.index):
-                    continue
+            # don't check if there aren't any rows. Fixes checkbox = '' when no
+            # rows.
+            if not len(self.frm[mapped.table].rows.index):
+                continue
 
-                # Get the element value and cast it, so we can compare it to the
-                # database version.
-                element_val = self.column_info[mapped.column].cast(mapped.element.get())
+            # Get the element value and cast it, so we can compare it to the
+            # database version.
+            element_val = self.column_info[mapped.column].cast(mapped.element.get())
 
-                # Get the table value.  If this is a keyed element, we need figure out
-                # the appropriate table column.
-                table_val = None
-                if mapped.where_column is not None:
-                    for _, row in self.rows.iterrows():
-                        if row[mapped.where_column] == mapped.where_value:
-                            table_val = row[mapped.column]
-                else:
-                    table_val = self[mapped.column]
+            # Get the table value.  If this is a keyed element, we need figure out
+            # the appropriate table column.
+            table_val = None
+            if mapped.where_column is not None:
+                for _, row in self.rows.iterrows():
+                    if row[mapped.where_column] == mapped.where_value:
+                        table_val = row[mapped.column]
+            else:
+                table_val = self[mapped.column]
 
-                new_value = self.value_changed(
-                    mapped.column,
-                    table_val,
-                    element_val,
-                    bool(isinstance(mapped.element, sg.Checkbox)),
+            new_value = self.value_changed(
+                mapped.column,
+                table_val,
+                element_val,
+                bool(isinstance(mapped.element, sg.Checkbox)),
+            )
+            if new_value is not Boolean.FALSE:
+                dirty = True
+                logger.debug("CHANGED RECORD FOUND!")
+                logger.debug(
+                    f"\telement type: {type(element_val)} "
+                    f"column_type: {type(table_val)}"
                 )
-                if new_value is not Boolean.FALSE:
-                    dirty = True
-                    logger.debug("CHANGED RECORD FOUND!")
-                    logger.debug(
-                        f"\telement type: {type(element_val)} "
-                        f"column_type: {type(table_val)}"
-                    )
-                    logger.debug(
-                        f"\t{mapped.element.Key}:{element_val} != "
-                        f"{mapped.column}:{table_val}"
-                    )
-                    return dirty
+                logger.debug(
+                    f"\t{mapped.element.Key}:{element_val} != "
+                    f"{mapped.column}:{table_val}"
+                )
+                return dirty
 
         # handle recursive checking next
         if recursive:
@@ -1484,6 +1571,7 @@ class DataSet:
         # if no changes
         return PromptSaveReturn.NONE
 
+    @_driver_operation("requery")
     def requery(
         self,
         select_first: bool = True,
@@ -1614,6 +1702,45 @@ class DataSet:
                     child=True, update_elements=update_elements
                 )
 
+    def refresh(self, update_elements: bool = True) -> None:
+        """Requery the table, keeping the selected record.
+
+        Used by `Form.watch_changes()` to pick up changes made by other connections.
+        The selection stays on the same primary key as long as that record still
+        exists, in which case dependents are not requeried. Nothing is updated if the
+        rows did not change.
+
+        Args:
+            update_elements: (optional) Update the GUI elements if the rows changed.
+
+        Returns:
+            None
+        """
+        pk = self.current.pk if self.row_count else None
+        old_rows = self.rows
+        self.requery(
+            select_first=False, update_elements=False, requery_dependents=False
+        )
+        if old_rows is not None and self.rows.equals(old_rows):
+            return
+
+        index = np.flatnonzero(self.rows[self.pk_column].to_numpy() == pk)
+        if pk is None or not len(index):
+            # the selected record is gone
+            self.first(update_elements=update_elements, skip_prompt_save=True)
+        else:
+            self.current.index = int(index[0])
+            if update_elements:
+                self.frm.update_elements(self.key)
+
+        if update_elements:
+            # other tables may show values from this one in their comboboxes
+            dependent_columns = self.relationships.get_dependent_columns(
+                self.frm, self.table
+            )
+            for key, col in dependent_columns.items():
+                self.frm.update_fields(key, columns=[col], combo_values_only=True)
+
     def first(
         self,
         update_elements: bool = True,
@@ -1651,6 +1778,7 @@ class DataSet:
             self.requery_dependents(update_elements=update_elements)
         # callback
         if "record_changed" in self.callbacks:
+            self.frm.flush()
             self.callbacks["record_changed"](self.frm, self.frm.window, self.key)
 
     def last(
@@ -1691,6 +1819,7 @@ class DataSet:
             self.requery_dependents()
         # callback
         if "record_changed" in self.callbacks:
+            self.frm.flush()
             self.callbacks["record_changed"](self.frm, self.frm.window, self.key)
 
     def next(
@@ -1731,6 +1860,7 @@ class DataSet:
                 self.requery_dependents()
             # callback
             if "record_changed" in self.callbacks:
+                self.frm.flush()
                 self.callbacks["record_changed"](self.frm, self.frm.window, self.key)
 
     def previous(
@@ -1771,8 +1901,10 @@ class DataSet:
                 self.requery_dependents()
             # callback
             if "record_changed" in self.callbacks:
+                self.frm.flush()
                 self.callbacks["record_changed"](self.frm, self.frm.window, self.key)
 
+    @_driver_operation("search")
     def search(
         self,
         search_string: str,
@@ -1893,6 +2025,8 @@ class DataSet:
             )
 
             # callback
+            if "after_search" in self.callbacks:
+                self.frm.flush()
             if "after_search" in self.callbacks and not self.callbacks["after_search"](
                 self.frm, self.frm.window, self.key
             ):
@@ -1903,6 +2037,7 @@ class DataSet:
 
             # record changed callback
             if "record_changed" in self.callbacks:
+                self.frm.flush()
                 self.callbacks["record_changed"](self.frm, self.frm.window, self.key)
             return SEARCH_RETURNED
 
@@ -2070,6 +2205,7 @@ class DataSet:
             "where_value": where_value,
         }
         self.selector.append(d)
+        self.frm._selectors_by_key.setdefault(element.key, (self, d))
 
     def insert_record(
         self, values: Dict[str, Union[str, int]] = None, skip_prompt_save: bool = False
@@ -2120,8 +2256,11 @@ class DataSet:
             if self.table == r.child_table and r.on_update_cascade:
                 new_values[r.fk_column] = self.frm[r.parent_table].current.pk
 
-        # Update the pk to match the expected pk the driver would generate on insert.
-        new_values[self.pk_column] = self.driver.next_pk(self.table, self.pk_column)
+        # Use a temporary pk until the row is saved and the database assigns the real
+        # one. This keeps inserting and discarding rows from touching the database.
+        new_values[self.pk_column] = self.driver.temporary_pk(
+            self.table, self.pk_column
+        )
 
         # Insert the new values using DataSet.insert_row(),
         # marking the new row as virtual
@@ -2134,6 +2273,7 @@ class DataSet:
         self.frm.update_elements(self.key)
         self.requery_dependents()
 
+    @_driver_operation("save")
     def save_record(
         self,
         display_message: bool = None,
@@ -2156,6 +2296,8 @@ class DataSet:
             SAVE_NONE, SAVE_FAIL or SAVE_SUCCESS masked with SHOW_MESSAGE
         """
         logger.debug(f"Saving records for table {self.table}...")
+        # the values to save are read from the elements
+        self.frm.flush()
         if display_message is None:
             display_message = not self.save_quiet
 
@@ -2200,7 +2342,9 @@ class DataSet:
         keyed_queries: Optional[List] = None
 
         # Propagate GUI data back to the stored current_row
-        for mapped in [m for m in self.frm.element_map if m.dataset == self]:
+        for mapped in [
+            m for m in self.frm.mapped_elements(self.table) if m.dataset == self
+        ]:
             # skip if sg.Text
             if isinstance(mapped.element, sg.Text):
                 continue
@@ -2313,7 +2457,7 @@ class DataSet:
         cascade_fk_column = self.relationships.get_update_cascade_fk_column(self.table)
         if cascade_fk_column:
             # check if fk
-            for mapped in self.frm.element_map:
+            for mapped in self.frm.mapped_elements(self.table):
                 if mapped.dataset == self and mapped.column == cascade_fk_column:
                     cascade_fk_changed = self.records_changed(
                         column=cascade_fk_column, recursive=False
@@ -2472,12 +2616,22 @@ class DataSet:
             results[self.table] = PromptSaveReturn.NONE
             return results
         # otherwise, proceed
+        savepoint = self.driver.savepoint() if self.driver.in_unit_of_work else None
         result = self.save_record(
             display_message=display_message, update_elements=update_elements
         )
+        if savepoint is not None:
+            # Undo just this save, so the rest of the unit of work can still run and
+            # report its own failures (a failed statement aborts the whole transaction
+            # on some databases).
+            if result & SAVE_FAIL:
+                self.driver.rollback_to_savepoint(savepoint)
+            else:
+                self.driver.release_savepoint(savepoint)
         results[self.table] = result
         return results
 
+    @_driver_operation("delete")
     def delete_record(
         self, cascade: bool = True
     ):  # TODO: check return type, we return True below
@@ -2556,6 +2710,7 @@ class DataSet:
         self.requery_dependents()
         return None
 
+    @_driver_operation("duplicate")
     def duplicate_record(
         self,
         children: bool = None,
@@ -2772,14 +2927,58 @@ class DataSet:
         if not self.row_count:
             return []
 
-        try:
-            all_columns = list(self.rows.columns)
-        except IndexError:
-            all_columns = []
+        return self._table_rows(
+            self.rows.copy(),
+            columns,
+            mark_unsaved,
+            apply_search_filter,
+            apply_cell_format_fn,
+        )
+
+    def table_row(
+        self,
+        pk: int = None,
+        columns: List[str] = None,
+        mark_unsaved: bool = True,
+        apply_cell_format_fn: bool = True,
+    ) -> Optional[TableRow]:
+        """Create a single `TableRow`, the same way `DataSet.table_values()` does.
+
+        Use this to refresh one row of a Table element after it changed, instead of
+        rebuilding the values for the entire `DataSet`.
+
+        Args:
+            pk: The primary key of the row. Defaults to the current row.
+            columns: A list of column names to create the row for. Defaults to
+                getting them from the `DataSet.rows` DataFrame.
+            mark_unsaved: Place a marker next to a virtual record, or a record with
+                unsaved changes.
+            apply_cell_format_fn: If set, apply()
+                `DataSet.column_info[col].cell_format_fn` to rows column
+
+        Returns:
+            The `TableRow`, or None if there is no row with this primary key.
+        """
+        if not self.row_count:
+            return None
 
-        columns = all_columns if columns is None else columns
+        pk = self.current.pk if pk is None else pk
+        rows = self.rows.loc[self.rows[self.pk_column] == pk].copy()
+        values = self._table_rows(
+            rows, columns, mark_unsaved, False, apply_cell_format_fn
+        )
+        return values[0] if values else None
 
-        rows = self.rows.copy()
+    def _table_rows(
+        self,
+        rows: pd.DataFrame,
+        columns: Optional[List[str]],
+        mark_unsaved: bool,
+        apply_search_filter: bool,
+        apply_cell_format_fn: bool,
+    ) -> List[TableRow]:
+        # rows is a copy of DataSet.rows, or of some of them
+        columns = list(rows.columns) if columns is None else list(columns)
         pk_column = self.pk_column
 
         if mark_unsaved:
@@ -2846,6 +3045,55 @@ class DataSet:
             )
         ]
 
+    def _selector_element_rows(
+        self, selector: Dict[str, Any]
+    ) -> Tuple[List[ElementRow], np.ndarray, bool]:
+        """Returns the `ElementRow`s for a Listbox or Combo selector.
+
+        The rows are built from column arrays, and cached on the selector entry. The
+        cache key is the data the rows show - the pks and descriptions after the
+        `where_column` filter - since `DataSet.rows` is also edited in place.
+
+        Args:
+            selector: The entry in `DataSet.selector` for the element.
+
+        Returns:
+            A tuple of the `ElementRow`s, their pks, and whether they changed since the
+            last call.
+        """
+        rows = self.rows
+        pks = rows[self.pk_column].to_numpy()
+        descriptions = rows[self.description_column].to_numpy()
+        if selector["where_column"] is not None:
+            column = rows[selector["where_column"]]
+            value = selector["where_value"]
+            if (
+                pd.api.types.is_integer_dtype(column)
+                and isinstance(value, int)
+                and not isinstance(value, bool)
+            ):
+                mask = column.to_numpy() == value
+            else:
+                # compare as strings, where the column and value types differ
+                mask = column.astype(str).to_numpy() == str(value)
+            pks = pks[mask]
+            descriptions = descriptions[mask]
+
+        cached = selector.get("element_rows")
+        if (
+            cached is not None
+            and np.array_equal(cached[0], pks)
+            and np.array_equal(cached[1], descriptions)
+        ):
+            return cached[2], pks, False
+
+        lst = [
+            ElementRow(pk, description) for pk, description in zip(pks, descriptions)
+        ]
+        # copies, as to_numpy() may return a view that in-place edits would change
+        selector["element_rows"] = (pks.copy(), descriptions.copy(), lst)
+        return lst, pks, True
+
     def column_likely_in_selector(self, column: str) -> bool:
         """Determines whether the given column is likely to be displayed in a selector.
 
@@ -3475,12 +3723,29 @@ class Form:
             `ValidateMode.STRICT` to prevent invalid values from being entered.
             `ValidateMode.RELAXED` allows invalid input, but ensures validation
             occurs before saving to the database.
+        unit_of_work: (optional) Default value is False. If True,
+            `Form.save_records()` writes all `DataSet` objects in a single transaction,
+            with a savepoint per `DataSet`. Either all changes are committed at once, or
+            none are. See `SQLDriver.begin_unit_of_work()`.
 
     Returns:
         None
     """
 
     instances: ClassVar[List[Form]] = []  # Track our instances
+    # Event key markers of the action buttons, and the kind of action they are
+    _ACTION_KINDS: ClassVar[List[Tuple[str, str]]] = [
+        (":table_delete", "delete"),
+        (":table_duplicate", "duplicate"),
+        (":table_first", "previous"),
+        (":table_previous", "previous"),
+        (":table_next", "next"),
+        (":table_last", "next"),
+        (":table_insert", "insert"),
+        (":db_save", "save"),
+        (":save_table", "save"),
+        (":quick_edit", "quick_edit"),
+    ]
 
     driver: SQLDriver
     bind_window: InitVar[sg.Window] = None
@@ -3495,6 +3760,7 @@ class Form:
     )
     live_update: bool = False
     validate_mode: ValidateMode = ValidateMode.RELAXED
+    unit_of_work: bool = False
 
     def __post_init__(
         self,
@@ -3508,6 +3774,17 @@ class Form:
         self.datasets: Dict[str, DataSet] = {}
         self.element_map: List[ElementMap] = []
         self.event_map: List = []  # Array of dicts, {'event':, 'function':, 'table':}
+        # Indexes into element_map, event_map and the DataSet selectors, kept up to date
+        # by map_element(), map_event() and DataSet.add_selector()
+        self._elements_by_table: Dict[str, List[ElementMap]] = {}
+        self._elements_by_widget: Dict[tk.Widget, ElementMap] = {}
+        self._events_by_name: Dict[str, dict] = {}
+        self._actions_by_table: Dict[str, List[Tuple[str, str]]] = {}
+        self._selectors_by_key: Dict[str, Tuple[DataSet, dict]] = {}
+        # GUI refreshes waiting for Form.flush(), by dataset key
+        self._pending_refresh: Dict[str, Dict[str, set]] = {}
+        self._refresh_after_id: str = None
+        self._flushing: bool = False
         self._edit_protect: bool = False
         self.relationships: RelationshipStore = self.driver.relationships
         self.callbacks: CallbacksDict = {}
@@ -3517,6 +3794,10 @@ class Form:
         self._celledit: _CellEdit = None
         self._liveupdate: _LiveUpdate = None
         self._liveupdate_binds: dict = {}
+        # Form.watch_changes() polling
+        self._watch_interval: int = 0
+        self._watch_after_id: str = None
+        self._watch_tokens: Dict[str, Any] = {}
 
         self._prompt_save: PROMPT_SAVE_MODES = prompt_save
 
@@ -3556,6 +3837,11 @@ class Form:
             reset_keygen: True to reset the keygen for this `Form`
             close_driver: True to also close associated `Form.driver`
         """
+        self._cancel_watch()
+        self._cancel_refresh()
+        self._pending_refresh = {}
+        # Write out anything the driver is still holding back
+        self.driver.write_pending()
         # First delete the dataset associated
         DataSet.purge_form(self, reset_keygen)
         if self.popup.popup_info:
@@ -3589,6 +3875,8 @@ class Form:
         self._liveupdate = _LiveUpdate(self)
         if self.live_update:
             self.set_live_update(enable=True)
+        if self._watch_interval:
+            self._schedule_watch()
         logger.debug("Binding finished!")
 
     def execute(self, query: str) -> pd.DataFrame:
@@ -3614,6 +3902,77 @@ class Form:
         """
         self.driver.commit()
 
+    def watch_changes(self, interval: int = 2000) -> None:
+        """Watch the database for changes made by other users, and refresh the
+        `DataSet` objects whose tables changed.
+
+        Polling runs on the window's event loop with tk.after(). Each poll asks the
+        driver for a cheap token per table, see `SQLDriver.change_tokens()`, and only
+        the `DataSet` objects whose token moved are refreshed with `DataSet.refresh()`,
+        which keeps the selected record. A `DataSet` with unsaved changes is left
+        alone until it has been saved.
+
+        Args:
+            interval: Milliseconds between polls. 0 to stop watching.
+
+        Returns:
+            None
+        """
+        self._cancel_watch()
+        self._watch_interval = interval
+        if not interval:
+            return
+        self._watch_tokens = self.driver.change_tokens(self._watched_tables())
+        # Polling starts once a window is bound, see `Form.bind()`
+        if self.window:
+            self._schedule_watch()
+
+    def _watched_tables(self) -> List[str]:
+        return list(dict.fromkeys(dataset.table for dataset in self.datasets.values()))
+
+    def _schedule_watch(self) -> None:
+        self._watch_after_id = self.window.TKroot.after(
+            self._watch_interval, self._poll_changes
+        )
+
+    def _cancel_watch(self) -> None:
+        if self._watch_after_id is not None:
+            with contextlib.suppress(tk.TclError, AttributeError):
+                self.window.TKroot.after_cancel(self._watch_after_id)
+            self._watch_after_id = None
+
+    def _poll_changes(self) -> None:
+        self._watch_after_id = None
+        # keep polling, even if this poll fails
+        try:
+            self._refresh_changed()
+        finally:
+            if self._watch_interval and self.window:
+                self._schedule_watch()
+
+    def _refresh_changed(self) -> None:
+        tokens = self.driver.change_tokens(self._watched_tables())
+        changed = [
+            table
+            for table, token in tokens.items()
+            if table in self._watch_tokens and self._watch_tokens[table] != token
+        ]
+        if changed:
+            logger.debug(f"External changes detected in {changed}")
+            if self.driver.query_cache is not None:
+                self.driver.query_cache.invalidate(changed)
+            for dataset in list(self.datasets.values()):
+                if dataset.table not in changed:
+                    continue
+                if dataset.records_changed(recursive=False) or dataset.rows.attrs.get(
+                    "virtual"
+                ):
+                    # keep the old token, so it is refreshed once saved
+                    tokens.pop(dataset.table, None)
+                    continue
+                dataset.refresh()
+        self._watch_tokens.update(tokens)
+
     def set_callback(
         self, callback_name: str, fctn: Callable[[Form, sg.Window], Union[None, bool]]
     ) -> None:
@@ -3748,9 +4107,14 @@ class Form:
         )
         # Clear any current dataset so successive calls won't double the entries
         self.datasets = {}
-        tables = self.driver.get_tables()
+        tables = self.driver.schema.get_tables()
+        # Introspect all tables at once, rather than a few queries per table
+        column_infos = self.driver.schema.bulk_column_info()
+        pk_columns = self.driver.schema.bulk_pk_column()
         for table in tables:
-            column_info = self.driver.column_info(table)
+            column_info = column_infos.get(table)
+            if column_info is None:
+                column_info = self.driver.schema.column_info(table)
 
             # auto generate description column.  Default it to the 2nd column,
             # but can be overwritten below
@@ -3761,7 +4125,10 @@ class Form:
                     break
 
             # Get our pk column
-            pk_column = self.driver.pk_column(table)
+            if table in pk_columns:
+                pk_column = pk_columns[table]
+            else:
+                pk_column = self.driver.schema.pk_column(table)
 
             data_key = table
             logger.debug(
@@ -3800,9 +4167,23 @@ class Form:
             None
         """
         logger.debug(f"Mapping element {element.key}")
-        self.element_map.append(
-            ElementMap(element, dataset, column, where_column, where_value)
-        )
+        mapped = ElementMap(element, dataset, column, where_column, where_value)
+        self.element_map.append(mapped)
+        self._elements_by_table.setdefault(mapped.table, []).append(mapped)
+        widget = getattr(element, "widget", None)
+        if widget is not None:
+            self._elements_by_widget.setdefault(widget, mapped)
+
+    def mapped_elements(self, table: str) -> List[ElementMap]:
+        """Return the `ElementMap` entries of the elements mapped to a table.
+
+        Args:
+            table: The table name
+
+        Returns:
+            A list of `ElementMap`, in the order they were mapped
+        """
+        return self._elements_by_table.get(table, [])
 
     def add_info_element(self, element: Union[sg.StatusBar, sg.Text]) -> None:
         """Add an element to be updated with info messages.
@@ -3845,6 +4226,8 @@ class Form:
         logger.info("Automapping elements")
         # Clear previously mapped elements so successive calls won't produce duplicates
         self.element_map = []
+        self._elements_by_table = {}
+        self._elements_by_widget = {}
         for key in win.key_dict:
             element = win[key]
 
@@ -4005,6 +4388,10 @@ class Form:
         dic = {"event": event, "function": fctn, "table": table}
         logger.debug(f"Mapping event {event} to function {fctn}")
         self.event_map.append(dic)
+        # the first mapping of an event is the one that runs
+        if event not in self._events_by_name:
+            self._events_by_name[event] = dic
+            self._index_action(dic)
 
     def replace_event(
         self, event: str, fctn: Callable[[None], None], table: str = None
@@ -4026,6 +4413,10 @@ class Form:
             if e["event"] == event:
                 e["function"] = fctn
                 e["table"] = table if table is not None else e["table"]
+        # the table may have changed
+        self._actions_by_table = {}
+        for e in self._events_by_name.values():
+            self._index_action(e)
 
     def auto_map_events(self, win: sg.Window) -> None:
         """Automatically map events. pysimplesql relies on certain events to function
@@ -4044,6 +4435,8 @@ class Form:
         logger.info("Automapping events")
         # Clear mapped events to ensure successive calls won't produce duplicates
         self.event_map = []
+        self._events_by_name = {}
+        self._actions_by_table = {}
 
         for key in win.key_dict:
             # key = str(key)  # sometimes end up with an integer element 0?TODO:Research
@@ -4255,6 +4648,7 @@ class Form:
         cascade_only: bool = False,
         check_prompt_save: bool = False,
         update_elements: bool = True,
+        unit_of_work: bool = None,
     ) -> Union[SAVE_SUCCESS, SAVE_FAIL, SAVE_NONE]:
         """Save records of all `DataSet` objects` associated with this `Form`.
 
@@ -4266,6 +4660,8 @@ class Form:
                 individual `DataSet` has prompt_save enabled. Used when
                 `Form.save_records()` is called from `Form.prompt_save()`.
             update_elements: (optional) Passed to `Form.save_record_recursive()`
+            unit_of_work: (optional) Save all tables in one transaction, committed only
+                if every save succeeds. Defaults to `Form.unit_of_work`.
 
         Returns:
             result - can be used with RETURN BITMASKS
@@ -4299,21 +4695,44 @@ class Form:
                 if self.relationships.get_parent(dataset.table) is None
             ]
 
+        if unit_of_work is None:
+            unit_of_work = self.unit_of_work
+        if unit_of_work:
+            snapshots = self._save_snapshots(tables)
+            self.driver.begin_unit_of_work()
+
         # call save_record_recursive on tables, which saves from last to first.
         result_list = []
-        for q in tables:
-            res = self[q].save_record_recursive(
-                results={},
-                display_message=False,
-                check_prompt_save=check_prompt_save,
-                update_elements=update_elements,
-            )
-            result_list.append(res)
+        try:
+            for q in tables:
+                res = self[q].save_record_recursive(
+                    results={},
+                    display_message=False,
+                    check_prompt_save=check_prompt_save,
+                    update_elements=update_elements,
+                )
+                result_list.append(res)
+        except Exception:
+            if unit_of_work:
+                self.driver.end_unit_of_work(commit=False)
+                self._restore_snapshots(snapshots, update_elements)
+            raise
 
         # flatten list of result dicts
         results = {k: v for d in result_list for k, v in d.items()}
         logger.debug(f"Form.save_records - results of tables - {results}")
 
+        if unit_of_work:
+            failed = any(res & SAVE_FAIL for res in results.values())
+            self.driver.end_unit_of_work(commit=not failed)
+            if failed:
+                self._restore_snapshots(snapshots, update_elements)
+                # nothing was written, only report the tables that failed
+                results = {
+                    t: (res & ~SAVE_SUCCESS) | SAVE_NONE if res & SAVE_SUCCESS else res
+                    for t, res in results.items()
+                }
+
         # get tables that failed
         for t, res in results.items():
             if not res & SHOW_MESSAGE:
@@ -4339,6 +4758,42 @@ class Form:
             self.popup.info(msg, display_message=display_message)
         return result
 
+    def _save_snapshots(
+        self, tables: List[str]
+    ) -> Dict[str, Tuple[pd.DataFrame, int]]:
+        # Copy the rows of every dataset a save can reach, so that they can be put back
+        # if the unit of work is rolled back.
+        snapshots = {}
+        pending = list(tables)
+        while pending:
+            table = pending.pop()
+            if table in snapshots:
+                continue
+            dataset = self[table]
+            rows = dataset.rows.copy()
+            rows.attrs = {
+                **dataset.rows.attrs,
+                "virtual": list(dataset.rows.attrs.get("virtual", [])),
+            }
+            snapshots[table] = (rows, dataset.current.index)
+            pending.extend(
+                rel.child_table
+                for rel in self.relationships
+                if rel.parent_table == table and rel.on_update_cascade
+            )
+        return snapshots
+
+    def _restore_snapshots(
+        self, snapshots: Dict[str, Tuple[pd.DataFrame, int]], update_elements: bool
+    ) -> None:
+        # The GUI elements still hold the unsaved values, only the rows are put back
+        for table, (rows, index) in snapshots.items():
+            dataset = self[table]
+            dataset.rows = rows
+            dataset.current.index = index
+            if update_elements:
+                self.update_selectors(dataset.key)
+
     def update_elements(
         self,
         target_data_key: str = None,
@@ -4359,7 +4814,16 @@ class Form:
 
         Returns:
             None
+
+        Note:
+            Once a window is bound, the update is scheduled rather than run right away.
+            Updates scheduled while handling an action are merged, and run once when Tk
+            is next idle. See `Form.flush()`.
         """
+        parts = ["states"] if edit_protect_only else ["states", "fields", "selectors"]
+        if self._schedule_refresh(target_data_key, parts, omit_elements):
+            return
+
         if omit_elements is None:
             omit_elements = []
 
@@ -4391,6 +4855,19 @@ class Form:
             logger.info("Running the update_elements callback...")
             self.callbacks["update_elements"](self, self.window)
 
+    def _index_action(self, event: dict) -> None:
+        # Sort action events by table and kind once, for update_actions()
+        if not isinstance(event["event"], str):
+            return
+        kind = next(
+            (kind for marker, kind in self._ACTION_KINDS if marker in event["event"]),
+            None,
+        )
+        if kind is not None:
+            self._actions_by_table.setdefault(event["table"], []).append(
+                (kind, event["event"])
+            )
+
     def update_actions(self, target_data_key: str = None) -> None:
         """Update state for action-buttons.
 
@@ -4406,37 +4883,37 @@ class Form:
             # call row_count @property once
             row_count = self[data_key].row_count
 
-            for m in (m for m in self.event_map if m["table"] == self[data_key].table):
+            for kind, event in self._actions_by_table.get(self[data_key].table, []):
                 # Disable delete and mapped elements for this table if there are no
                 # records in this table or edit protect mode
-                if ":table_delete" in m["event"]:
+                if kind == "delete":
                     disable = not row_count or self._edit_protect
-                    win[m["event"]].update(disabled=disable)
+                    win[event].update(disabled=disable)
 
                 # Disable duplicate if no rows, edit protect, or current row virtual
-                elif ":table_duplicate" in m["event"]:
+                elif kind == "duplicate":
                     disable = bool(
                         not row_count
                         or self._edit_protect
                         or self[data_key].pk_is_virtual()
                     )
-                    win[m["event"]].update(disabled=disable)
+                    win[event].update(disabled=disable)
 
                 # Disable first/prev if only 1 row, or first row
-                elif ":table_first" in m["event"] or ":table_previous" in m["event"]:
+                elif kind == "previous":
                     disable = row_count < 2 or self[data_key].current.index == 0
-                    win[m["event"]].update(disabled=disable)
+                    win[event].update(disabled=disable)
 
                 # Disable next/last if only 1 row, or last row
-                elif ":table_next" in m["event"] or ":table_last" in m["event"]:
+                elif kind == "next":
                     disable = row_count < 2 or (
                         self[data_key].current.index == row_count - 1
                     )
-                    win[m["event"]].update(disabled=disable)
+                    win[event].update(disabled=disable)
 
                 # Disable insert on children with no parent/virtual parent records or
                 # edit protect mode
-                elif ":table_insert" in m["event"]:
+                elif kind == "insert":
                     parent = self.relationships.get_parent(data_key)
                     if parent is not None:
                         disable = bool(
@@ -4448,16 +4925,84 @@ class Form:
                         )
                     else:
                         disable = self._edit_protect
-                    win[m["event"]].update(disabled=disable)
+                    win[event].update(disabled=disable)
 
                 # Disable db_save when needed
-                elif ":db_save" in m["event"] or ":save_table" in m["event"]:
+                elif kind == "save":
                     disable = not row_count or self._edit_protect
-                    win[m["event"]].update(disabled=disable)
+                    win[event].update(disabled=disable)
 
                 # Enable/Disable quick edit buttons
-                elif ":quick_edit" in m["event"]:
-                    win[m["event"]].update(disabled=disable)
+                elif kind == "quick_edit":
+                    win[event].update(disabled=disable)
+
+    def flush(self) -> None:
+        """Run the scheduled GUI refresh now, instead of when Tk is next idle.
+
+        `Form.update_elements()` and `Form.update_selectors()` only record what needs
+        refreshing once a window is bound, so that the several refreshes a single
+        action asks for are merged into one. Call this before reading mapped elements
+        right after changing records outside the event loop.
+
+        Returns:
+            None
+        """
+        self._cancel_refresh()
+        pending, self._pending_refresh = self._pending_refresh, {}
+        if not pending:
+            return
+        self._flushing = True
+        try:
+            for data_key, refresh in pending.items():
+                if data_key not in self.datasets:
+                    continue
+                omit_elements = list(refresh["omit"])
+                if "states" in refresh["parts"]:
+                    disable = not self[data_key].row_count or self._edit_protect
+                    self.update_element_states(data_key, disable)
+                    self.update_actions(data_key)
+                if "fields" in refresh["parts"]:
+                    self.update_fields(data_key, omit_elements)
+                if "selectors" in refresh["parts"]:
+                    self.update_selectors(data_key, omit_elements)
+
+            # Run callbacks
+            if "update_elements" in self.callbacks and any(
+                "fields" in refresh["parts"] for refresh in pending.values()
+            ):
+                # Running user update function
+                logger.info("Running the update_elements callback...")
+                self.callbacks["update_elements"](self, self.window)
+        finally:
+            self._flushing = False
+
+    def _schedule_refresh(
+        self, target_data_key: str, parts: List[str], omit_elements: List[str]
+    ) -> bool:
+        # Record a refresh for Form.flush(). Returns False if it has to run right away,
+        # because there is no Tk event loop yet, or we are flushing already.
+        root = getattr(self.window, "TKroot", None) if self.window else None
+        if self._flushing or root is None:
+            return False
+        omit = set(omit_elements or [])
+        data_keys = self.datasets if target_data_key is None else [target_data_key]
+        for data_key in data_keys:
+            refresh = self._pending_refresh.get(data_key)
+            if refresh is None:
+                self._pending_refresh[data_key] = {"parts": set(parts), "omit": omit}
+                continue
+            refresh["parts"].update(parts)
+            # only skip an element if every merged refresh asked to
+            refresh["omit"] = refresh["omit"] & omit
+        if self._refresh_after_id is None:
+            self._refresh_after_id = root.after_idle(self.flush)
+        return True
+
+    def _cancel_refresh(self) -> None:
+        if self._refresh_after_id is not None:
+            with contextlib.suppress(tk.TclError, AttributeError):
+                self.window.TKroot.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
 
     def update_fields(
         self,
@@ -4475,6 +5020,9 @@ class Form:
             omit_elements: A list of elements to omit updating
             columns: A list of column names to update
             combo_values_only: Updates the value list only for comboboxes.
+
+        Elements that already show what they would be updated to are left alone, see
+        `ElementMap.needs_update()`.
         """
         if omit_elements is None:
             omit_elements = []
@@ -4482,17 +5030,17 @@ class Form:
         if columns is None:
             columns = []
 
+        # If the optional target_data_key parameter was passed, we will only update
+        # elements bound to that table
+        element_map = (
+            self.element_map
+            if target_data_key is None
+            else self.mapped_elements(self[target_data_key].table)
+        )
+
         # Render GUI Elements
         # d= dictionary (the element map dictionary)
-        for mapped in self.element_map:
-            # If the optional target_data_key parameter was passed, we will only update
-            # elements bound to that table
-            if (
-                target_data_key is not None
-                and mapped.table != self[target_data_key].table
-            ):
-                continue
-
+        for mapped in element_map:
             # skip updating this element if requested
             if mapped.element in omit_elements:
                 continue
@@ -4516,19 +5064,19 @@ class Form:
                     if (
                         col in mapped.dataset.column_info.names
                         and mapped.dataset.column_info[col].notnull
+                        and mapped.needs_update("marker", True)
                     ):
                         self.window[marker_key].update(
                             visible=True,
                             text_color=themepack.marker_required_color,
                         )
-                else:
+                elif mapped.needs_update("marker", False):
                     self.window[marker_key].update(visible=False)
-                    if self.window is not None:
-                        self.window[marker_key].update(visible=False)
             except AttributeError:
                 self.window[marker_key].update(visible=False)
 
             updated_val = None
+            clear = False
             # If there is a callback for this element, use it
             if mapped.element.key in self.callbacks:
                 self.callbacks[mapped.element.key]()
@@ -4557,7 +5105,8 @@ class Form:
                     # we don't want to update the list in this case, as it was most
                     # likely supplied and not tied to data
                     updated_val = mapped.dataset[mapped.column]
-                    mapped.element.update(updated_val)
+                    if mapped.needs_update("value", updated_val):
+                        mapped.element.update(updated_val)
                     continue
 
                 # else, first...
@@ -4573,8 +5122,14 @@ class Form:
                     (entry for entry in combo_vals if entry.get_pk() == match_val),
                     None,
                 )
-                # and update element
-                mapped.element.update(values=combo_vals)
+                # and update element. ElementRows don't compare equal, so compare
+                # their contents. Setting the values clears the selection.
+                if mapped.needs_update(
+                    "values", [(v.get_pk(), v.get_val()) for v in combo_vals]
+                ):
+                    mapped.element.update(values=combo_vals)
+                    mapped._pushed.pop("value", None)
+                clear = True
 
             elif isinstance(mapped.element, sg.Text):
                 rels = self.relationships.get_rels_for(mapped.dataset.table)
@@ -4589,7 +5144,7 @@ class Form:
                         break
                 if not found:
                     updated_val = mapped.dataset[mapped.column]
-                mapped.element.update("")
+                clear = True
 
             elif isinstance(mapped.element, sg.Table):
                 # Tables use an array of arrays for values.  Note that the headings
@@ -4610,10 +5165,9 @@ class Form:
 
             elif isinstance(mapped.element, (sg.Input, sg.Multiline)):
                 # Update the element in the GUI
-                # For text objects, lets clear it first...
-
+                # For text objects, None clears it
                 # HACK for sqlite query not making needed keys! This will clear
-                mapped.element.update("")
+                clear = True
 
                 updated_val = mapped.dataset[mapped.column]
 
@@ -4622,6 +5176,10 @@ class Form:
 
             elif isinstance(mapped.element, sg.Image):
                 val = mapped.dataset[mapped.column]
+                # Prevent the update from triggering below, since we are doing it here
+                updated_val = None
+                if not mapped.needs_update("value", val):
+                    continue
 
                 try:
                     val = eval(val)
@@ -4631,13 +5189,14 @@ class Form:
                 else:
                     # update the bytes data
                     mapped.element.update(data=val)
-                # Prevent the update from triggering below, since we are doing it here
-                updated_val = None
             else:
                 sg.popup(f"Unknown element type {type(mapped.element)}")
 
-            # Finally, we will update the actual GUI element!
-            if updated_val is not None:
+            # Finally, we will update the actual GUI element, unless it already shows
+            # this value
+            if updated_val is None and clear:
+                updated_val = ""
+            if updated_val is not None and mapped.needs_update("value", updated_val):
                 mapped.element.update(updated_val)
 
     def update_selectors(
@@ -4658,6 +5217,11 @@ class Form:
         Returns:
             None
         """
+        if not search_filter_only and self._schedule_refresh(
+            target_data_key, ["selectors"], omit_elements
+        ):
+            return
+
         if omit_elements is None:
             omit_elements = []
 
@@ -4680,40 +5244,29 @@ class Form:
 
                     element: sg.Element = e["element"]
                     logger.debug(f"{type(element)}")
-                    pk_column = dataset.pk_column
-                    description_column = dataset.description_column
                     if element.key in self.callbacks:
                         self.callbacks[element.key]()
 
                     if isinstance(element, (sg.Listbox, sg.Combo)):
                         logger.debug("update_elements: List/Combo selector found...")
-                        lst = []
-                        for _, r in dataset.rows.iterrows():
-                            if e["where_column"] is not None:
-                                # TODO: Kind of a hackish way to check for equality.
-                                if str(r[e["where_column"]]) == str(e["where_value"]):
-                                    lst.append(
-                                        ElementRow(r[pk_column], r[description_column])
-                                    )
-                                else:
-                                    pass
-                            else:
-                                lst.append(
-                                    ElementRow(r[pk_column], r[description_column])
-                                )
-
-                        element.update(
-                            values=lst,
-                            set_to_index=dataset.current.index,
-                        )
+                        lst, pks, changed = dataset._selector_element_rows(e)
+                        # position of the current row in the (filtered) list
+                        position = np.flatnonzero(pks == dataset.current.pk)
+                        position = int(position[0]) if len(position) else None
+
+                        if changed:
+                            element.update(values=lst, set_to_index=position)
+                        elif position is not None:
+                            # only the selection moved
+                            element.update(set_to_index=position)
 
                         # set vertical scroll bar to follow selected element
-                        # (for listboxes only)
-                        if isinstance(element, sg.Listbox):
+                        # (for listboxes only, LazyListbox scrolls on its own)
+                        if isinstance(element, sg.Listbox) and not isinstance(
+                            element, LazyListbox
+                        ):
                             try:
-                                element.set_vscroll_position(
-                                    dataset.current.index / len(lst)
-                                )
+                                element.set_vscroll_position((position or 0) / len(lst))
                             except ZeroDivisionError:
                                 element.set_vscroll_position(0)
 
@@ -4765,6 +5318,49 @@ class Form:
                         # Update table, and set vertical scroll bar to follow
                         update_table_element(self.window, element, values, index)
 
+    def update_selector_row(
+        self, target_data_key: str, pk: int = None, column: str = None
+    ) -> None:
+        """Patch a single changed row into the selector elements of a `DataSet`.
+
+        Use this instead of `Form.update_selectors()` when only one row changed, such
+        as after editing a field. Table selectors that show the row get just that
+        `TableRow` - with formatted cells and the unsaved marker - instead of being
+        rebuilt from `DataSet.table_values()`. Other selectors, and Tables that don't
+        show the row yet, are updated with `Form.update_selectors()` when needed.
+
+        Args:
+            target_data_key: Key of the `DataSet` the row belongs to.
+            pk: The primary key of the row. Defaults to the current row.
+            column: The column that changed, or None if not known.
+
+        Returns:
+            None
+        """
+        dataset = self[target_data_key]
+        pk = dataset.current.pk if pk is None else pk
+        tables = [
+            e["element"] for e in dataset.selector if isinstance(e["element"], sg.Table)
+        ]
+        patched = []
+        rows = {}  # TableRows by the columns they were created for
+        for element in tables:
+            columns = None
+            if "TableBuilder" in element.metadata:
+                columns = element.metadata["TableBuilder"].columns
+            key = tuple(columns) if columns is not None else None
+            if key not in rows:
+                rows[key] = dataset.table_row(pk, columns)
+            if rows[key] is not None and _patch_table_row(element, rows[key]):
+                patched.append(element)
+
+        # Listbox, Combo and Slider selectors only show the description
+        others = len(dataset.selector) > len(tables)
+        if len(patched) < len(tables) or (
+            others and column in [None, dataset.description_column]
+        ):
+            self.update_selectors(target_data_key, patched)
+
     def requery_all(
         self,
         select_first: bool = True,
@@ -4832,44 +5428,44 @@ class Form:
             )
             return False
         if event:
-            for e in self.event_map:
-                if e["event"] == event:
-                    logger.debug(f"Executing event {event} via event mapping.")
-                    e["function"]()
-                    logger.debug("Done processing event!")
-                    return True
+            e = self._events_by_name.get(event)
+            if e is not None:
+                logger.debug(f"Executing event {event} via event mapping.")
+                e["function"]()
+                logger.debug("Done processing event!")
+                return True
 
             # Check for  selector events
-            for _data_key, dataset in self.datasets.items():
-                if len(dataset.selector):
-                    for e in dataset.selector:
-                        element: sg.Element = e["element"]
-                        if element.key == event and len(dataset.rows) > 0:
-                            changed = False  # assume that a change will not take place
-                            if isinstance(element, sg.Listbox):
-                                row = values[element.Key][0]
-                                dataset.set_by_pk(row.get_pk())
-                                changed = True
-                            elif isinstance(element, sg.Slider):
-                                dataset.set_by_index(int(values[event]) - 1)
-                                changed = True
-                            elif isinstance(element, sg.Combo):
-                                row = values[event]
-                                dataset.set_by_pk(row.get_pk())
-                                changed = True
-                            elif isinstance(element, sg.Table) and len(values[event]):
-                                if isinstance(element, LazyTable):
-                                    pk = int(values[event])
-                                else:
-                                    index = values[event][0]
-                                    pk = self.window[event].Values[index].pk
-                                # no need to update the selector!
-                                dataset.set_by_pk(pk, True, omit_elements=[element])
-
-                                changed = True
-                            if changed and "record_changed" in dataset.callbacks:
-                                dataset.callbacks["record_changed"](self, self.window)
-                            return changed
+            if event in self._selectors_by_key:
+                dataset, e = self._selectors_by_key[event]
+                element: sg.Element = e["element"]
+                if len(dataset.rows) > 0:
+                    changed = False  # assume that a change will not take place
+                    if isinstance(element, sg.Listbox):
+                        row = values[element.Key][0]
+                        dataset.set_by_pk(row.get_pk())
+                        changed = True
+                    elif isinstance(element, sg.Slider):
+                        dataset.set_by_index(int(values[event]) - 1)
+                        changed = True
+                    elif isinstance(element, sg.Combo):
+                        row = values[event]
+                        dataset.set_by_pk(row.get_pk())
+                        changed = True
+                    elif isinstance(element, sg.Table) and len(values[event]):
+                        if isinstance(element, LazyTable):
+                            pk = int(values[event])
+                        else:
+                            index = values[event][0]
+                            pk = self.window[event].Values[index].pk
+                        # no need to update the selector!
+                        dataset.set_by_pk(pk, True, omit_elements=[element])
+
+                        changed = True
+                    if changed and "record_changed" in dataset.callbacks:
+                        self.flush()
+                        dataset.callbacks["record_changed"](self, self.window)
+                    return changed
         return False
 
     def update_element_states(
@@ -4885,9 +5481,7 @@ class Form:
         Returns:
             None
         """
-        for mapped in self.element_map:
-            if mapped.table != table:
-                continue
+        for mapped in self.mapped_elements(table):
             element = mapped.element
             if isinstance(element, (sg.Input, sg.Multiline, sg.Combo, sg.Checkbox)):
                 # if element.Key in self.window.key_dict.keys():
@@ -5005,8 +5599,10 @@ def update_table_element(
     """Updates a PySimpleGUI sg.Table with new data and suppresses extra events emitted.
 
     Call this function instead of simply calling update() on a sg.Table element.
-    Without unbinding the virtual "<<TreeviewSelect>>" event, updating the selection or
-    values will in turn fire more changed events, creating an endless loop of events.
+    Without suppressing the virtual "<<TreeviewSelect>>" event, updating the selection
+    or values will in turn fire more changed events, creating an endless loop of events.
+    See `_SelectGuard`. A `LazyTable` tracks the selected pk, and ignores the events
+    itself.
 
     Args:
         window: A PySimpleGUI Window containing the sg.Table element to be updated.
@@ -5017,19 +5613,133 @@ def update_table_element(
     Returns:
         None
     """
-    # Disable handling for "<<TreeviewSelect>>" event
-    element.widget.unbind("<<TreeviewSelect>>")
+    if isinstance(element, LazyTable):
+        element.update(values=values, select_rows=select_rows)
+        return
+
+    # Ignore "<<TreeviewSelect>>" events until Tk is idle again
+    _SelectGuard.get(element).suppress()
     # update element
-    element.update(values=values, select_rows=select_rows)
+    if not _patch_table_rows(element, values):
+        element.update(values=values, select_rows=select_rows)
+    else:
+        element.widget.selection_set([element.tree_ids[i] for i in select_rows])
+        element.SelectedRows = list(select_rows)
 
     # make sure row_iid is visible
-    if not isinstance(element, LazyTable) and len(values) and select_rows:
+    if len(values) and select_rows:
         row_iid = element.tree_ids[select_rows[0]]
         element.widget.see(row_iid)
 
-    window.refresh()  # Event handled and bypassed
-    # Enable handling for "<<TreeviewSelect>>" event
-    element.widget.bind("<<TreeviewSelect>>", element._treeview_selected)
+
+class _SelectGuard:
+    """Internal class used to ignore the "<<TreeviewSelect>>" events fired by updating
+    a sg.Table, instead of unbinding the event and forcing a `window.refresh()`.
+
+    Tk queues these events, and handles them before any idle callback. Each update
+    therefore starts a new generation that is ended by an `after_idle()` callback, and
+    events are only passed on to PySimpleGUI when the latest generation has ended.
+    """
+
+    def __init__(self, element: sg.Table) -> None:
+        self.element = element
+        self.generation = 0
+        self.ended = 0
+        element.widget.bind("<<TreeviewSelect>>", self)
+
+    @classmethod
+    def get(cls, element: sg.Table) -> _SelectGuard:
+        guard = getattr(element, "_ss_select_guard", None)
+        if guard is None:
+            guard = cls(element)
+            element._ss_select_guard = guard
+        return guard
+
+    def __call__(self, event) -> None:
+        if self.ended == self.generation:
+            self.element._treeview_selected(event)
+
+    def suppress(self) -> None:
+        self.generation += 1
+        generation = self.generation
+        self.element.widget.after_idle(lambda: self.end(generation))
+
+    def end(self, generation: int) -> None:
+        self.ended = max(self.ended, generation)
+
+
+def _patch_table_rows(element: sg.Table, values: List[TableRow]) -> bool:
+    """Updates the rows of a sg.Table in place instead of re-inserting all of them.
+
+    PySimpleGUI identifies the rows of a sg.Table by their index, so the new values are
+    compared with `element.Values` by position: changed rows are rewritten with
+    `item()`, and rows are only inserted or deleted at the end.
+
+    Args:
+        element: The sg.Table element to be updated.
+        values: A list of table rows to update the sg.Table with.
+
+    Returns:
+        False if the displayed rows are out of sync with `element.Values`, and the
+        sg.Table has to be updated with `update(values=)` instead.
+    """
+    old = element.Values or []
+    if len(element.tree_ids) != len(old):
+        return False
+
+    treeview = element.widget
+    for i, row in enumerate(values):
+        if i < len(old) and old[i] == row:
+            continue
+        value = row
+        if element.DisplayRowNumbers:
+            value = [i + element.StartingRowNumber, *row]
+        if i < len(old):
+            treeview.item(element.tree_ids[i], text=value, values=value)
+            continue
+        # same iid and tag as PySimpleGUI, which colors even rows by tag
+        iid = treeview.insert("", "end", text=value, iid=i + 1, values=value, tag=i)
+        if element.AlternatingRowColor is not None and not i % 2:
+            treeview.tag_configure(i, background=element.AlternatingRowColor)
+        element.tree_ids.append(iid)
+
+    for iid in element.tree_ids[len(values) :]:
+        treeview.delete(iid)
+    del element.tree_ids[len(values) :]
+    element.Values = values
+    return True
+
+
+def _patch_table_row(element: sg.Table, row: TableRow) -> bool:
+    """Replaces the row with the same pk in a sg.Table or `LazyTable`.
+
+    Args:
+        element: The sg.Table element to be updated.
+        row: The new table row.
+
+    Returns:
+        False if the element doesn't have a row with this pk.
+    """
+    if isinstance(element, LazyTable):
+        return element.patch_row(row)
+
+    old = element.Values or []
+    if len(element.tree_ids) != len(old):
+        return False
+    i = next(
+        (i for i, old_row in enumerate(old) if getattr(old_row, "pk", None) == row.pk),
+        None,
+    )
+    if i is None:
+        return False
+
+    if old[i] != row:
+        value = row
+        if element.DisplayRowNumbers:
+            value = [i + element.StartingRowNumber, *row]
+        element.widget.item(element.tree_ids[i], text=value, values=value)
+    old[i] = row
+    return True
 
 
 def checkbox_to_bool(value: Union[str, int, bool]) -> bool:
@@ -5630,35 +6340,92 @@ See `KeyGen` for more info
 """
 
 
-class LazyTable(sg.Table):
-    """The LazyTable is a subclass of sg.Table for improved performance by loading rows
-    lazily during scroll events. Updating a sg.Table is generally fast, but with large
-    DataSets that contain thousands of rows, there may be some noticeable lag. LazyTable
-    overcomes this by only inserting a slice of rows during an `update()`.
-
-    To use, simply replace `sg.Table` with `LazyTable` as the 'element' argument in a
-    `selector()` function call in your layout.
-
-    Expects values in the form of [TableRow(pk, values)], and only becomes active after
-    a update(values=, selected_rows=[int]) call.
+def _unmoved_items(current: list, desired: list) -> set:
+    """Returns the largest set of items that are already in `desired` order in
+    `current`. Only the other items need to be moved to turn one into the other.
+
+    Args:
+        current: The items as they are ordered now.
+        desired: The items as they should be ordered.
+
+    Returns:
+        The items of the longest increasing subsequence.
+    """
+    position = {item: i for i, item in enumerate(current)}
+    sequence = [item for item in desired if item in position]
+    tails = []  # index into sequence of the smallest tail of each run length
+    tail_positions = []
+    previous = [None] * len(sequence)
+    for i, item in enumerate(sequence):
+        k = bisect.bisect_left(tail_positions, position[item])
+        previous[i] = tails[k - 1] if k else None
+        if k == len(tails):
+            tails.append(i)
+            tail_positions.append(position[item])
+        else:
+            tails[k] = i
+            tail_positions[k] = position[item]
+    unmoved = set()
+    i = tails[-1] if tails else None
+    while i is not None:
+        unmoved.add(sequence[i])
+        i = previous[i]
+    return unmoved
+
+
+class LazyTable(sg.Table):
+    """The LazyTable is a subclass of sg.Table for improved performance with large
+    DataSets. Updating a sg.Table is generally fast, but with DataSets that contain
+    thousands of rows there may be some noticeable lag, since every row becomes an item
+    in the underlying ttk.Treeview. LazyTable instead keeps a small, fixed pool of
+    Treeview items - just enough to fill the visible area - and rebinds them to the rows
+    in view as the table is scrolled. The cost of an `update()` or a scroll depends on
+    the height of the table, not on the number of rows.
+
+    To use, simply replace `sg.Table` with `LazyTable` as the 'element' argument in a
+    `selector()` function call in your layout.
+
+    Expects values in the form of [TableRow(pk, values)], and only becomes active after
+    a update(values=, selected_rows=[int]) call. The selection is tracked by primary
+    key, so it is kept while the selected row is scrolled out of view.
 
 
     Note:
         LazyTable does not support the `sg.Table.row_colors` argument.
     """
 
-    def __init__(self, *args, lazy_loading: bool = False, **kwargs) -> None:
+    wheel_rows: int = 3
+    """Number of rows to scroll per mouse wheel notch."""
+
+    row_tags: Tuple[str, str] = ("ss_alternate", "ss_row")
+    """Tags shared by the rows with and without `AlternatingRowColor`."""
+
+    marker_tag: str = "ss_unsaved"
+    """Tag of the rows marked as unsaved, e.g. `widget.tag_configure(marker_tag,
+    font=...)` to style them."""
+
+    _is_closed_kwargs: dict = None
+
+    def __init__(self, *args, lazy_loading: bool = None, **kwargs) -> None:
         """Initilize LazyTable.
 
         Args:
             *args: `sg.Table` specific args
-            lazy_loading: True to enable lazy loading
+            lazy_loading: Deprecated and ignored. LazyTable always loads only the rows
+                in view.
             **kwargs: Additional `sg.Table` specific kwargs.
 
 
         Returns:
             None
         """
+        if lazy_loading is not None:
+            warnings.warn(
+                "The lazy_loading argument of LazyTable is deprecated and has no "
+                "effect, LazyTable always loads only the rows in view",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         # remove LazyTable only
         self.headings_justification = kwargs.pop("headings_justification", None)
         cols_justification = kwargs.pop("cols_justification", None)
@@ -5669,16 +6436,20 @@ class LazyTable(sg.Table):
         # set cols_justification after, since PySimpleGUI sets it in its init
         self.cols_justification = cols_justification
 
-        self.data = []  # lazy slice of rows
-        self.lazy_loading: bool = True
-        self.lazy_insert_qty: int = 100
-
-        self._start_index = 0
-        self._end_index = 0
-        self._start_alt_color = False
-        self._end_alt_color = False
+        self.values = []  # PD011
+        self.data = []  # rows currently bound to the pool
+        self.current_index = 0
+
+        self._pool = []  # iids of the Treeview items, in display order
+        self._shown = 0  # number of pool items attached to the Treeview
+        self._bound = {}  # iid: (row, tags) of each attached pool item
+        self._pk_index = None  # pk: index in self.values, built by patch_row()
+        self._iids = itertools.count()
+        self._top = 0  # index of the row bound to the first pool item
+        self._page = self.NumRows  # number of fully visible rows
+        self._selected_index = None
+        self._selected_pk = None
         self._finalized = False
-        self._lock = threading.Lock()
         self._bg = None
         self._fg = None
 
@@ -5688,36 +6459,19 @@ class LazyTable(sg.Table):
             return
         super().__setattr__(name, value)
 
-    @property
-    def insert_qty(self):
-        """Number of rows to insert during an `update(values=)` and scroll events."""
-        if self.lazy_loading:
-            return max(self.NumRows, self.lazy_insert_qty)
-        return len(self.Values)
-
     @property
     def SelectedRows(self):  # noqa N802
-        """Returns the selected row(s) in the LazyTable.
+        """Returns the selected row in the LazyTable.
 
         Returns:
-            - If the LazyTable has data:
-                - Retrieves the index of the selected row by matching the primary key
-                  (pk) value with the first selected item in the widget.
-                - Returns the corresponding row from the data list based on the index.
-            - If the LazyTable has no data:
-                - Returns None.
-
-        :note:
-            This property assumes that the LazyTable is using a primary key (pk) value
-            to uniquely identify rows in the data list.
-        """
-        if self.data and self.widget.selection():
-            index = [
-                [v.pk for v in self.data].index(
-                    next(int(x) for x in self.widget.selection())
-                )
-            ][0]
-            return self.data[index]
+            The `TableRow` with the selected primary key, or None if no row is
+            selected.
+        """
+        index = self._selected_index
+        if index is not None and index < len(self.values):
+            row = self.values[index]  # PD011
+            if row.pk == self._selected_pk:
+                return row
         return None
 
     def update(
@@ -5730,33 +6484,20 @@ class LazyTable(sg.Table):
     ) -> None:
         # check if we shouldn't be doing this update
         # PySimpleGUI version support (PyPi version doesn't support quick_check)
-        kwargs = {}
-        is_closed_sig = inspect.signature(self.ParentForm.is_closed)
-        if "quick_check" in is_closed_sig.parameters:
-            kwargs = {"quick_check": True}
+        if LazyTable._is_closed_kwargs is None:
+            is_closed_sig = inspect.signature(sg.Window.is_closed)
+            quick_check = "quick_check" in is_closed_sig.parameters
+            LazyTable._is_closed_kwargs = {"quick_check": True} if quick_check else {}
 
         if not self._widget_was_created() or (
-            self.ParentForm is not None and self.ParentForm.is_closed(**kwargs)
+            self.ParentForm is not None
+            and self.ParentForm.is_closed(**LazyTable._is_closed_kwargs)
         ):
             return
 
-        # update total list
-        self.values = values  # PD011
-        # Update current_index with the selected index
-        self.current_index = select_rows[0] if select_rows else 0
-
         # needed, since PySimpleGUI doesn't create tk widgets during class init
         if not self._finalized:
-            self.widget.configure(yscrollcommand=self._handle_scroll)
-            self._handle_extra_kwargs()
-            self._finalized = True
-
-        # delete all current
-        children = self.widget.get_children()
-        for i in children:
-            self.widget.detach(i)
-            self.widget.delete(i)
-        self.tree_ids = []
+            self._finalize()
 
         # background color
         self._bg = (
@@ -5776,26 +6517,26 @@ class LazyTable(sg.Table):
         # alternating color
         if alternating_row_color is not None:
             self.AlternatingRowColor = alternating_row_color
-            self._start_alt_color = True
-
-        # get values to insert
-        if select_rows is not None:
-            # Slice the list to show visible rows before and after the current index
-            self._start_index = max(0, self.current_index - self.insert_qty)
-            self._end_index = min(len(values), self.current_index + self.insert_qty + 1)
-            self.data = values[self._start_index : self._end_index]
-        else:
-            self.data = values
 
-        # insert values
+        self._set_colors()
+
+        # update total list
         if values is not None:
-            # insert the rows
-            for row in self.data:
-                iid = self.widget.insert(
-                    "", "end", text=row, iid=row.pk, values=row, tag=row.pk
-                )
-                self._end_alt_color = self._set_colors(iid, self._end_alt_color)
-                self.tree_ids.append(iid)
+            self.values = values  # PD011
+            self._pk_index = None
+
+        # like sg.Table, new values without select_rows clear the selection
+        if values is not None or select_rows is not None:
+            index = select_rows[0] if select_rows else None
+            if index is not None and index < len(self.values):
+                self._selected_index = index
+                self._selected_pk = self.values[index].pk  # PD011
+                self.current_index = index
+                self._show_index(index)
+            else:
+                self._selected_index = None
+                self._selected_pk = None
+                self.current_index = 0
 
         # handle visible
         if visible is not None:
@@ -5805,98 +6546,236 @@ class LazyTable(sg.Table):
             else:
                 self._pack_forget_save_settings(self.element_frame)
 
-        # handle number of rows
+        # handle number of rows. The pool is resized once the Treeview is configured
         if num_rows is not None:
             self.widget.config(height=num_rows)
 
-        # finally, select rows and make first visible
-        if select_rows is not None:
-            # Offset select_rows index for the sliced values
-            offset_select_rows = [i - self._start_index for i in select_rows]
-            if offset_select_rows and offset_select_rows[0] < len(self.data):
-                # select the row
-                self.widget.selection_set(self.tree_ids[offset_select_rows[0]])
-                # Get the row iid based on the offset_select_rows index
-                row_iid = self.tree_ids[offset_select_rows[0]]
-                # and make sure its visible
-                self.widget.see(row_iid)
-
-    def _handle_scroll(self, x0, x1) -> None:
-        if float(x0) == 0.0 and self._start_index > 0:
-            with self._lock:
-                self._handle_start_scroll()
-            return
-        if float(x1) == 1.0 and self._end_index < len(self.values):
-            with self._lock:
-                self._handle_end_scroll()
-            return
-        # else, set the scroll
-        self.vsb.set(x0, x1)
-
-    def _handle_start_scroll(self) -> None:
-        # determine slice
-        num_rows = min(self._start_index, self.insert_qty)
-        new_start_index = max(0, self._start_index - num_rows)
-        new_rows = self.values[new_start_index : self._start_index]  # PD011
-
-        # insert
-        for row in reversed(new_rows):
-            iid = self.widget.insert(
-                "", "0", text=row, iid=row.pk, values=row, tag=row.pk
-            )
-            self._start_alt_color = self._set_colors(iid, self._start_alt_color)
-            self.tree_ids.insert(0, iid)
-
-        # set new start
-        self._start_index = new_start_index
-
-        # Insert new_rows to beginning
-        # don't use data.insert(0, new_rows), it breaks TableRow
-        self.data[:0] = new_rows
-
-        # to avoid an infinite scroll, move scroll a little after 0.0
-        with contextlib.suppress(IndexError):
-            row_iid = self.tree_ids[self.insert_qty + self.NumRows - 1]
-            self.widget.see(row_iid)
-
-    def _handle_end_scroll(self) -> None:
-        num_rows = len(self.values)
-        # determine slice
-        start_index = max(0, self._end_index)
-        end_index = min(self._end_index + self.insert_qty, num_rows)
-        new_rows = self.values[start_index:end_index]  # PD011
-
-        # insert
-        for row in new_rows:
-            iid = self.widget.insert(
-                "", "end", text=row, iid=row.pk, values=row, tag=row.pk
-            )
-            self._end_alt_color = self._set_colors(iid, self._end_alt_color)
-            self.tree_ids.append(iid)
+        self._render()
 
-        # set new end
-        self._end_index = end_index
+    def patch_row(self, row: TableRow) -> bool:
+        """Replace the row with the same pk, without updating the other rows.
 
-        # Extend self.data with new_rows
-        self.data.extend(new_rows)
+        Args:
+            row: The new `TableRow`.
 
-        # to avoid an infinite scroll, move scroll a little before 1.0
-        with contextlib.suppress(IndexError):
-            row_iid = self.tree_ids[len(self.data) - self.insert_qty]
-            self.widget.see(row_iid)
+        Returns:
+            False if there is no row with this pk.
+        """
+        if self._pk_index is None:
+            self._pk_index = {r.pk: i for i, r in enumerate(self.values)}
+        index = self._pk_index.get(row.pk)
+        if index is None:
+            return False
+        self.values[index] = row  # PD011
+        if self._top <= index < self._top + len(self._pool):
+            self._render()
+        return True
 
-    def _set_colors(self, iid, toggle_color):
-        if self.AlternatingRowColor is not None:
-            if not toggle_color:
-                self.widget.tag_configure(
-                    iid, background=self.AlternatingRowColor, foreground=self._fg
-                )
-            else:
-                self.widget.tag_configure(iid, background=self._bg, foreground=self._fg)
-            toggle_color = not toggle_color
+    def _finalize(self) -> None:
+        # take over scrolling: the Treeview never holds more rows than fit in view,
+        # so the scrollbar has to reflect our position in self.values instead
+        self.widget.configure(yscrollcommand=self._sync_scrollbar)
+        vsb = getattr(self, "vsb", None)
+        if vsb is not None:
+            vsb.configure(command=self._yview)
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                vsb.bind(sequence, self._on_mousewheel)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.widget.bind(sequence, self._on_mousewheel)
+        for sequence in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.widget.bind(sequence, self._on_key)
+        self.widget.bind("<Configure>", self._on_configure, "+")
+
+        # remove anything PySimpleGUI may have inserted, then create the pool
+        for iid in self.widget.get_children():
+            self.widget.delete(iid)
+        self.tree_ids = []
+        self._resize_pool(self._page)
+
+        self._handle_extra_kwargs()
+        self._finalized = True
+
+    def _resize_pool(self, size: int) -> None:
+        while len(self._pool) < size:
+            iid = self.widget.insert("", "end", iid=str(next(self._iids)))
+            # new items are attached by _render()
+            self.widget.detach(iid)
+            self._pool.append(iid)
+        while len(self._pool) > size:
+            iid = self._pool.pop()
+            self._bound.pop(iid, None)
+            self.widget.delete(iid)
+        self._shown = min(self._shown, size)
+
+    def _render(self) -> None:
+        """Bind the pool items to the rows in view, starting at `_top`.
+
+        This is a diff against what is displayed: a pool item that already shows a pk
+        in view keeps it and is moved if the order changed, and `item()` is only
+        called for rows whose values changed. Scrolling by one row therefore rewrites
+        one item, and a refresh after a single-cell edit rewrites just that row.
+        """
+        self._top = max(0, min(self._top, len(self.values) - self._page))
+        self.data = self.values[self._top : self._top + len(self._pool)]  # PD011
+
+        in_view = {row.pk for row in self.data}
+        by_pk = {
+            bound[0].pk: iid
+            for iid, bound in self._bound.items()
+            if bound[0].pk in in_view
+        }
+        reused = set(by_pk.values())
+        free = [iid for iid in self._pool if iid not in reused]
+
+        order = []
+        selected = None
+        for position, row in enumerate(self.data):
+            iid = by_pk.pop(row.pk, None) or free.pop(0)
+            tags = (self.row_tags[(self._top + position) % 2],)
+            if len(row) and row[0] == themepack.marker_unsaved:
+                tags += (self.marker_tag,)
+            bound = self._bound.get(iid)
+            if bound is None or bound[0] != row:
+                self.widget.item(iid, text=row, values=row, tags=tags)
+            elif bound[1] != tags:
+                self.widget.item(iid, tags=tags)
+            self._bound[iid] = (row, tags)
+            order.append(iid)
+            if row.pk == self._selected_pk:
+                selected = iid
+
+        # detach what is left over, then move the rest into display order
+        children = self._pool[: self._shown]
+        for iid in free:
+            if iid in self._bound:
+                del self._bound[iid]
+                self.widget.detach(iid)
+                children.remove(iid)
+        unmoved = _unmoved_items(children, order)
+        for position, iid in enumerate(order):
+            if iid in unmoved:
+                continue
+            if iid in children:
+                children.remove(iid)
+            index = children.index(order[position - 1]) + 1 if position else 0
+            self.widget.move(iid, "", index)
+            children.insert(index, iid)
+        self._pool = order + free
+        self._shown = len(order)
+
+        # the selection follows the pk, not the pool item
+        selection = self.widget.selection()
+        if selected is not None:
+            if selection != (selected,):
+                self.widget.selection_set(selected)
+        elif selection:
+            self.widget.selection_remove(selection)
+
+        # keep the pool pinned to the top of the Treeview
+        self.widget.yview_moveto(0)
+        self._sync_scrollbar()
+
+    def _show_index(self, index: int) -> None:
+        # scroll as little as possible to bring index into view
+        if index < self._top:
+            self._top = index
+        elif index >= self._top + self._page:
+            self._top = index - self._page + 1
+
+    def _scroll_to(self, top: int) -> None:
+        top = max(0, min(top, len(self.values) - self._page))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _sync_scrollbar(self, *args) -> None:
+        # also the Treeview yscrollcommand, whose fractions only describe the pool
+        vsb = getattr(self, "vsb", None)
+        if vsb is None:
+            return
+        total = len(self.values)
+        if total <= self._page:
+            vsb.set(0.0, 1.0)
+        else:
+            vsb.set(self._top / total, (self._top + self._page) / total)
+
+    def _yview(self, *args) -> None:
+        # scrollbar command: "moveto fraction" or "scroll number units|pages"
+        if args and args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * len(self.values)))
+        elif args and args[0] == "scroll":
+            step = self._page if args[2].startswith("page") else 1
+            self._scroll_to(self._top + int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        if event.num in (4, 5):
+            notches = -1 if event.num == 4 else 1
+        elif event.delta:
+            # Windows reports multiples of 120, macOS reports small deltas
+            notches = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
         else:
-            self.widget.tag_configure(iid, background=self._bg, foreground=self._fg)
-        return toggle_color
+            return "break"
+        self._scroll_to(self._top + notches * self.wheel_rows)
+        return "break"
+
+    def _on_key(self, event):
+        if not self.values:
+            return "break"
+        index = self._selected_index
+        if index is None or self._selected_pk is None:
+            index = self._top
+        else:
+            index += {
+                "Up": -1,
+                "Down": 1,
+                "Prior": -self._page,
+                "Next": self._page,
+                "Home": -len(self.values),
+                "End": len(self.values),
+            }.get(event.keysym, 0)
+        index = max(0, min(index, len(self.values) - 1))
+        self._show_index(index)
+        self._render()
+        # selecting the pool item fires <<TreeviewSelect>>, just like a click
+        iid = self._pool[index - self._top]
+        self.widget.focus(iid)
+        self.widget.selection_set(iid)
+        return "break"
+
+    def _on_configure(self, event) -> None:
+        # size the pool to the rows that fit, e.g. after the window is resized
+        bbox = self.widget.bbox(self._pool[0]) if self._shown else ""
+        if not bbox:
+            return
+        _, y, _, row_height = bbox
+        fit = max(1.0, (self.widget.winfo_height() - y) / row_height)
+        page, size = int(fit), math.ceil(fit)
+        if page != self._page or size != len(self._pool):
+            self._page = page
+            self._resize_pool(size)
+            self._render()
+
+    def _treeview_selected(self, event) -> None:
+        # Ignore selection changes caused by rebinding the pool
+        selection = self.widget.selection()
+        if not selection or selection[0] not in self._pool[: self._shown]:
+            return
+        index = self._top + self._pool.index(selection[0])
+        pk = self.values[index].pk  # PD011
+        if pk == self._selected_pk:
+            return
+        self._selected_index = index
+        self._selected_pk = pk
+        self.current_index = index
+        super()._treeview_selected(event)
+
+    def _set_colors(self) -> None:
+        alternate, row = self.row_tags
+        background = self._bg
+        if self.AlternatingRowColor is not None:
+            background = self.AlternatingRowColor
+        self.widget.tag_configure(alternate, background=background, foreground=self._fg)
+        self.widget.tag_configure(row, background=self._bg, foreground=self._fg)
 
     def _handle_extra_kwargs(self) -> None:
         if self.headings_justification:
@@ -5913,6 +6792,208 @@ class LazyTable(sg.Table):
             self.table_frame.pack(**self.frame_pack_kwargs)
 
 
+class LazyListbox(sg.Listbox):
+    """The LazyListbox is a subclass of sg.Listbox for selectors with many rows. Like
+    `LazyTable`, it only puts the rows that fit in the visible area into the underlying
+    tk.Listbox, and swaps them as the list is scrolled, so an `update()` costs the same
+    whatever the number of rows.
+
+    To use, simply replace `sg.Listbox` with `LazyListbox` as the 'element' argument in
+    a `selector()` function call in your layout.
+
+    Note:
+        LazyListbox only supports selecting a single row, as used by selectors.
+    """
+
+    wheel_rows: int = 3
+    """Number of rows to scroll per mouse wheel notch."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initilize LazyListbox.
+
+        Args:
+            *args: `sg.Listbox` specific args
+            **kwargs: Additional `sg.Listbox` specific kwargs.
+
+        Returns:
+            None
+        """
+        self.values = []
+        self._top = 0  # index of the row in the first line of the tk.Listbox
+        self._lines = 0  # number of lines that fit in the tk.Listbox
+        self._shown = []  # strings currently in the tk.Listbox
+        self._selected_index = None
+        self._finalized = False
+        super().__init__(*args, **kwargs)
+        self._lines = self.Size[1] if self.Size and self.Size[1] else 10
+
+    @property
+    def Values(self):  # noqa N802
+        """The rows in the tk.Listbox. PySimpleGUI looks up the selection by index in
+        this list, so it only holds the rows in view. See `values` for all rows.
+        """
+        return self.values[self._top : self._top + self._lines]  # PD011
+
+    @Values.setter
+    def Values(self, values) -> None:  # noqa N802
+        self.values = list(values)
+
+    def get_indexes(self) -> tuple:
+        """Returns the index of the selected row in `values`.
+
+        Returns:
+            A tuple of the selected index, or an empty tuple.
+        """
+        return () if self._selected_index is None else (self._selected_index,)
+
+    def set_vscroll_position(self, percent_from_top: float) -> None:
+        """Scroll so that `percent_from_top` of the rows are above the view.
+
+        Args:
+            percent_from_top: From 0 to 1.0, the fraction of rows above the view.
+
+        Returns:
+            None
+        """
+        if self._finalized:
+            self._scroll_to(round(percent_from_top * len(self.values)))
+
+    def update(
+        self,
+        values=None,
+        disabled=None,
+        set_to_index=None,
+        scroll_to_index=None,
+        select_mode=None,
+        visible=None,
+    ) -> None:
+        if not self._widget_was_created():
+            return
+
+        # needed, since PySimpleGUI doesn't create tk widgets during class init
+        if not self._finalized:
+            self._finalize()
+
+        if values is not None:
+            self.values = list(values)
+            self._selected_index = None
+
+        if set_to_index is not None:
+            if isinstance(set_to_index, (list, tuple)):
+                set_to_index = set_to_index[0] if set_to_index else None
+            self._selected_index = None
+            if set_to_index is not None and set_to_index < len(self.values):
+                self._selected_index = set_to_index
+                # scroll as little as possible to bring the row into view
+                if set_to_index < self._top:
+                    self._top = set_to_index
+                elif set_to_index >= self._top + self._lines:
+                    self._top = set_to_index - self._lines + 1
+
+        if scroll_to_index is not None:
+            self._top = scroll_to_index
+
+        super().update(disabled=disabled, select_mode=select_mode, visible=visible)
+        self._render()
+
+    def _finalize(self) -> None:
+        self._lines = int(self.TKListbox.cget("height")) or self._lines
+        # the tk.Listbox never holds more rows than fit in view, so the scrollbar has
+        # to reflect our position in self.values instead
+        self.TKListbox.configure(yscrollcommand=self._sync_scrollbar)
+        vsb = getattr(self, "vsb", None)
+        if vsb is not None:
+            vsb.configure(command=self._yview)
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                vsb.bind(sequence, self._on_mousewheel)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.TKListbox.bind(sequence, self._on_mousewheel)
+        for sequence in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.TKListbox.bind(sequence, self._on_key)
+        self.TKListbox.bind("<<ListboxSelect>>", self._listbox_selected, "+")
+        self._finalized = True
+
+    def _render(self) -> None:
+        self._top = max(0, min(self._top, len(self.values) - self._lines))
+        lines = [str(row) for row in self.Values]
+        if lines != self._shown:
+            self.TKListbox.delete(0, tk.END)
+            if lines:
+                self.TKListbox.insert(tk.END, *lines)
+            self._shown = lines
+
+        self.TKListbox.selection_clear(0, tk.END)
+        index = self._selected_index
+        if index is not None and self._top <= index < self._top + self._lines:
+            self.TKListbox.selection_set(index - self._top)
+            self.TKListbox.activate(index - self._top)
+
+        # keep the rows pinned to the top of the tk.Listbox
+        self.TKListbox.yview_moveto(0)
+        self._sync_scrollbar()
+
+    def _scroll_to(self, top: int) -> None:
+        top = max(0, min(top, len(self.values) - self._lines))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _sync_scrollbar(self, *args) -> None:
+        # also the tk.Listbox yscrollcommand, whose fractions only describe the view
+        vsb = getattr(self, "vsb", None)
+        if vsb is None:
+            return
+        total = len(self.values)
+        if total <= self._lines:
+            vsb.set(0.0, 1.0)
+        else:
+            vsb.set(self._top / total, (self._top + self._lines) / total)
+
+    def _yview(self, *args) -> None:
+        # scrollbar command: "moveto fraction" or "scroll number units|pages"
+        if args and args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * len(self.values)))
+        elif args and args[0] == "scroll":
+            step = self._lines if args[2].startswith("page") else 1
+            self._scroll_to(self._top + int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        if event.num in (4, 5):
+            notches = -1 if event.num == 4 else 1
+        elif event.delta:
+            # Windows reports multiples of 120, macOS reports small deltas
+            notches = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        else:
+            return "break"
+        self._scroll_to(self._top + notches * self.wheel_rows)
+        return "break"
+
+    def _on_key(self, event):
+        if not self.values:
+            return "break"
+        index = self._selected_index
+        if index is None:
+            index = self._top
+        else:
+            index += {
+                "Up": -1,
+                "Down": 1,
+                "Prior": -self._lines,
+                "Next": self._lines,
+                "Home": -len(self.values),
+                "End": len(self.values),
+            }.get(event.keysym, 0)
+        self.update(set_to_index=max(0, min(index, len(self.values) - 1)))
+        # report it like a click
+        self.TKListbox.event_generate("<<ListboxSelect>>")
+        return "break"
+
+    def _listbox_selected(self, event) -> None:
+        selection = self.TKListbox.curselection()
+        if selection:
+            self._selected_index = self._top + int(selection[0])
+
+
 class _StrictInput:
     def strict_validate(self, value, action) -> bool:
         if hasattr(self, "active_placeholder"):
@@ -6210,16 +7291,65 @@ class _SearchInput(_EnhancedInput):
             self.insert_placeholder()
 
 
+class _CompletionIndex:
+    """Internal class used to look up autocompletion hits in O(log n).
+
+    The casefolded values are sorted once, so the values that start with a prefix are
+    a range found with `bisect`. The closest match - the shortest value, and the first
+    one of those - is the minimum of that range in a sparse table, built with numpy.
+    """
+
+    def __init__(self, values: List[str]) -> None:
+        self.values = values
+        keys = [value.casefold() for value in values]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = [keys[i] for i in order]
+        self.order = np.array(order, dtype=np.int64)
+
+        # level k holds the minimum of each range of 2**k (length, index) pairs,
+        # packed into one integer
+        lengths = np.array([len(values[i]) for i in order], dtype=np.int64)
+        level = lengths * max(len(values), 1) + self.order
+        self.table = [level]
+        width = 1
+        while 2 * width <= len(values):
+            level = np.minimum(level[:-width], level[width:])
+            self.table.append(level)
+            width *= 2
+
+    def find(self, prefix: str) -> Tuple[np.ndarray, Optional[str]]:
+        """Find the values that start with a casefolded prefix.
+
+        Args:
+            prefix: The casefolded prefix.
+
+        Returns:
+            A tuple of the indexes of the hits in `values`, and the closest match.
+        """
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + "\U0010ffff", lo)
+        if lo == hi:
+            return self.order[lo:hi], None
+        k = (hi - lo).bit_length() - 1
+        closest = min(self.table[k][lo], self.table[k][hi - (1 << k)])
+        return self.order[lo:hi], self.values[closest % len(self.values)]
+
+
 class _AutoCompleteLogic:
     _completion_list: List[Union[str, ElementRow]] = field_(default_factory=list)
+    _completion_index: _CompletionIndex = None
     _hits: List[int] = field_(default_factory=list)
     _hit_index: int = 0
     position: int = 0
     finalized: bool = False
 
-    def _autocomplete_combo(self, completion_list, delta: int = 0):
-        widget = self.Widget
+    def _set_completion_list(self, values) -> None:
+        self._completion_list = [str(row) for row in values]
+        self._completion_index = _CompletionIndex(self._completion_list)
+
+    def _autocomplete_combo(self, completion_index: _CompletionIndex, delta: int = 0):
         """Perform autocompletion on a Combobox widget based on the current input."""
+        widget = self.Widget
         if delta:
             # Delete text from current position to end
             widget.delete(widget.position, tk.END)
@@ -6227,15 +7357,12 @@ class _AutoCompleteLogic:
             # Set the position to the length of the current input text
             widget.position = len(widget.get())
 
-        prefix = widget.get().lower()
-        hits = [
-            element for element in completion_list if element.lower().startswith(prefix)
-        ]
-        # Create a list of elements that start with the lowercase prefix
+        prefix = widget.get().casefold()
+        # Indexes of the elements that start with the casefolded prefix
+        hits, closest_match = completion_index.find(prefix)
 
-        if hits:
-            closest_match = min(hits, key=len)
-            if prefix != closest_match.lower():
+        if len(hits):
+            if prefix != closest_match.casefold():
                 # Insert the closest match at the beginning, move the cursor to the end
                 widget.delete(0, tk.END)
                 widget.insert(0, closest_match)
@@ -6244,8 +7371,8 @@ class _AutoCompleteLogic:
                 # Highlight the remaining text after the closest match
                 widget.select_range(widget.position, tk.END)
 
-            if len(hits) == 1 and closest_match.lower() != prefix:
-                # If there is only one hit and it's not equal to the lowercase prefix,
+            if len(hits) == 1 and closest_match.casefold() != prefix:
+                # If there is only one hit and it's not equal to the casefolded prefix,
                 # open dropdown
                 widget.event_generate("<Down>")
                 widget.event_generate("<<ComboboxSelected>>")
@@ -6258,7 +7385,9 @@ class _AutoCompleteLogic:
 
     def autocomplete(self, delta: int = 0) -> None:
         """Perform autocompletion based on the current input."""
-        self._hits = self._autocomplete_combo(self._completion_list, delta)
+        if self._completion_index is None:
+            return
+        self._hits = self._autocomplete_combo(self._completion_index, delta)
         self._hit_index = 0
 
     def handle_keyrelease(self, event) -> None:
@@ -6293,7 +7422,7 @@ class _AutocompleteCombo(_AutoCompleteLogic, sg.Combo):
     def update(self, *args, **kwargs) -> None:
         """Update the Combo widget with new values."""
         if "values" in kwargs and kwargs["values"] is not None:
-            self._completion_list = [str(row) for row in kwargs["values"]]
+            self._set_completion_list(kwargs["values"])
             if not self.finalized:
                 self.Widget.bind("<KeyRelease>", self.handle_keyrelease, "+")
             self._hits = []
@@ -6307,7 +7436,7 @@ class _TtkCombo(_AutoCompleteLogic, ttk.Combobox):
 
     def __init__(self, *args, **kwargs) -> None:
         """Initialize the Combo widget."""
-        self._completion_list = [str(row) for row in kwargs["values"]]
+        self._set_completion_list(kwargs["values"])
         self.Widget = self
         super().__init__(*args, **kwargs)
 
@@ -7134,6 +8263,7 @@ def selector(
         Type[sg.Combo],
         Type[LazyTable],
         Type[sg.Listbox],
+        Type[LazyListbox],
         Type[sg.Slider],
         Type[sg.Table],
         TableBuilder,
@@ -7175,7 +8305,7 @@ def selector(
         "Form": None,
         "filter": filter,
     }
-    if element == sg.Listbox:
+    if element in [sg.Listbox, LazyListbox]:
         layout = element(
             values=(),
             size=size or themepack.default_element_size,
@@ -7228,19 +8358,12 @@ def selector(
     elif isinstance(element, TableBuilder):
         table_builder = element
         element = table_builder.element
-        lazy = table_builder.lazy_loading
         kwargs = table_builder.get_table_kwargs()
 
         meta["TableBuilder"] = table_builder
         # Make an empty list of values
         vals = [[""] * len(kwargs["headings"])]
-        layout = element(
-            vals,
-            lazy_loading=lazy,
-            key=key,
-            metadata=meta,
-            **kwargs,
-        )
+        layout = element(vals, key=key, metadata=meta, **kwargs)
     else:
         raise RuntimeError(f'Element type "{element}" not supported as a selector.')
 
@@ -7314,7 +8437,8 @@ class TableBuilder(list):
         allow_cell_edits: Double-click to edit a cell value if True. Accepted edits
             update both `sg.Table` and associated `field` element. Note: primary key,
             generated, or `readonly` columns don't allow cell edits.
-        lazy_loading: For larger DataSets (see `LazyTable`).
+        lazy_loading: Deprecated and ignored. Tables are always a `LazyTable`, which
+            only loads the rows in view.
         add_save_heading_button: Adds a save button to the left-most heading column if
             True.
         apply_search_filter: Filter rows to only those columns in `DataSet.search_order`
@@ -7336,8 +8460,9 @@ class TableBuilder(list):
     """Double-click to edit a cell value if True. Accepted edits update both `sg.Table`
     and associated `field` element. Note: primary key, generated, or `readonly` columns
     don't allow cell edits."""
-    lazy_loading: bool = False
-    """For larger DataSets (see `LazyTable`)."""
+    lazy_loading: bool = None
+    """Deprecated and ignored. Tables are always a `LazyTable`, which only loads the
+    rows in view."""
     add_save_heading_button: bool = False
     """Adds a save button to the left-most heading column if True."""
     apply_search_filter: bool = False
@@ -7346,6 +8471,13 @@ class TableBuilder(list):
     style: TableStyler = field_(default_factory=TableStyler)
 
     def __post_init__(self) -> None:
+        if self.lazy_loading is not None:
+            warnings.warn(
+                "TableBuilder.lazy_loading is deprecated and has no effect, tables "
+                "always load only the rows in view",
+                DeprecationWarning,
+                stacklevel=3,
+            )
         # Store this instance in the master list of instances
         TableBuilder.instances.append(self)
 
@@ -7646,6 +8778,8 @@ class _CellEdit:
         # only allow 1 edit at a time
         if self.active_edit or self.frm._edit_protect:
             return
+        # the Treeview has to show the current rows
+        self.frm.flush()
 
         # get row and column
         row = int(treeview.identify_row(event.y))
@@ -7870,9 +9004,6 @@ class _CellEdit:
         # get current entry text
         new_value = field_var.get()
 
-        # get current table row
-        values = list(table_element.item(row, "values"))
-
         # if combo, set the value to the parent pk
         if widget_type == TK_COMBOBOX:
             new_value = combobox_values[self.field.current()].get_pk()
@@ -7900,34 +9031,8 @@ class _CellEdit:
             dataset.current.set_value(column, cast_new_value, write_event=True)
             # Update matching field
             self.frm.update_fields(data_key, columns=[column])
-            # TODO: make sure we actually want to set new_value to cast
-            new_value = cast_new_value
-
-        # now we can update the GUI table
-        # -------------------------------
-
-        # if combo, set new_value to actual text (not pk)
-        if widget_type == TK_COMBOBOX:
-            new_value = combobox_values[self.field.current()]
-
-        # apply cell format fn
-        if self.frm[data_key].column_info[column].cell_format_fn:
-            fn = self.frm[data_key].column_info[column].cell_format_fn
-            new_value = fn(new_value)
-
-        # update value row with new text
-        values[col_idx] = new_value
-
-        # set marker
-        values[0] = (
-            themepack.marker_unsaved
-            if dataset.current.has_backup
-            and not dataset.current.get().equals(dataset.current.get_original())
-            else " "
-        )
-
-        # push changes to table element row
-        table_element.item(row, values=values)
+            # now we can update the GUI table, and any other selector showing the row
+            self.frm.update_selector_row(data_key, column=column)
 
         self.destroy()
 
@@ -8033,44 +9138,46 @@ class _LiveUpdate:
             )
 
     def sync(self, widget, widget_type) -> None:
-        for e in self.frm.element_map:
-            if e["element"].widget == widget:
-                data_key = e["table"]
-                column = e["column"]
-                element = e["element"]
-                if widget_type == TK_COMBOBOX and isinstance(element.get(), ElementRow):
-                    new_value = element.get().get_pk_ignore_placeholder()
-                else:
-                    new_value = element.get()
+        e = self.frm._elements_by_widget.get(widget)
+        if e is None:
+            return
+        self.frm.flush()
+        data_key = e["table"]
+        column = e["column"]
+        element = e["element"]
+        if widget_type == TK_COMBOBOX and isinstance(element.get(), ElementRow):
+            new_value = element.get().get_pk_ignore_placeholder()
+        else:
+            new_value = element.get()
 
-                dataset = self.frm[data_key]
+        dataset = self.frm[data_key]
 
-                # validate the field
-                if dataset.validate_mode == ValidateMode.RELAXED or (
-                    not isinstance(e["element"], _EnhancedInput)
-                    and dataset.validate_mode == ValidateMode.STRICT
-                ):
-                    widget = (
-                        e["element"].Widget
-                        if themepack.validate_exception_animation is not None
-                        else None
-                    )
-                    valid = dataset.validate_field(column, new_value, widget)
-                    if not valid:
-                        return
-
-                # see if there was a change
-                old_value = dataset.current.get()[column]
-                new_value = dataset.value_changed(
-                    column, old_value, new_value, bool(widget_type == TK_CHECKBUTTON)
-                )
-                if new_value is not Boolean.FALSE:
-                    # push row to dataset and update
-                    dataset.current.set_value(column, new_value, write_event=True)
+        # validate the field
+        if dataset.validate_mode == ValidateMode.RELAXED or (
+            not isinstance(e["element"], _EnhancedInput)
+            and dataset.validate_mode == ValidateMode.STRICT
+        ):
+            widget = (
+                e["element"].Widget
+                if themepack.validate_exception_animation is not None
+                else None
+            )
+            valid = dataset.validate_field(column, new_value, widget)
+            if not valid:
+                return
+
+        # see if there was a change
+        old_value = dataset.current.get()[column]
+        new_value = dataset.value_changed(
+            column, old_value, new_value, bool(widget_type == TK_CHECKBUTTON)
+        )
+        if new_value is not Boolean.FALSE:
+            # push row to dataset and update
+            dataset.current.set_value(column, new_value, write_event=True)
 
-                    # Update tableview if uses column:
-                    if dataset.column_likely_in_selector(column):
-                        self.frm.update_selectors(dataset.key)
+            # Update tableview if uses column:
+            if dataset.column_likely_in_selector(column):
+                self.frm.update_selector_row(dataset.key, column=column)
 
     def delay(self, widget, widget_type) -> None:
         if self.last_event_time:
@@ -8893,6 +10000,31 @@ class ColumnInfo(List):
         "datetime",
     ]
 
+    # Functions that always return the same value for the same arguments. Only function
+    # defaults made up of these are evaluated once and reused for later records.
+    _deterministic_functions: ClassVar[List[str]] = [
+        "abs",
+        "cast",
+        "char",
+        "chr",
+        "coalesce",
+        "concat",
+        "hex",
+        "ifnull",
+        "length",
+        "lower",
+        "ltrim",
+        "nullif",
+        "printf",
+        "replace",
+        "round",
+        "rtrim",
+        "substr",
+        "substring",
+        "trim",
+        "upper",
+    ]
+
     def __init__(self, driver: SQLDriver, table: str) -> None:
         """Initilize a ColumnInfo instance."""
         self.driver = driver
@@ -8911,6 +10043,10 @@ class ColumnInfo(List):
             "date": lambda: dt.date.today().strftime(DATE_FORMAT),
             "datetime": lambda: dt.datetime.now().strftime(DATETIME_FORMAT),
         }
+        # Whether each default seen so far looks like a database function
+        self._function_default_cache: Dict[str, bool] = {}
+        # The values of the function defaults that return the same thing every time
+        self._function_default_values: Dict[str, Any] = {}
         super().__init__()
 
     def __contains__(self, item) -> bool:
@@ -8969,32 +10105,18 @@ class ColumnInfo(List):
             dict
         """
         d = {}
+        # First, evaluate the defaults that might be database functions, all at once
+        function_defaults = self._function_defaults()
+        rels = self.driver.relationships.get_rels_for(dataset.table)
         for c in self:
             default = c.default
             python_type = c.python_type.__name__
 
-            # First, check to see if the default might be a database function
-            if self._looks_like_function(default):
-                table = self.driver.quote_table(self.table)
-
-                q = f"SELECT {default} AS val FROM {table};"
-
-                rows = self.driver.execute(q)
-                if rows.attrs["exception"] is None:
-                    try:
-                        default = rows.iloc[0]["val"]
-                    except IndexError:
-                        try:
-                            default = rows.iloc[0]["VAL"]
-                        except IndexError:
-                            default = None
-                    if default is not None:
-                        d[c.name] = default
-                        continue
-                logger.warning(
-                    "There was an exception getting the default: "
-                    f"{rows.attrs['exception']}"
-                )
+            if c.name in function_defaults:
+                default = function_defaults[c.name]
+                if default is not None:
+                    d[c.name] = default
+                    continue
 
             # The stored default is a literal value, lets try to use it:
             if default in [None, "None"]:
@@ -9006,7 +10128,6 @@ class ColumnInfo(List):
 
                 # return PK_PLACEHOLDER if this is a fk_relationships.
                 # trick used in Combo for the pk to display placeholder
-                rels = self.driver.relationships.get_rels_for(dataset.table)
                 rel = next((r for r in rels if r.fk_column == c.name), None)
                 if rel:
                     null_default = PK_PLACEHOLDER
@@ -9103,6 +10224,70 @@ class ColumnInfo(List):
         return any(key in d and d[key] == value for d in self)
 
     # TODO: check if something looks like a statement for complex defaults?  Regex?
+    def _function_defaults(self) -> Dict[str, Any]:
+        # Evaluate the function defaults with a single table-less SELECT. Columns whose
+        # default could not be evaluated are left out. Primary keys are skipped, as new
+        # records get a temporary pk (and a nextval() would waste a sequence value).
+        # Only defaults built from deterministic functions are evaluated once, all
+        # others (CURRENT_TIMESTAMP, uuid functions, user-defined functions) every time.
+        columns = [
+            c for c in self if not c.pk and self._is_function_default(c.default)
+        ]
+        defaults = {
+            c.name: self._function_default_values[c.default]
+            for c in columns
+            if c.default in self._function_default_values
+        }
+        columns = [c for c in columns if c.name not in defaults]
+        if not columns:
+            return defaults
+        with self.driver.uncached():
+            rows = self.driver.execute(
+                self.driver.expressions_query([c.default for c in columns])
+            )
+        if rows.attrs["exception"] is None:
+            for i, c in enumerate(columns):
+                self._store_function_default(
+                    defaults, c, rows.iloc[0, i] if len(rows) else None
+                )
+            return defaults
+        logger.warning(
+            f"There was an exception getting the default: {rows.attrs['exception']}"
+        )
+        if len(columns) == 1:
+            return defaults
+        # Find the culprit by evaluating them one by one
+        for c in columns:
+            with self.driver.uncached():
+                rows = self.driver.execute(self.driver.expressions_query([c.default]))
+            if rows.attrs["exception"] is None:
+                self._store_function_default(
+                    defaults, c, rows.iloc[0, 0] if len(rows) else None
+                )
+        return defaults
+
+    def _store_function_default(
+        self, defaults: Dict[str, Any], column: Column, value: Any
+    ) -> None:
+        defaults[column.name] = value
+        if self._is_deterministic(column.default):
+            self._function_default_values[column.default] = value
+
+    def _is_deterministic(self, default: str) -> bool:
+        # Bare constants such as CURRENT_TIMESTAMP or USER call no function, and are
+        # never treated as deterministic.
+        functions = re.findall(r"(\w+)\s*\(", default)
+        return (
+            bool(functions)
+            and all(f.lower() in self._deterministic_functions for f in functions)
+            and not QueryCache.volatile(default)
+        )
+
+    def _is_function_default(self, default: str) -> bool:
+        if default not in self._function_default_cache:
+            self._function_default_cache[default] = self._looks_like_function(default)
+        return self._function_default_cache[default]
+
     def _looks_like_function(self, s: str):
         # check if the string is empty
         if s in EMPTY:
@@ -9167,93 +10352,583 @@ class ReservedKeywordError(Exception):
     pass
 
 
-@dataclass
-class SqlChar:
-    """Container for passing database-specific characters.
+class SchemaCache:
+    """Caches the schema introspection of a `SQLDriver` in a local file.
 
-    Each database type expects their SQL prepared in a certain way. Defaults in this
-    dataclass are set for how various elements in the SQL string should be quoted and
-    represented as placeholders. Override these in the derived class as needed to
-    satisfy SQL requirements
+    Introspecting every table of a large remote database can take seconds on each
+    start. When enabled with the `schema_cache` parameter of a `SQLDriver`, the tables,
+    `ColumnInfo`, primary keys and relationships are stored in a json file, keyed by
+    the connection (see `SQLDriver.schema_cache_key()`) and a cheap schema fingerprint
+    (see `SQLDriver.schema_fingerprint()`). The stored schema is reused for as long as
+    the fingerprint matches, and is rebuilt when it changes.
+
+    The methods mirror those of `SQLDriver`, and pass straight through to the driver
+    when caching is disabled, or the driver can't provide a fingerprint.
     """
 
-    placeholder: str = "%s"  # override this in derived subclass SqlChar
-    r"""The placeholder for values in the query string. This is typically '?' or'%s'"""
+    DEFAULT_PATH: ClassVar[str] = os.path.join(
+        os.path.expanduser("~"), ".pysimplesql", "schema_cache.json"
+    )
+    """Where the cache is stored when `schema_cache=True`"""
+
+    # Column attributes that are passed in by the drivers when creating a Column
+    _COLUMN_FIELDS: ClassVar[List[str]] = [
+        "name",
+        "domain",
+        "notnull",
+        "default",
+        "pk",
+        "generated",
+        "domain_args",
+    ]
 
-    # These are the quote characters for tables, columns and values.
-    # It varies between different databases
+    def __init__(self, driver: SQLDriver, path: Union[bool, str, Path] = False) -> None:
+        """Initialize a SchemaCache instance.
 
-    # override this in derived subclass SqlChar
-    table_quote: str = ""
-    """Character to quote table. (defaults to no quotes)"""
-    # override this in derived subclass SqlChar
-    column_quote: str = ""
-    """Chacter to quote column. (defaults to no quotes)"""
-    # override this in derived subclass SqlChar
-    value_quote: str = "'"
-    """Character to quote value. (defaults to single quotes)"""
+        Args:
+            driver: The `SQLDriver` to cache the schema of
+            path: True to use `SchemaCache.DEFAULT_PATH`, or the path of the cache file.
+                False to disable caching.
+        """
+        self.driver = driver
+        self.path = self.DEFAULT_PATH if path is True else path and str(path)
+        self._schema: dict = None
+        if self.path:
+            self.refresh()
 
+    @property
+    def enabled(self) -> bool:
+        """True if a cached schema is in use."""
+        return self._schema is not None
 
-@dataclass
-class SQLDriver(ABC):
-    """Abstract SQLDriver class.  Derive from this class to create drivers that conform
-    to PySimpleSQL.  This ensures that the same code will work the same way regardless
-    of which database is used.  There are a few important things to note: The commented
-    code below is broken into methods that **MUST** be implemented in the derived class,
-    methods that.
+    def refresh(self, force: bool = False) -> None:
+        """Compare the schema fingerprint with the cache, rebuilding it if needed.
 
-    **SHOULD** be implemented in the derived class, and methods that **MAY** need to be
-    implemented in the derived class for it to work as expected. Most derived drivers
-    will at least partially work by implementing the **MUST** have methods.
+        Args:
+            force: True to rebuild the cache even if the fingerprint matches
 
-    See the source code for `Sqlite`, `Mysql` and `Postgres` for examples of how to
-    construct your own driver.
+        Returns:
+            None
+        """
+        fingerprint = self.driver.schema_fingerprint()
+        if fingerprint is None:
+            logger.info(f"{self.driver.NAME} does not support schema caching")
+            self._schema = None
+            return
 
-    NOTE: SQLDriver.execute() should return a pandas DataFrame.  Additionally, by
-    pysimplesql convention, the attrs["lastrowid"] should always be None unless and
-    INSERT query is executed with SQLDriver.execute() or a record is inserted with
-    SQLDriver.insert_record()
+        key = self.driver.schema_cache_key()
+        entries = self._read()
+        entry = entries.get(key)
+        if not force and entry is not None and entry["fingerprint"] == fingerprint:
+            logger.info(f"Using cached schema for {key}")
+            self._schema = entry
+            return
 
-    Args:
-        host: Host.
-        user: User.
-        password: Password.
-        database: Name of database.
-        sql_script: (optional) SQL script file to execute after opening the database.
-        sql_script_encoding: The encoding of the SQL script file. Defaults to
-            'utf-8'.
-        sql_commands: (optional) SQL commands to execute after opening the database.
-            Note: sql_commands are executed after sql_script.
-        update_cascade: (optional) Default:True. Requery and filter child table on
-            selected parent primary key. (ON UPDATE CASCADE in SQL)
-        delete_cascade: (optional) Default:True. Delete the dependent child records if
-            the parent table record is deleted. (ON UPDATE DELETE in SQL)
-        sql_char: (optional) `SqlChar` object, if non-default chars desired.
+        logger.info(f"Rebuilding schema cache for {key}")
+        self._schema = self._build(fingerprint)
+        entries[key] = self._schema
+        self._write(entries)
 
-    """
+    def get_tables(self) -> List[str]:
+        if not self.enabled:
+            return self.driver.get_tables()
+        return list(self._schema["tables"])
 
-    host: str = None
-    user: str = None
-    password: str = None
-    database: str = None
+    def column_info(self, table: str) -> ColumnInfo:
+        if not self.enabled or table not in self._schema["columns"]:
+            return self.driver.column_info(table)
+        # Build new Column instances each time, as they can be customized by the user
+        col_info = ColumnInfo(self.driver, table)
+        for c in self._schema["columns"][table]:
+            col_class = self._column_class(c["class"])
+            col_info.append(col_class(**{f: c[f] for f in self._COLUMN_FIELDS}))
+        return col_info
 
-    sql_script: str = None
-    sql_script_encoding: str = "utf-8"
-    sql_commands: str = None
+    def pk_column(self, table: str) -> Union[str, None]:
+        if not self.enabled or table not in self._schema["pk_columns"]:
+            return self.driver.pk_column(table)
+        return self._schema["pk_columns"][table]
 
-    update_cascade: bool = True
-    delete_cascade: bool = True
+    def get_relationships(self) -> List[Dict[str, Any]]:
+        if not self.enabled:
+            return self.driver.get_relationships()
+        return [dict(r) for r in self._schema["relationships"]]
 
-    sql_char: InitVar[SqlChar] = SqlChar()  # noqa RUF009
+    def bulk_column_info(self) -> Dict[str, ColumnInfo]:
+        if not self.enabled:
+            return self.driver.bulk_column_info()
+        return {table: self.column_info(table) for table in self._schema["columns"]}
 
-    # ---------------------------------------------------------------------
-    # MUST implement
-    # in order to function
-    # ---------------------------------------------------------------------
+    def bulk_pk_column(self) -> Dict[str, Union[str, None]]:
+        if not self.enabled:
+            return self.driver.bulk_pk_column()
+        return dict(self._schema["pk_columns"])
+
+    def _build(self, fingerprint: str) -> dict:
+        tables = self.driver.get_tables()
+        column_infos = self.driver.bulk_column_info()
+        pk_columns = self.driver.bulk_pk_column()
+        return {
+            "fingerprint": fingerprint,
+            "tables": tables,
+            "pk_columns": {
+                t: pk_columns[t] if t in pk_columns else self.driver.pk_column(t)
+                for t in tables
+            },
+            "columns": {
+                t: [
+                    {
+                        "class": type(c).__name__,
+                        **{f: c[f] for f in self._COLUMN_FIELDS},
+                    }
+                    for c in column_infos.get(t) or self.driver.column_info(t)
+                ]
+                for t in tables
+            },
+            "relationships": self.driver.get_relationships(),
+        }
+
+    @staticmethod
+    def _column_class(name: str) -> Type[Column]:
+        # Find the Column class by name, including user-defined subclasses
+        classes = [Column]
+        while classes:
+            cls = classes.pop()
+            if cls.__name__ == name:
+                return cls
+            classes.extend(cls.__subclasses__())
+        return Column
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: dict) -> None:
+        def to_json(value):
+            # numpy scalars come along from the DataFrames returned by the drivers
+            return value.item() if isinstance(value, np.generic) else str(value)
+
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, default=to_json)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Unable to write schema cache {self.path}: {e}")
+
+
+@dataclass
+class QueryEvent:
+    """Describes a single query, passed to `SQLDriver.on_query_start` and
+    `SQLDriver.on_query_end`.
+
+    Attributes:
+        query: The SQL query
+        values: The query parameters, if any
+        operation: What the query was run for: 'requery', 'search', 'save', 'delete',
+            'duplicate', 'introspection', or 'query' for anything else.
+        dataset: The `DataSet` that ran the query, if any
+        duration: Execution time in seconds. None in `SQLDriver.on_query_start`.
+        rowcount: Number of rows returned. None in `SQLDriver.on_query_start`.
+        exception: The exception the query raised, if any
+    """
+
+    query: str
+    values: Any = None
+    operation: str = "query"
+    dataset: DataSet = None
+    duration: float = None
+    rowcount: int = None
+    exception: Exception = None
+
+
+@dataclass
+class QueryStats:
+    """Query counters and a latency histogram, kept per driver in `SQLDriver.stats`.
+
+    Attributes:
+        count: Number of queries executed
+        errors: Number of queries that raised an exception
+        slow: Number of queries over `SQLDriver.slow_query_threshold`
+        cache_hits: Number of queries answered from `SQLDriver.query_cache`
+        total_time: Total execution time in seconds
+        operations: Number of queries per `QueryEvent.operation`
+        histogram: Number of queries per latency bucket. Keys are the upper bound of
+            each bucket in seconds.
+    """
+
+    BUCKETS: ClassVar[Tuple[float, ...]] = (
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+        0.5,
+        1.0,
+        5.0,
+        math.inf,
+    )
+
+    count: int = 0
+    errors: int = 0
+    slow: int = 0
+    cache_hits: int = 0
+    total_time: float = 0.0
+    operations: Dict[str, int] = field_(default_factory=dict)
+    histogram: Dict[float, int] = field_(
+        default_factory=lambda: dict.fromkeys(QueryStats.BUCKETS, 0)
+    )
+
+    def record(self, event: QueryEvent, slow: bool = False) -> None:
+        """Add a finished query to the counters.
+
+        Args:
+            event: The `QueryEvent` of the finished query
+            slow: True if the query was over the slow query threshold
+        """
+        self.count += 1
+        self.errors += event.exception is not None
+        self.slow += slow
+        self.total_time += event.duration
+        self.operations[event.operation] = self.operations.get(event.operation, 0) + 1
+        bucket = self.BUCKETS[bisect.bisect_left(self.BUCKETS, event.duration)]
+        self.histogram[bucket] += 1
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        self.count = self.errors = self.slow = self.cache_hits = 0
+        self.total_time = 0.0
+        self.operations = {}
+        self.histogram = dict.fromkeys(self.BUCKETS, 0)
+
+
+class QueryCache:
+    """A read-through cache of SELECT results, used by setting `SQLDriver.query_cache`.
+
+    Results are keyed by the whitespace-normalized query and its parameters, and kept
+    for up to `ttl` seconds, evicting the least recently used beyond `max_size`.
+    Queries that don't read from a table, or that call a volatile function such as
+    CURRENT_TIMESTAMP, random() or nextval(), are never cached.
+    INSERT, UPDATE and DELETE queries run through the driver invalidate the cached
+    results that read from their table; any other statement, or a rollback, clears
+    the whole cache. Changes made outside of the driver are only picked up once the
+    ttl expires.
+
+    Example:
+        ```python
+        driver = ss.Driver.sqlite("example.db")
+        driver.query_cache = ss.QueryCache(max_size=256, ttl=300)
+        ```
+    """
+
+    _IDENTIFIER = r"(?:\"[^\"]+\"|\[[^\]]+\]|`[^`]+`|\w+)"
+    _TABLE_NAME = rf"({_IDENTIFIER}(?:\.{_IDENTIFIER})?)"
+    _READ_RE = re.compile(r"\b(?:FROM|JOIN)\s+" + _TABLE_NAME, re.IGNORECASE)
+    _WRITE_RE = re.compile(
+        r"^\s*(?:INSERT\s+(?:OR\s+\w+\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+"
+        + _TABLE_NAME,
+        re.IGNORECASE,
+    )
+    # statements that neither read nor change data
+    _PASSIVE = ("PRAGMA", "SHOW", "EXPLAIN", "DESCRIBE", "BEGIN", "SAVE", "RELEASE")
+    # functions and constants that return something different each time they are run
+    _VOLATILE_RE = re.compile(
+        r"\b(?:CURRENT_(?:DATE|TIME|TIMESTAMP|USER)|LOCALTIME(?:STAMP)?|SYSDATE"
+        r"|SYSTIMESTAMP)\b"
+        r"|\b(?:now|random|randomblob|rand|newid|uuid|gen_random_uuid|nextval|currval"
+        r"|lastval|setval|last_insert_rowid|last_insert_id|scope_identity|changes"
+        r"|getdate|getutcdate|sysdatetime|curdate|curtime|unix_timestamp"
+        r"|utc_timestamp|clock_timestamp|statement_timestamp|timeofday)\s*\("
+        r"|@@IDENTITY\b|'now'",
+        re.IGNORECASE,
+    )
+
+    def __init__(self, max_size: int = 128, ttl: float = 60.0) -> None:
+        """Initialize a QueryCache.
+
+        Args:
+            max_size: The maximum number of results to keep.
+            ttl: Seconds a result is kept before it is queried again.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, set, pd.DataFrame]] = {}
+
+    def get(self, query: str, values=None) -> Union[pd.DataFrame, None]:
+        """Return a copy of the cached result of a query, or None if not cached."""
+        if not self.cacheable(query):
+            return None
+        key = self._key(query, values)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        if time() - entry[0] > self.ttl:
+            return None
+        self._entries[key] = entry  # move to the most recently used end
+        return entry[2].copy()
+
+    def update(self, query: str, values, result: pd.DataFrame) -> None:
+        """Cache the result of a SELECT, or invalidate the results a write affects."""
+        statement = query.lstrip()[:8].upper()
+        if statement.startswith("SELECT"):
+            if result.attrs.get("exception") is None:
+                self._put(query, values, result)
+        elif not statement.startswith(self._PASSIVE):
+            match = self._WRITE_RE.match(query)
+            self.invalidate([match.group(1)] if match else None)
+
+    def invalidate(self, tables: List[str] = None) -> None:
+        """Drop the cached results that read from the given tables.
+
+        Args:
+            tables: Table names. If None, the whole cache is cleared.
+        """
+        if tables is None:
+            self.clear()
+            return
+        tables = {self._table(t) for t in tables}
+        for key, (_, read_tables, _) in list(self._entries.items()):
+            if read_tables & tables:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+    @classmethod
+    def volatile(cls, sql: str) -> bool:
+        """Return True if SQL calls a function that returns something different each
+        time it is run, such as CURRENT_TIMESTAMP, random() or nextval().
+
+        Args:
+            sql: A query or expression
+
+        Returns:
+            True if the result can't be reused
+        """
+        return bool(cls._VOLATILE_RE.search(sql))
+
+    @classmethod
+    def cacheable(cls, query: str) -> bool:
+        """Return True if the result of a SELECT may be cached.
+
+        Args:
+            query: The query
+
+        Returns:
+            False if the query reads no table, so nothing would ever invalidate it, or
+            calls a volatile function.
+        """
+        return bool(cls._READ_RE.search(query)) and not cls.volatile(query)
+
+    def _put(self, query: str, values, result: pd.DataFrame) -> None:
+        if not self.cacheable(query):
+            return
+        key = self._key(query, values)
+        tables = {self._table(t) for t in self._READ_RE.findall(query)}
+        self._entries.pop(key, None)
+        self._entries[key] = (time(), tables, result.copy())
+        while len(self._entries) > self.max_size:
+            del self._entries[next(iter(self._entries))]
+
+    @staticmethod
+    def _key(query: str, values) -> str:
+        return f"{' '.join(query.split())}|{values!r}"
+
+    @staticmethod
+    def _table(table: str) -> str:
+        # compare names without quoting or schema prefix
+        return table.rsplit(".", 1)[-1].strip("`\"[] ").lower()
+
+
+def _instrument_execute(execute: Callable) -> Callable:
+    """Wrap a driver's execute() to time it, count it in `SQLDriver.stats` and call the
+    instrumentation callbacks.
+    """
+
+    @functools.wraps(execute)
+    def wrapper(self, query, values=None, *args, **kwargs):
+        # A driver extending another driver's execute() is only counted once
+        if self._query_depth:
+            return execute(self, query, values, *args, **kwargs)
+
+        cache = self.query_cache
+        if cache is not None:
+            result = cache.get(query, values)
+            if result is not None:
+                self.stats.cache_hits += 1
+                result.attrs["column_info"] = kwargs.get(
+                    "column_info", args[1] if len(args) > 1 else None
+                )
+                return result
+
+        operation, dataset = self._operation or ("query", None)
+        event = QueryEvent(query, values, operation, dataset)
+        if self.on_query_start is not None:
+            self.on_query_start(event)
+
+        self._query_depth += 1
+        start = perf_counter()
+        try:
+            result = execute(self, query, values, *args, **kwargs)
+        finally:
+            self._query_depth -= 1
+        event.duration = perf_counter() - start
+        event.rowcount = len(result)
+        event.exception = result.attrs.get("exception")
+
+        slow = (
+            self.slow_query_threshold is not None
+            and event.duration >= self.slow_query_threshold
+        )
+        if slow:
+            logger.warning(
+                f"Slow query ({event.duration:.3f}s, {operation}"
+                f"{f' on {dataset.key}' if dataset is not None else ''}): "
+                f"{query} {values}"
+            )
+        self.stats.record(event, slow)
+        if cache is not None:
+            cache.update(query, values, result)
+        if self.on_query_end is not None:
+            self.on_query_end(event)
+        return result
+
+    return wrapper
+
+
+def _introspection(fn: Callable) -> Callable:
+    """Decorator attributing a driver method's queries to 'introspection'."""
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        with self.operation("introspection"):
+            return fn(self, *args, **kwargs)
+
+    return wrapper
+
+
+@dataclass
+class SqlChar:
+    """Container for passing database-specific characters.
+
+    Each database type expects their SQL prepared in a certain way. Defaults in this
+    dataclass are set for how various elements in the SQL string should be quoted and
+    represented as placeholders. Override these in the derived class as needed to
+    satisfy SQL requirements
+    """
+
+    placeholder: str = "%s"  # override this in derived subclass SqlChar
+    r"""The placeholder for values in the query string. This is typically '?' or'%s'"""
+
+    # These are the quote characters for tables, columns and values.
+    # It varies between different databases
+
+    # override this in derived subclass SqlChar
+    table_quote: str = ""
+    """Character to quote table. (defaults to no quotes)"""
+    # override this in derived subclass SqlChar
+    column_quote: str = ""
+    """Chacter to quote column. (defaults to no quotes)"""
+    # override this in derived subclass SqlChar
+    value_quote: str = "'"
+    """Character to quote value. (defaults to single quotes)"""
+
+
+@dataclass
+class SQLDriver(ABC):
+    """Abstract SQLDriver class.  Derive from this class to create drivers that conform
+    to PySimpleSQL.  This ensures that the same code will work the same way regardless
+    of which database is used.  There are a few important things to note: The commented
+    code below is broken into methods that **MUST** be implemented in the derived class,
+    methods that.
+
+    **SHOULD** be implemented in the derived class, and methods that **MAY** need to be
+    implemented in the derived class for it to work as expected. Most derived drivers
+    will at least partially work by implementing the **MUST** have methods.
+
+    See the source code for `Sqlite`, `Mysql` and `Postgres` for examples of how to
+    construct your own driver.
+
+    NOTE: SQLDriver.execute() should return a pandas DataFrame.  Additionally, by
+    pysimplesql convention, the attrs["lastrowid"] should always be None unless and
+    INSERT query is executed with SQLDriver.execute() or a record is inserted with
+    SQLDriver.insert_record()
+
+    Args:
+        host: Host.
+        user: User.
+        password: Password.
+        database: Name of database.
+        sql_script: (optional) SQL script file to execute after opening the database.
+        sql_script_encoding: The encoding of the SQL script file. Defaults to
+            'utf-8'.
+        sql_commands: (optional) SQL commands to execute after opening the database.
+            Note: sql_commands are executed after sql_script.
+        update_cascade: (optional) Default:True. Requery and filter child table on
+            selected parent primary key. (ON UPDATE CASCADE in SQL)
+        delete_cascade: (optional) Default:True. Delete the dependent child records if
+            the parent table record is deleted. (ON UPDATE DELETE in SQL)
+        sql_char: (optional) `SqlChar` object, if non-default chars desired.
+        schema_cache: (optional) Default:False. True or a file path to cache the schema
+            introspection (tables, `ColumnInfo`, primary keys and relationships) between
+            runs. See `SchemaCache`.
+
+    Instrumentation:
+        Every query run through `SQLDriver.execute` is timed and counted in
+        `SQLDriver.stats` (a `QueryStats`). Set these attributes on the driver to
+        observe queries further:
+
+        - on_query_start: Called with a `QueryEvent` before each query.
+        - on_query_end: Called with the completed `QueryEvent` after each query.
+        - slow_query_threshold: Seconds. Queries taking at least this long are logged
+          as warnings.
+        - query_cache: A `QueryCache` to answer repeated SELECTs from memory.
+
+    Change detection:
+        `Form.watch_changes()` polls `SQLDriver.change_tokens()` to notice changes made
+        by other connections. Server databases are probed per table with a single
+        query, set `change_probes` to a dict of {table: SQL aggregate} to choose the
+        probe, i.e. {'orders': 'MAX(updated_at)'}. Tables without one are probed with
+        `DEFAULT_CHANGE_PROBE`, the row count, which only notices inserts and deletes.
+
+    """
+
+    host: str = None
+    user: str = None
+    password: str = None
+    database: str = None
+
+    sql_script: str = None
+    sql_script_encoding: str = "utf-8"
+    sql_commands: str = None
+
+    update_cascade: bool = True
+    delete_cascade: bool = True
+
+    sql_char: InitVar[SqlChar] = SqlChar()  # noqa RUF009
+
+    schema_cache: Union[bool, str] = False
+
+    on_query_start: Callable[[QueryEvent], None] = None
+    on_query_end: Callable[[QueryEvent], None] = None
+    slow_query_threshold: float = None
+    query_cache: QueryCache = None
+    change_probes: Dict[str, str] = None
+
+    # ---------------------------------------------------------------------
+    # MUST implement
+    # in order to function
+    # ---------------------------------------------------------------------
 
     # ---------------------------------------------------------------------
-    # ClassVars, replace in derived subclass with your own
-    # ---------------------------------------------------------------------
+    # ClassVars, replace in derived subclass with your own
+    # ---------------------------------------------------------------------
     NAME: ClassVar[str] = "SQLDriver"
     REQUIRES: ClassVar[List[str]] = None
 
@@ -9261,6 +10936,29 @@ class SQLDriver(ABC):
     COLUMN_CLASS_MAP: ClassVar[Dict[str, ColumnClass]] = {}
     SQL_CONSTANTS: ClassVar[List[str]] = []
     _CHECK_RESERVED_KEYWORDS: ClassVar[bool] = True
+    # Stay well under the parameter limits of the various databases for IN (...)
+    _IN_CHUNK_SIZE: ClassVar[int] = 500
+    # Aggregate run against tables without an entry in `SQLDriver.change_probes`
+    DEFAULT_CHANGE_PROBE: ClassVar[str] = "COUNT(*)"
+
+    # Driver methods whose queries count as 'introspection' in `QueryEvent`
+    _INTROSPECTION_METHODS: ClassVar[List[str]] = [
+        "get_tables",
+        "column_info",
+        "pk_column",
+        "get_relationships",
+        "bulk_column_info",
+        "bulk_pk_column",
+    ]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # instrument the methods each driver implements, see `QueryEvent`
+        if "execute" in cls.__dict__:
+            cls.execute = _instrument_execute(cls.__dict__["execute"])
+        for name in cls._INTROSPECTION_METHODS:
+            if name in cls.__dict__:
+                setattr(cls, name, _introspection(cls.__dict__[name]))
 
     def __post_init__(self, sql_char) -> None:
         # if derived subclass implements __init__, call `super()__post_init__()`
@@ -9274,8 +10972,16 @@ class SQLDriver(ABC):
             lang.SQLDriver_init.format_map(LangFormat(name=self.NAME)), 100
         )
         self.win_pb.update(lang.SQLDriver_connecting, 0)
+        self.stats = QueryStats()
+        self._operation = None
+        self._query_depth = 0
+        self._temporary_pks = itertools.count(-1, -1)
+        self._unit_of_work = False
+        self._savepoints = itertools.count(1)
+        self._watch_con = None
         self._import_required_modules()
         self._init_db()
+        self.schema = SchemaCache(self, self.schema_cache)
         self.relationships = RelationshipStore(self)
         self.auto_add_relationships()
         self.win_pb.close()
@@ -9344,17 +11050,85 @@ class SQLDriver(ABC):
     # SHOULD implement
     # based on specifics of the database
     # ---------------------------------------------------------------------
-    # This is a generic way to estimate the next primary key to be generated.
-    # This is not always a reliable way, as manual inserts which assign a
-    # primary key value don't always update the sequencer for the given database.  This
-    # is just a default way to "get things working", but the best bet is to override
-    # this in the derived class and get the value right from the sequencer.
     def next_pk(self, table: str, pk_column: str) -> int:
+        """Estimate the next primary key the database will generate.
+
+        Deprecated: new records get a `SQLDriver.temporary_pk()` and the database
+        assigns the real one on insert, so pysimplesql no longer calls this. It will be
+        removed in a future release.
+
+        Args:
+            table: The table to check
+            pk_column: The primary key column of the table
+
+        Returns:
+            The max primary key plus one
+        """
+        warnings.warn(
+            "SQLDriver.next_pk() is deprecated, new records use "
+            "SQLDriver.temporary_pk() until the database assigns their key",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         max_pk = self.max_pk(table, pk_column)
         if max_pk is not None:
             return max_pk + 1
         return 1
 
+    def temporary_pk(self, table: str, pk_column: str) -> int:
+        """Return a temporary primary key for a new, virtual record.
+
+        Temporary keys are negative, so they can't clash with records in the database,
+        and are handed out without a query. `SQLDriver.insert_record` leaves the pk to
+        the database, and `DataSet.save_record` replaces the temporary key with the
+        returned lastrowid.
+
+        Args:
+            table: The table the record is for
+            pk_column: The primary key column of the table
+
+        Returns:
+            The temporary primary key
+        """
+        return next(self._temporary_pks)
+
+    # These introspect the whole schema at once. The defaults fall back to querying
+    # table by table; override them to fetch everything in a handful of queries.
+    def bulk_column_info(self) -> Dict[str, ColumnInfo]:
+        """Return the `ColumnInfo` of every table in the database.
+
+        Returns:
+            A dict of table name to `ColumnInfo`
+        """
+        return {table: self.column_info(table) for table in self.get_tables()}
+
+    def bulk_pk_column(self) -> Dict[str, Union[str, None]]:
+        """Return the primary key column of every table in the database.
+
+        Returns:
+            A dict of table name to primary key column name
+        """
+        return {table: self.pk_column(table) for table in self.get_tables()}
+
+    def schema_fingerprint(self) -> Union[str, None]:
+        """Return a cheap fingerprint of the database schema, used by `SchemaCache`.
+
+        The fingerprint must change whenever tables, columns or foreign keys change.
+        Override this in the derived class; the default of None disables caching.
+
+        Returns:
+            A string that changes along with the schema, or None if not supported
+        """
+        return None
+
+    def schema_cache_key(self) -> str:
+        """Return the key identifying this connection in the `SchemaCache` file.
+
+        Returns:
+            A string unique to the database this driver is connected to
+        """
+        return f"{self.NAME}:{self.user}@{self.host}/{self.database}"
+
     def check_keyword(self, keyword: str, key: str = None) -> None:
         """Check keyword to see if it is a reserved word.  If it is raise a
         ReservedKeywordError. Checks to see if the database name is in keys and uses the
@@ -9405,19 +11179,217 @@ class SQLDriver(ABC):
         return self.quote(value, self.quote_value_char)
 
     def commit(self) -> None:
-        """Commit a transaction."""
+        """Commit a transaction.
+
+        Inside a unit of work the commit is deferred to
+        `SQLDriver.end_unit_of_work()`.
+        """
+        if self._unit_of_work:
+            return
         self.con.commit()
 
     def rollback(self) -> None:
+        """Roll back a transaction.
+
+        Inside a unit of work the rollback is deferred to
+        `SQLDriver.end_unit_of_work()`, see `SQLDriver.rollback_to_savepoint()` to undo
+        part of it.
+        """
+        if self._unit_of_work:
+            return
         self.con.rollback()
+        # cached results may include the changes that were just rolled back
+        if self.query_cache is not None:
+            self.query_cache.clear()
+
+    @property
+    def in_unit_of_work(self) -> bool:
+        """True between `SQLDriver.begin_unit_of_work()` and
+        `SQLDriver.end_unit_of_work()`.
+        """
+        return self._unit_of_work
+
+    def begin_unit_of_work(self) -> None:
+        """Start a unit of work: one transaction that several saves are written in.
+
+        Until `SQLDriver.end_unit_of_work()`, `SQLDriver.commit()` and
+        `SQLDriver.rollback()` do nothing, so a multi-table save costs a single commit
+        and either all of it is written, or none of it. Use savepoints to undo the
+        writes of a single save. See `Form.save_records()`.
+
+        Returns:
+            None
+        """
+        self.begin()
+        self._unit_of_work = True
+
+    def end_unit_of_work(self, commit: bool = True) -> None:
+        """End the unit of work started with `SQLDriver.begin_unit_of_work()`.
+
+        Args:
+            commit: True to commit the unit of work, False to roll all of it back.
+
+        Returns:
+            None
+        """
+        self._unit_of_work = False
+        if commit:
+            self.commit()
+            self.write_pending()
+        else:
+            self.rollback()
+
+    def begin(self) -> None:  # noqa: B027
+        """Start a transaction.
+
+        Connections that are not in autocommit mode start a transaction with the first
+        statement, so there is nothing to do here. Override for drivers that need to
+        start one explicitly.
+        """
+
+    def savepoint(self) -> str:
+        """Set a savepoint in the current transaction.
+
+        Returns:
+            The name of the savepoint, to pass to `SQLDriver.release_savepoint()` or
+            `SQLDriver.rollback_to_savepoint()`
+        """
+        name = f"pysimplesql_{next(self._savepoints)}"
+        self.execute(f"SAVEPOINT {name}", silent=True)
+        return name
+
+    def release_savepoint(self, name: str) -> None:
+        """Keep the changes made since a savepoint, and forget the savepoint.
+
+        Args:
+            name: The name returned by `SQLDriver.savepoint()`
+        """
+        self.execute(f"RELEASE SAVEPOINT {name}", silent=True)
+
+    def rollback_to_savepoint(self, name: str) -> None:
+        """Undo the changes made since a savepoint, keeping the rest of the transaction.
+
+        Args:
+            name: The name returned by `SQLDriver.savepoint()`
+        """
+        self.execute(f"ROLLBACK TO SAVEPOINT {name}", silent=True)
+        self.release_savepoint(name)
+        if self.query_cache is not None:
+            self.query_cache.clear()
 
     def close(self) -> None:
+        if self._watch_con is not None:
+            self._watch_con.close()
+            self._watch_con = None
         self.con.close()
 
+    def write_pending(self) -> None:  # noqa: B027
+        """Write out any changes that the driver is holding back.
+
+        Drivers that write straight through to the database have nothing to do here.
+        See `Flatfile.write_pending()` for a driver that defers its writes.
+        """
+
+    @contextlib.contextmanager
+    def operation(self, name: str, dataset: DataSet = None):
+        """Attribute the queries run inside the with block to an operation.
+
+        The operation and `DataSet` are passed along in each `QueryEvent`, and queries
+        are counted per operation in `SQLDriver.stats`.
+
+        Args:
+            name: The name of the operation, i.e. 'requery'
+            dataset: (optional) The `DataSet` the queries are run for
+        """
+        previous = self._operation
+        self._operation = (name, dataset)
+        try:
+            yield
+        finally:
+            self._operation = previous
+
+    @contextlib.contextmanager
+    def uncached(self):
+        """Bypass `SQLDriver.query_cache` for the queries run inside the with block.
+
+        Use this for queries whose result must not be answered from, or stored in, the
+        cache, such as probing for changes or evaluating volatile column defaults.
+        """
+        cache, self.query_cache = self.query_cache, None
+        try:
+            yield
+        finally:
+            self.query_cache = cache
+
     def default_query(self, table) -> str:
         table = self.quote_table(table)
         return f"SELECT {table}.* FROM {table}"
 
+    def expressions_query(self, expressions: List[str]) -> str:
+        """Return a query that evaluates SQL expressions into a single row, without
+        reading a table.
+
+        Used to evaluate column defaults that are database functions.
+
+        Args:
+            expressions: The SQL expressions, i.e. 'CURRENT_TIMESTAMP'
+
+        Returns:
+            The query, selecting one column per expression
+        """
+        columns = ", ".join(f"{e} AS val{i}" for i, e in enumerate(expressions))
+        return f"SELECT {columns};"
+
+    def change_tokens(self, tables: List[str]) -> Dict[str, Any]:
+        """Return a token per table that changes when the data in the table changes.
+
+        Used by `Form.watch_changes()` to find the tables changed by other connections.
+        All tables are probed in a single query, see `SQLDriver.change_probes`. The
+        probe never commits an open transaction: it runs on a separate autocommit
+        connection, or is skipped until the transaction has ended.
+
+        Args:
+            tables: The tables to probe
+
+        Returns:
+            A dict of {table: token}. Tables that could not be probed are left out.
+        """
+        if not tables:
+            return {}
+        probes = self.change_probes or {}
+        expressions = [
+            f"(SELECT {probes.get(t, self.DEFAULT_CHANGE_PROBE)} "
+            f"FROM {self.quote_table(t)})"
+            for t in tables
+        ]
+        with self._probe_connection() as ready:
+            if not ready:
+                return {}
+            # a cached result would hide the very changes we are looking for
+            with self.uncached(), self.operation("watch"):
+                result = self.execute(self.expressions_query(expressions), silent=True)
+        if result.attrs["exception"] is not None or result.empty:
+            return {}
+        return {
+            table: None if pd.isna(token) else token
+            for table, token in zip(tables, result.iloc[0].tolist())
+        }
+
+    @contextlib.contextmanager
+    def _probe_connection(self):
+        # Run the change probes on a separate autocommit connection. On self.con they
+        # would have to either end its open transaction, or read from the snapshot it
+        # took when it started (i.e. MySQL's REPEATABLE READ). Yields False if the
+        # probes can't be run now.
+        if self._watch_con is None:
+            self._watch_con = self.connect()
+            self._watch_con.autocommit = True
+        con, self.con = self.con, self._watch_con
+        try:
+            yield True
+        finally:
+            self.con = con
+
     def default_order(self, description_column) -> str:
         description_column = self.quote_column(description_column)
         return f" ORDER BY {description_column} ASC"
@@ -9516,82 +11488,145 @@ class SQLDriver(ABC):
             f' {dataset.order_clause if order_clause else ""}'
         )
 
+    def enforces_foreign_keys(self) -> bool:
+        """Return True if the database is currently enforcing foreign keys.
+
+        `SQLDriver.delete_record` leaves ON DELETE CASCADE rules to the database when
+        it does. The default is False, so that pysimplesql deletes child records
+        itself.
+        """
+        return False
+
     def delete_record(self, dataset: DataSet, cascade: bool = True):
         # Get data for query
         table = self.quote_table(dataset.table)
         pk_column = self.quote_column(dataset.pk_column)
         pk = dataset.current.pk
 
-        # Create clauses
-        delete_clause = f"DELETE FROM {table} "  # leave a space at end for joining
-        where_clause = f"WHERE {table}.{pk_column} = {pk}"
-
         # Delete child records first!
         if cascade:
-            recursion = 0
-            result = self._delete_record_recursive(
-                dataset, "", where_clause, table, pk_column, recursion
-            )
+            plan = self._cascade_delete_plan(dataset, pk)
+            if plan == DELETE_RECURSION_LIMIT_ERROR:
+                return DELETE_RECURSION_LIMIT_ERROR
+            for child, child_pk_column, pks in plan:
+                result = self._delete_pks(child, child_pk_column, pks)
+                if result.attrs["exception"]:
+                    return result
 
         # Then delete self
-        if result == DELETE_RECURSION_LIMIT_ERROR:
-            return DELETE_RECURSION_LIMIT_ERROR
-        q = delete_clause + where_clause + ";"
+        q = f"DELETE FROM {table} WHERE {table}.{pk_column} = {pk};"
         return self.execute(q)
 
-    def _delete_record_recursive(
-        self, dataset: DataSet, inner_join, where_clause, parent, pk_column, recursion
-    ):
-        for child in self.relationships.get_delete_cascade_tables(dataset.table):
-            # Check to make sure we arn't at recursion limit
-            recursion += 1  # Increment, since this is a child
-            if recursion >= DELETE_CASCADE_RECURSION_LIMIT:
-                return DELETE_RECURSION_LIMIT_ERROR
+    def _cascade_delete_plan(
+        self, dataset: DataSet, pk
+    ) -> Union[List[Tuple[str, str, List]], str]:
+        """Collect the child records that have to be deleted along with a record.
 
-            # Get data for query
-            fk_column = self.quote_column(
-                self.relationships.get_delete_cascade_fk_column(child)
-            )
-            pk_column = self.quote_column(dataset.frm[child].pk_column)
-            child_table = self.quote_table(child)
-            select_clause = f"SELECT {child_table}.{pk_column} FROM {child} "
-            delete_clause = f"DELETE FROM {child} WHERE {pk_column} IN "
-
-            # Create new inner join and add it to beginning of passed in inner_join
-            inner_join_clause = (
-                f"INNER JOIN {parent} ON {parent}.{pk_column} = "
-                f"{child}.{fk_column} {inner_join}"
-            )
+        Walks the delete cascade relationships level by level, collecting the primary
+        keys of each level with a query per relationship. Relationships that the
+        database cascades on its own are skipped, unless a relationship it doesn't
+        handle lies further down.
+
+        Args:
+            dataset: The `DataSet` of the record being deleted
+            pk: The primary key of the record being deleted
+
+        Returns:
+            A list of (table, pk_column, pks) to delete, deepest level first, or
+            DELETE_RECURSION_LIMIT_ERROR.
+        """
+        enforced = self.enforces_foreign_keys()
+        pk_columns = {ds.table: ds.pk_column for ds in dataset.frm.datasets.values()}
+        pk_columns[dataset.table] = dataset.pk_column
+
+        def edges(table: str) -> List[Relationship]:
+            return [
+                r for r in self.relationships
+                if r.parent_table == table and r.on_delete_cascade
+            ]
 
-            # Call function again to create recursion
-            result = self._delete_record_recursive(
-                dataset.frm[child],
-                inner_join_clause,
-                where_clause,
-                child,
-                self.quote_column(dataset.frm[child].pk_column),
-                recursion,
+        def manual(rel: Relationship) -> bool:
+            return not (enforced and rel.db_cascade)
+
+        def needs_walk(table: str, seen: set) -> bool:
+            # True if deleting from this table involves a relationship to do by hand
+            seen.add(table)
+            return any(
+                manual(rel)
+                or (rel.child_table not in seen and needs_walk(rel.child_table, seen))
+                for rel in edges(table)
             )
 
-            # Break out of recursive call if at recursion limit
-            if result == DELETE_RECURSION_LIMIT_ERROR:
-                return DELETE_RECURSION_LIMIT_ERROR
+        collected = {dataset.table: {pk}}
+        deletes = {}  # table: [pks, depth]
+        level = {dataset.table: [pk]}
+        depth = 0
+        while level:
+            depth += 1
+            next_level = {}
+            for parent, parent_pks in level.items():
+                for rel in edges(parent):
+                    child = rel.child_table
+                    if not manual(rel) and not needs_walk(child, {parent}):
+                        continue
+                    # Check to make sure we arn't at recursion limit
+                    if depth >= DELETE_CASCADE_RECURSION_LIMIT:
+                        return DELETE_RECURSION_LIMIT_ERROR
+                    if child not in pk_columns:
+                        pk_columns[child] = self.schema.pk_column(child)
+                    found = self._select_children(
+                        rel, pk_columns[parent], pk_columns[child], parent_pks
+                    )
+                    if manual(rel) and found:
+                        # a table found on several levels is deleted at the deepest
+                        # level it has rows on
+                        entry = deletes.setdefault(child, [set(), depth])
+                        entry[0].update(found)
+                        entry[1] = depth
+                    new = set(found) - collected.setdefault(child, set())
+                    if new:
+                        collected[child].update(new)
+                        next_level.setdefault(child, []).extend(new)
+            level = next_level
+
+        ordered = sorted(deletes.items(), key=lambda item: item[1][1], reverse=True)
+        return [(table, pk_columns[table], list(pks)) for table, (pks, _) in ordered]
+
+    def _select_children(
+        self, rel: Relationship, parent_pk_column: str, child_pk_column: str, pks: List
+    ) -> List:
+        parent = self.quote_table(rel.parent_table)
+        child = self.quote_table(rel.child_table)
+        found = []
+        for start in range(0, len(pks), self._IN_CHUNK_SIZE):
+            chunk = pks[start : start + self._IN_CHUNK_SIZE]
+            q = (
+                f"SELECT {child}.{self.quote_column(child_pk_column)} FROM {child} "
+                f"WHERE {child}.{self.quote_column(rel.fk_column)} IN "
+                f"(SELECT {parent}.{self.quote_column(rel.pk_column)} FROM {parent} "
+                f"WHERE {parent}.{self.quote_column(parent_pk_column)} IN "
+                f"({', '.join(self.placeholder for _ in chunk)}));"
+            )
+            rows = self.execute(q, chunk, silent=True)
+            if len(rows):
+                found.extend(rows.iloc[:, 0].tolist())
+        return found
 
-            # Create query and execute
+    def _delete_pks(self, table: str, pk_column: str, pks: List) -> pd.DataFrame:
+        quoted_table = self.quote_table(table)
+        pk_column = self.quote_column(pk_column)
+        result = Result.set()
+        for start in range(0, len(pks), self._IN_CHUNK_SIZE):
+            chunk = pks[start : start + self._IN_CHUNK_SIZE]
             q = (
-                delete_clause
-                + "("
-                + select_clause
-                + inner_join_clause
-                + where_clause
-                + ");"
+                f"DELETE FROM {quoted_table} WHERE {pk_column} IN "
+                f"({', '.join(self.placeholder for _ in chunk)});"
             )
-            self.execute(q)
+            result = self.execute(q, chunk)
             logger.debug(f"Delete query executed: {q}")
-
-            # Reset limit for next Child stack
-            recursion = 0
-        return None
+            if result.attrs["exception"]:
+                break
+        return result
 
     def duplicate_record(self, dataset: DataSet, children: bool) -> pd.DataFrame:
         """Duplicates a record in a database table and optionally duplicates its
@@ -9603,7 +11638,9 @@ class SQLDriver(ABC):
 
         If the 'children' parameter is set to 'True', the function duplicates the
         dependent records by setting the foreign key column of the child records to the
-        primary key value of the newly duplicated record before inserting them.
+        primary key value of the newly duplicated record before inserting them. This
+        continues down the whole tree of dependent records, see
+        `SQLDriver._duplicate_children`.
 
         Note that this function assumes the primary key column is auto-incrementing and
         that no columns are set to unique.
@@ -9650,55 +11687,194 @@ class SQLDriver(ABC):
             if res.attrs["exception"]:
                 return res
 
-        # create list of which children we have duplicated
-        child_duplicated = []
-        # Next, duplicate the child records!
+        # Next, duplicate the child records, and theirs, all the way down
         if children:
-            for _ in dataset.frm.datasets:
-                for r in self.relationships:
-                    if (
-                        r.parent_table == dataset.table
-                        and r.on_update_cascade
-                        and (r.child_table not in child_duplicated)
-                    ):
-                        child = self.quote_table(r.child_table)
-                        fk_column = self.quote_column(r.fk_column)
-
-                        # all columns except pk_column
-                        columns = [
-                            self.quote_column(column.name)
-                            for column in dataset.frm[r.child_table].column_info
-                            if column.name != dataset.frm[r.child_table].pk_column
-                            and not column.generated
-                        ]
-
-                        # replace fk_column value with pk of new parent
-                        select_columns = [
-                            str(new_pk)
-                            if column == self.quote_column(r.fk_column)
-                            else column
-                            for column in columns
-                        ]
-
-                        # prepare query & execute
-                        columns = ", ".join(columns)
-                        select_columns = ", ".join(select_columns)
-                        query = (
-                            f"INSERT INTO {child} ({columns}) "
-                            f"SELECT {select_columns} FROM {child} "
-                            f"WHERE {fk_column} = {pk};"
+            res = self._duplicate_children(dataset, {pk: new_pk})
+            if res is not None:
+                return res
+        # If we made it here, we can return the pk.
+        # Since the pk was stored earlier, we will just send an empty dataframe.
+        return Result.set(lastrowid=new_pk)
+
+    def _duplicate_children(
+        self, dataset: DataSet, pk_map: Dict[Any, Any]
+    ) -> Union[pd.DataFrame, None]:
+        """Duplicate the dependent records of duplicated records, level by level.
+
+        Each level is copied with INSERT...SELECT, replacing the foreign key with the
+        pk of the new parent. Records that have dependents of their own, or more than
+        one duplicated parent, are copied one by one, so that every foreign key can be
+        pointed at its new parent and the new pks are known for the next level. The
+        others are copied in one statement per chunk of parents. A table with several
+        duplicated parents waits until all of them have been copied.
+
+        Args:
+            dataset: The `DataSet` of the duplicated record
+            pk_map: The duplicated record's pk, mapped to the pk of its copy
+
+        Returns:
+            The result of the failed query, or None if successful.
+        """
+        frm = dataset.frm
+
+        def table_info(table: str) -> Tuple[ColumnInfo, str]:
+            for ds in frm.datasets.values():
+                if ds.table == table:
+                    return ds.column_info, ds.pk_column
+            return self.schema.column_info(table), self.schema.pk_column(table)
+
+        def cascades(table: str) -> List[Relationship]:
+            return [
+                r
+                for r in self.relationships
+                if r.parent_table == table and r.on_update_cascade
+            ]
+
+        def reachable(table: str) -> set:
+            # the tables the duplication cascades to from a table
+            found = set()
+            tables = [table]
+            while tables:
+                for r in cascades(tables.pop()):
+                    if r.child_table not in found:
+                        found.add(r.child_table)
+                        tables.append(r.child_table)
+            return found
+
+        def child_rels(table: str) -> List[Relationship]:
+            return [r for r in cascades(table) if r.child_table not in duplicated]
+
+        def parent_rels(table: str) -> List[Relationship]:
+            return [
+                r
+                for r in self.relationships
+                if r.child_table == table
+                and r.on_update_cascade
+                and r.parent_table in planned
+            ]
+
+        def waiting(table: str) -> bool:
+            # True if a parent still to be duplicated is not below the table itself
+            return any(
+                r.parent_table not in pk_maps
+                and r.parent_table not in reachable(table)
+                for r in parent_rels(table)
+            )
+
+        planned = reachable(dataset.table) | {dataset.table}
+        duplicated = {dataset.table}
+        pk_maps = {dataset.table: pk_map}
+        level = [dataset.table]
+        while level:
+            next_level = []
+            for parent in level:
+                for r in child_rels(parent):
+                    if r.child_table in duplicated or waiting(r.child_table):
+                        continue
+                    duplicated.add(r.child_table)
+                    child = self.quote_table(r.child_table)
+                    fk_column = self.quote_column(r.fk_column)
+                    column_info, child_pk_column = table_info(r.child_table)
+                    # every foreign key to a duplicated parent, mapped to the copies
+                    fk_maps = {
+                        self.quote_column(rel.fk_column): pk_maps[rel.parent_table]
+                        for rel in parent_rels(r.child_table)
+                        if rel.parent_table in pk_maps
+                    }
+                    parent_map = fk_maps[fk_column]
+
+                    # all columns except pk_column
+                    columns = [
+                        self.quote_column(column.name)
+                        for column in column_info
+                        if column.name != child_pk_column and not column.generated
+                    ]
+
+                    if not child_rels(r.child_table) and len(fk_maps) == 1:
+                        # no further levels, so no need to know the new pks
+                        res = self._duplicate_rows(
+                            child, columns, fk_column, parent_map
                         )
-                        res = self.execute(query)
                         if res.attrs["exception"]:
                             return res
+                        continue
 
-                        child_duplicated.append(r.child_table)
-        # If we made it here, we can return the pk.
-        # Since the pk was stored earlier, we will just send an empty dataframe.
-        return Result.set(lastrowid=new_pk)
+                    old_pks = list(parent_map)
+                    child_map = {}
+                    for start in range(0, len(old_pks), self._IN_CHUNK_SIZE):
+                        chunk = old_pks[start : start + self._IN_CHUNK_SIZE]
+                        query = (
+                            f"SELECT {self.quote_column(child_pk_column)}, "
+                            f"{', '.join(fk_maps)} FROM {child} WHERE {fk_column} IN "
+                            f"({', '.join(str(pk) for pk in chunk)});"
+                        )
+                        rows = self.execute(query, silent=True)
+                        if rows.attrs["exception"]:
+                            return rows
+                        for old_pk, *fks in rows.itertuples(index=False):
+                            fk_values = {
+                                column: str(fk_map[fk])
+                                for (column, fk_map), fk in zip(fk_maps.items(), fks)
+                                if fk in fk_map
+                            }
+                            res = self._insert_duplicate_record(
+                                child,
+                                ", ".join(columns),
+                                child_pk_column,
+                                old_pk,
+                                self._select_with_fks(columns, fk_values),
+                            )
+                            if res.attrs["exception"]:
+                                return res
+                            child_map[old_pk] = res.attrs["lastrowid"]
+                    pk_maps[r.child_table] = child_map
+                    next_level.append(r.child_table)
+            level = next_level
+        return None
+
+    def _duplicate_rows(
+        self,
+        child: str,
+        columns: List[str],
+        fk_column: str,
+        parent_map: Dict[Any, Any],
+    ) -> pd.DataFrame:
+        # Copy all the child rows of a chunk of parents in one INSERT...SELECT, mapping
+        # each old fk to the new parent pk with a CASE expression.
+        res = Result.set()
+        old_pks = list(parent_map)
+        for start in range(0, len(old_pks), self._IN_CHUNK_SIZE):
+            chunk = old_pks[start : start + self._IN_CHUNK_SIZE]
+            if len(chunk) == 1:
+                fk_value = str(parent_map[chunk[0]])
+            else:
+                cases = " ".join(
+                    f"WHEN {pk} THEN {parent_map[pk]}" for pk in chunk
+                )
+                fk_value = f"CASE {fk_column} {cases} END"
+            query = (
+                f"INSERT INTO {child} ({', '.join(columns)}) "
+                f"SELECT {self._select_with_fks(columns, {fk_column: fk_value})} "
+                f"FROM {child} "
+                f"WHERE {fk_column} IN ({', '.join(str(pk) for pk in chunk)});"
+            )
+            res = self.execute(query)
+            if res.attrs["exception"]:
+                break
+        return res
+
+    @staticmethod
+    def _select_with_fks(columns: List[str], fk_values: Dict[str, str]) -> str:
+        # replace the fk_column values with the pks of the new parents
+        return ", ".join(fk_values.get(column, column) for column in columns)
 
     def _insert_duplicate_record(
-        self, table: str, columns: str, pk_column: str, pk: int
+        self,
+        table: str,
+        columns: str,
+        pk_column: str,
+        pk: int,
+        select_columns: str = None,
     ) -> pd.DataFrame:
         """Inserts duplicate record, sets attrs["lastrowid"] to new record's pk.
 
@@ -9710,10 +11886,12 @@ class SQLDriver(ABC):
             columns: Escaped and comman (,) seperated list of columns
             pk_column: Non-escaped pk_column
             pk: Primary key of record
+            select_columns: (optional) The expressions to select for `columns`, if
+                not the columns themselves
         """
         query = (
             f"INSERT INTO {table} ({columns}) "
-            f"SELECT {columns} FROM {table} "
+            f"SELECT {select_columns or columns} FROM {table} "
             f"WHERE {self.quote_column(pk_column)} = {pk} "
             f"RETURNING {self.quote_column(pk_column)};"
         )
@@ -9787,6 +11965,7 @@ class SQLDriver(ABC):
         pk_column: str,
         update_cascade: bool,
         delete_cascade: bool,
+        db_cascade: bool = False,
     ) -> None:
         """Add a foreign key relationship between two dataset of the database.
 
@@ -9807,6 +11986,8 @@ class SQLDriver(ABC):
                 primary key (ON UPDATE CASCADE in SQL)
             delete_cascade: Delete the dependent child records if the parent table
                 record is deleted (ON UPDATE DELETE in SQL)
+            db_cascade: (optional) True if the database itself has the ON DELETE
+                CASCADE rule, so `SQLDriver.delete_record` can leave it to the database.
 
         Returns:
             None
@@ -9821,6 +12002,7 @@ class SQLDriver(ABC):
                 update_cascade,
                 delete_cascade,
                 self,
+                db_cascade,
             )
         )
 
@@ -9843,7 +12025,7 @@ class SQLDriver(ABC):
         self.relationships = RelationshipStore(
             self
         )  # clear any relationships already stored
-        relationships = self.get_relationships()
+        relationships = self.schema.get_relationships()
         for r in relationships:
             logger.debug(
                 f'Adding relationship {r["from_table"]}.{r["from_column"]} = '
@@ -9857,6 +12039,7 @@ class SQLDriver(ABC):
                 r["to_column"],
                 r["update_cascade"],
                 r["delete_cascade"],
+                db_cascade=r["delete_cascade"],
             )
 
     def check_reserved_keywords(self, value: bool) -> None:
@@ -9896,6 +12079,13 @@ class SQLDriver(ABC):
 
         return domain_name, domain_args
 
+    def _query_fingerprint(self, query: str, values=None) -> Union[str, None]:
+        # Run a fingerprint query, joining the values of its single row
+        rows = self.execute(query, values, silent=True)
+        if rows.attrs["exception"] or rows.empty:
+            return None
+        return "|".join(str(v) for v in rows.iloc[0].tolist())
+
     def _get_column_class(self, domain) -> Union[ColumnClass, None]:
         if domain in self.COLUMN_CLASS_MAP:
             return self.COLUMN_CLASS_MAP[domain]
@@ -9931,6 +12121,16 @@ class Sqlite(SQLDriver):
         "NULL",
     ]
 
+    # PRAGMA values applied when `performance_profile` is used
+    PERFORMANCE_PROFILE: ClassVar[Dict[str, Union[str, int]]] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,  # 256MB
+        "cache_size": -65536,  # negative is in KiB, so 64MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # milliseconds
+    }
+
     def __init__(
         self,
         database: Union[
@@ -9948,6 +12148,8 @@ class Sqlite(SQLDriver):
         sql_char: SqlChar = sql_char,
         create_file: bool = True,
         skip_sql_if_db_exists: bool = True,
+        schema_cache: Union[bool, str] = False,
+        performance_profile: Union[bool, Dict[str, Union[str, int]]] = False,
     ) -> None:
         """Initilize a Sqlite instance.
 
@@ -9967,6 +12169,14 @@ class Sqlite(SQLDriver):
             create_file: (optional) default True. Create file if it doesn't exist.
             skip_sql_if_db_exists: (optional) Skip both 'sql_file' and 'sql_commands' if
                 database already exists.
+            schema_cache: (optional) Default:False. True or a file path to cache the
+                schema introspection between runs. See `SchemaCache`.
+            performance_profile: (optional) Default:False. True to tune a database
+                file for shared use with the pragmas in `Sqlite.PERFORMANCE_PROFILE`
+                (WAL journaling, memory mapping, a larger cache and a busy timeout),
+                and to send plain SELECTs through a second, read-only connection.
+                Pass a dict to override individual pragma values. Not applied to
+                ':memory:' databases or passed in connections.
         """
         self._database = str(database)
         self.sql_script = sql_script
@@ -9976,6 +12186,12 @@ class Sqlite(SQLDriver):
         self.delete_cascade = delete_cascade
         self.create_file = create_file
         self.skip_sql_if_db_exists = skip_sql_if_db_exists
+        self.schema_cache = schema_cache
+        self.performance_profile = performance_profile
+        self.reader_con = None
+        # last PRAGMA data_version seen by change_tokens(), and the probes run for it
+        self._data_version = None
+        self._probe_tokens: Dict[str, Any] = {}
 
         super().__post_init__(sql_char)
 
@@ -10001,6 +12217,8 @@ class Sqlite(SQLDriver):
                 )
                 exit(0)
             self.connect(self._database)  # Open our database
+            if self._use_performance_profile:
+                self._apply_performance_profile(self.con)
 
         # or use passed preexisting connection
         elif isinstance(self._database, sqlite3.Connection):
@@ -10030,9 +12248,52 @@ class Sqlite(SQLDriver):
             self.con.executescript(self.sql_commands)
             self.con.commit()
 
-    @property
-    def _imported_database(self):
-        return isinstance(self._database, sqlite3.Connection)
+        # open the reader last, so that it sees the finished schema
+        if self._use_performance_profile:
+            uri = f"{Path(os.path.abspath(self._database)).as_uri()}?mode=ro"
+            self.reader_con = sqlite3.connect(
+                uri,
+                uri=True,
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            )
+            self.reader_con.row_factory = sqlite3.Row
+            self._apply_performance_profile(self.reader_con, read_only=True)
+
+    @property
+    def _imported_database(self):
+        return isinstance(self._database, sqlite3.Connection)
+
+    @property
+    def _use_performance_profile(self) -> bool:
+        return (
+            bool(self.performance_profile)
+            and not self._imported_database
+            and self._database != ":memory:"
+        )
+
+    def _apply_performance_profile(
+        self, con: sqlite3.Connection, read_only: bool = False
+    ) -> None:
+        profile = dict(self.PERFORMANCE_PROFILE)
+        if isinstance(self.performance_profile, dict):
+            profile.update(self.performance_profile)
+        for pragma, value in profile.items():
+            # the journal mode is stored in the file, and readers don't write
+            if read_only and pragma in ["journal_mode", "synchronous"]:
+                continue
+            logger.debug(f"Setting PRAGMA {pragma}={value}")
+            con.execute(f"PRAGMA {pragma}={value};").fetchall()
+
+    def _connection_for(self, query: str) -> sqlite3.Connection:
+        # Plain SELECTs can use the reader, unless the write connection holds
+        # uncommitted changes that the SELECT needs to see.
+        if (
+            self.reader_con is not None
+            and not self.con.in_transaction
+            and query.lstrip()[:6].upper() == "SELECT"
+        ):
+            return self.reader_con
+        return self.con
 
     def connect(self, database) -> None:
         self.con = sqlite3.connect(
@@ -10050,7 +12311,7 @@ class Sqlite(SQLDriver):
         if not silent:
             logger.info(f"Executing query: {query} {values}")
 
-        cursor = self.con.cursor()
+        cursor = self._connection_for(query).cursor()
         exception = None
 
         try:
@@ -10081,9 +12342,41 @@ class Sqlite(SQLDriver):
             logger.info(f"Loading script {script} into database.")
             self.con.executescript(file.read())
 
+    def begin(self) -> None:
+        # sqlite3 only opens a transaction before INSERT/UPDATE/DELETE, and releasing
+        # the outermost savepoint would commit
+        if not self.con.in_transaction:
+            self.execute("BEGIN", silent=True)
+
+    def change_tokens(self, tables: List[str]) -> Dict[str, Any]:
+        # data_version moves whenever another connection commits to the database. Only
+        # then are the tables with a probe in change_probes checked, the others all
+        # use the version itself. Nothing is probed while a transaction is open.
+        if self.con.in_transaction:
+            return {}
+        rows = self.execute("PRAGMA data_version;", silent=True)
+        if not len(rows):
+            return {}
+        version = rows.iloc[0, 0]
+        if version != self._data_version:
+            self._data_version = version
+            probed = [t for t in tables if t in (self.change_probes or {})]
+            self._probe_tokens = super().change_tokens(probed)
+        return {t: self._probe_tokens.get(t, version) for t in tables}
+
+    @contextlib.contextmanager
+    def _probe_connection(self):
+        # Another connection's commits are visible outside of a transaction, so there
+        # is no need for a connection of its own. Wait for an open transaction to end,
+        # rather than ending it.
+        yield not self.con.in_transaction
+
     def close(self) -> None:
         # Only do cleanup if this is not an imported database
         if not self._imported_database:
+            if self.reader_con is not None:
+                self.reader_con.close()
+                self.reader_con = None
             # optimize the database for long-term benefits
             if self._database != ":memory:":
                 q = "PRAGMA optimize;"
@@ -10091,6 +12384,19 @@ class Sqlite(SQLDriver):
             # Close the connection
             self.con.close()
 
+    def enforces_foreign_keys(self) -> bool:
+        rows = self.execute("PRAGMA foreign_keys;", silent=True)
+        return bool(len(rows) and rows.iloc[0, 0])
+
+    def schema_fingerprint(self) -> Union[str, None]:
+        # In-memory and passed in databases can't be identified across runs
+        if self._imported_database or self._database == ":memory:":
+            return None
+        return self._query_fingerprint("PRAGMA schema_version;")
+
+    def schema_cache_key(self) -> str:
+        return f"{self.NAME}:{os.path.abspath(self._database)}"
+
     def get_tables(self):
         q = (
             "SELECT name FROM sqlite_master "
@@ -10103,6 +12409,36 @@ class Sqlite(SQLDriver):
         # Return a list of column names
         q = f"PRAGMA table_xinfo({self.quote_table(table)})"
         rows = self.execute(q, silent=True)
+        return self._column_info_from_rows(table, rows)
+
+    def bulk_column_info(self) -> Dict[str, ColumnInfo]:
+        # Join the table-valued pragma against every table in a single query
+        q = (
+            "SELECT m.name AS table_name, x.* FROM sqlite_master m "
+            "JOIN pragma_table_xinfo(m.name) x "
+            "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite%' "
+            "ORDER BY m.name, x.cid;"
+        )
+        rows = self.execute(q, silent=True)
+        if rows.empty:
+            return {}
+        return {
+            table: self._column_info_from_rows(table, table_rows)
+            for table, table_rows in rows.groupby("table_name", sort=False)
+        }
+
+    def bulk_pk_column(self) -> Dict[str, Union[str, None]]:
+        q = (
+            "SELECT m.name AS table_name, x.name FROM sqlite_master m "
+            "JOIN pragma_table_info(m.name) x "
+            "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite%' AND x.pk = 1;"
+        )
+        rows = self.execute(q, silent=True)
+        if rows.empty:
+            return {}
+        return dict(zip(rows["table_name"], rows["name"]))
+
+    def _column_info_from_rows(self, table: str, rows: pd.DataFrame) -> ColumnInfo:
         names = []
         col_info = ColumnInfo(self, table)
         for _, row in rows.iterrows():
@@ -10115,7 +12451,8 @@ class Sqlite(SQLDriver):
             names.append(name)
             domain = row["type"]
             notnull = row["notnull"]
-            default = row["dflt_value"]
+            # a missing default may come back as NaN rather than None
+            default = None if pd.isna(row["dflt_value"]) else row["dflt_value"]
             pk = row["pk"]
             generated = row["hidden"] in [2, 3]
             col_info.append(
@@ -10139,29 +12476,31 @@ class Sqlite(SQLDriver):
 
     def get_relationships(self):
         # Return a list of dicts {from_table,to_table,from_column,to_column,requery}
+        # Join the table-valued pragma against every table in a single query
         relationships = []
-        tables = self.get_tables()
-        for from_table in tables:
-            rows = self.execute(
-                f"PRAGMA foreign_key_list({self.quote_table(from_table)})", silent=True
-            )
-
-            for _, row in rows.iterrows():
-                dic = {}
-                # Add the relationship if it's in the requery list
-                if row["on_update"] == "CASCADE":
-                    dic["update_cascade"] = True
-                else:
-                    dic["update_cascade"] = False
-                if row["on_delete"] == "CASCADE":
-                    dic["delete_cascade"] = True
-                else:
-                    dic["delete_cascade"] = False
-                dic["from_table"] = from_table
-                dic["to_table"] = row["table"]
-                dic["from_column"] = row["from"]
-                dic["to_column"] = row["to"]
-                relationships.append(dic)
+        q = (
+            'SELECT m.name AS from_table, f."table", f."from", f."to", f.on_update, '
+            "f.on_delete FROM sqlite_master m "
+            "JOIN pragma_foreign_key_list(m.name) f "
+            "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite%';"
+        )
+        rows = self.execute(q, silent=True)
+        for row in rows.to_dict("records"):
+            dic = {}
+            # Add the relationship if it's in the requery list
+            if row["on_update"] == "CASCADE":
+                dic["update_cascade"] = True
+            else:
+                dic["update_cascade"] = False
+            if row["on_delete"] == "CASCADE":
+                dic["delete_cascade"] = True
+            else:
+                dic["delete_cascade"] = False
+            dic["from_table"] = row["from_table"]
+            dic["to_table"] = row["table"]
+            dic["from_column"] = row["from"]
+            dic["to_column"] = row["to"]
+            relationships.append(dic)
         return relationships
 
     def _get_column_class(self, domain) -> Union[ColumnClass, None]:
@@ -10216,8 +12555,22 @@ class Flatfile(Sqlite):
     and manipulated like any other database file.  Each timem records are saved, the
     contents of the internal SQlite database are written back out to the file. This
     makes working with flatfile data as easy and consistent as any other database.
+
+    Besides delimited text, JSON Lines files are supported, as are Parquet and Feather
+    files when pyarrow is installed. These are loaded column-wise with their column
+    types intact, and written back out in the same format.
     """
 
+    # File extensions used to infer the file_format, anything else is delimited text
+    FILE_FORMATS: ClassVar[Dict[str, str]] = {
+        ".jsonl": "jsonl",
+        ".ndjson": "jsonl",
+        ".parquet": "parquet",
+        ".pq": "parquet",
+        ".feather": "feather",
+        ".arrow": "feather",
+    }
+
     def __init__(
         self,
         file_path: str,
@@ -10226,6 +12579,12 @@ class Flatfile(Sqlite):
         header_row_num: int = 0,
         table: str = None,
         pk_col: str = None,
+        *,
+        batch_size: int = 10000,
+        fast_load: bool = True,
+        progress_callback: Callable[[int], None] = None,
+        write_delay: int = 0,
+        file_format: Literal["csv", "jsonl", "parquet", "feather"] = None,
     ) -> None:
         r"""Create a new Flatfile driver instance.
 
@@ -10248,6 +12607,23 @@ class Flatfile(Sqlite):
                   column with this name will be created with AUTO INCREMENT and PRIMARY
                   KEY set. As above, the virtual primary key column that was created
                   will not be written to the flatfile.
+            batch_size: (optional) Number of flatfile lines inserted into the internal
+                SQLite database per `executemany()` call while loading. Defaults to
+                10000.
+            fast_load: (optional) Default:True. Turn off journaling and synchronous
+                writes on the internal in-memory database while loading. The flatfile
+                itself is the durable copy, so nothing is lost by doing so.
+            progress_callback: (optional) A callable that is passed the number of lines
+                loaded so far after each batch is inserted.
+            write_delay: (optional) Milliseconds to wait after a save before writing the
+                flatfile back out. Saves made during this time are coalesced into a
+                single write. Pending changes are also written by
+                `Flatfile.write_pending()`, `Flatfile.close()` and `Form.close()`.
+                Defaults to 0, which writes the flatfile on every save.
+            file_format: (optional) One of 'csv', 'jsonl', 'parquet' or 'feather'.
+                Inferred from the extension of file_path if not supplied, defaulting to
+                'csv'. The delimiter, quotechar and header_row_num parameters only apply
+                to 'csv'. 'parquet' and 'feather' require pyarrow.
         """
         self.file_path = file_path
         self.delimiter = delimiter
@@ -10256,6 +12632,23 @@ class Flatfile(Sqlite):
         self.pk_col = pk_col if pk_col is not None else "pk"
         self.pk_col_is_virtual = False
         self.table = table if table is not None else "Flatfile"
+        self.batch_size = batch_size
+        self.fast_load = fast_load
+        self.progress_callback = progress_callback
+        self.write_delay = write_delay
+        self.file_format = file_format or self.FILE_FORMATS.get(
+            os.path.splitext(str(file_path))[1].lower(), "csv"
+        )
+        if self.file_format not in ["csv", *self.FILE_FORMATS.values()]:
+            raise ValueError(f"Unsupported file_format: {self.file_format}")
+        # pandas dtypes of a columnar flatfile, restored when writing it back out
+        self._dtypes: Dict[str, Any] = {}
+        # Whether saved records still need to be written out, and the pending
+        # tk.after() that will do it.
+        self._dirty: bool = False
+        self._dirty_before_unit_of_work: bool = False
+        self._write_root: tk.Tk = None
+        self._write_after_id: str = None
 
         # First up the SQLite driver that we derived from
         super().__init__(":memory:")  # use an in-memory database
@@ -10269,20 +12662,14 @@ class Flatfile(Sqlite):
         self.connect(":memory:")
 
         self.con.row_factory = sqlite3.Row
+        self._file_signature = self._stat_file()
 
-        # Store any text up to the header line, so they can be restored
-        self.pre_header = []
-
-        # Open the CSV file and read the header row to get column names
-        with open(self.file_path, "r") as f:
-            reader = csv.reader(f, delimiter=self.delimiter, quotechar=self.quotechar)
-            # skip lines as determined by header_row_num
-            for _i in range(self.header_row_num):
-                self.pre_header.append(next(reader))
-
-            # Grab the header row information
-            self.columns = next(reader)
+        if self.file_format != "csv":
+            self._load_columnar()
+            return
+        self._load_file()
 
+    def _create_table(self, domains: Dict[str, str]) -> None:
         if self.pk_col not in self.columns:
             # The pk column was not found, we will make it virutal
             self.columns.insert(0, self.pk_col)
@@ -10294,7 +12681,7 @@ class Flatfile(Sqlite):
             if col == self.pk_col:
                 q_cols += f'{col} {"INTEGER PRIMARY KEY AUTOINCREMENT" if self.pk_col_is_virtual else "PRIMARY KEY"}'  # fmt: skip # noqa: E501
             else:
-                q_cols += f"{col} TEXT"
+                q_cols += f"{col} {domains[col]}"
 
             if col != self.columns[-1]:
                 q_cols += ", "
@@ -10302,26 +12689,122 @@ class Flatfile(Sqlite):
         query = f"CREATE TABLE {self.table} ({q_cols})"
         self.execute(query)
 
-        # Load the CSV data into the table
+        # We only want to insert the pk_column if it is not virtual. We will remove
+        # it now, as it has already served its purpose to create the table
+        if self.pk_col_is_virtual:
+            self.columns.remove(self.pk_col)
+
+    def _load_columnar(self) -> None:
+        # Read the whole file column-wise with pandas, then create a typed table
+        logger.info(f"Loading {self.file_path} into {self.table}")
+        if self.file_format == "jsonl":
+            rows = pd.read_json(self.file_path, lines=True)
+        elif self.file_format == "parquet":
+            rows = pd.read_parquet(self.file_path)
+        else:
+            rows = pd.read_feather(self.file_path)
+
+        self.columns = [str(col) for col in rows.columns]
+        rows.columns = self.columns
+        self._dtypes = rows.dtypes.to_dict()
+        self._create_table(
+            {col: self._dtype_domain(dtype) for col, dtype in self._dtypes.items()}
+        )
+
+        # sqlite3 only understands python types, so convert numpy values and NaN/NaT
+        for col, dtype in self._dtypes.items():
+            if pd.api.types.is_datetime64_any_dtype(dtype):
+                rows[col] = rows[col].dt.strftime(DATETIME_FORMAT)
+        rows = rows.astype(object).where(rows.notna(), None)
+        query = (
+            f'INSERT INTO {self.table} ({", ".join(self.columns)}) VALUES '
+            f'({", ".join(["?" for _ in self.columns])})'
+        )
+        self._load_rows(query, rows.itertuples(index=False, name=None))
+
+    @staticmethod
+    def _dtype_domain(dtype) -> str:
+        # Map a pandas dtype to a domain that Sqlite._get_column_class() understands
+        if pd.api.types.is_bool_dtype(dtype):
+            return "BOOLEAN"
+        if pd.api.types.is_integer_dtype(dtype):
+            return "INTEGER"
+        if pd.api.types.is_float_dtype(dtype):
+            return "REAL"
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return "TIMESTAMP"
+        return "TEXT"
+
+    def _load_file(self) -> None:
+        # Read the header row to get column names, then load the CSV data into the
+        # table in the same pass over the file
         with open(self.file_path, "r") as f:
             reader = csv.reader(f, delimiter=self.delimiter, quotechar=self.quotechar)
-            # advance to past the header column
-            for _i in range(self.header_row_num + 1):
-                next(reader)
+            # Store any text up to the header line, so they can be restored
+            self.pre_header = [next(reader) for _i in range(self.header_row_num)]
 
-            # We only want to insert the pk_column if it is not virtual. We will remove
-            # it now, as it has already served its purpose to create the table
-            if self.pk_col_is_virtual:
-                self.columns.remove(self.pk_col)
+            # Grab the header row information
+            self.columns = next(reader)
+            self._create_table(dict.fromkeys(self.columns, "TEXT"))
 
             query = (
                 f'INSERT INTO {self.table} ({", ".join(self.columns)}) VALUES '
                 f'({", ".join(["?" for _ in self.columns])})'
             )
-            for row in reader:
-                self.execute(query, row)
-
+            self._load_rows(query, reader)
+
+    def _load_rows(self, query: str, reader) -> None:
+        # Insert the flatfile lines in batches with executemany(). sqlite3 opens a
+        # single transaction on the first INSERT, which stays open until the commit()
+        # at the end. Individual lines are not logged.
+        if self.fast_load:
+            journal_mode = self.con.execute("PRAGMA journal_mode;").fetchone()[0]
+            synchronous = self.con.execute("PRAGMA synchronous;").fetchone()[0]
+            self.con.execute("PRAGMA journal_mode=OFF;")
+            self.con.execute("PRAGMA synchronous=OFF;")
+
+        logger.info(f"Loading {self.file_path} into {self.table}")
+        cursor = self.con.cursor()
+        loaded = 0
+        while True:
+            batch = list(itertools.islice(reader, self.batch_size))
+            if not batch:
+                break
+            loaded += len(batch)
+            # Blank and short/long lines can never be inserted, skip them up front
+            rows = [row for row in batch if len(row) == len(self.columns)]
+            for row in batch:
+                if row and len(row) != len(self.columns):
+                    logger.warning(
+                        f"Skipping line in {self.file_path}: expected "
+                        f"{len(self.columns)} fields, got {len(row)}, line: {row}"
+                    )
+            # executemany() keeps the lines inserted before a failing one, so count
+            # them to skip just the offending line and carry on with the rest. A
+            # savepoint can't be used instead, rollback is undefined without a journal.
+            while rows:
+                inserted = self.con.total_changes
+                try:
+                    cursor.executemany(query, rows)
+                    break
+                except sqlite3.Error as e:
+                    inserted = self.con.total_changes - inserted
+                    logger.warning(
+                        f"Skipping line in {self.file_path}: "
+                        f"{type(e).__name__}: {e}, line: {rows[inserted]}"
+                    )
+                    rows = rows[inserted + 1 :]
+            if self.progress_callback is not None:
+                self.progress_callback(loaded)
+        cursor.close()
         self.commit()  # commit them all at the end
+        logger.info(f"Loaded {loaded} lines from {self.file_path}")
+
+        # Without a journal, rolling back a save would leave the table corrupted.
+        # The journal mode can't be changed inside a transaction, hence after commit.
+        if self.fast_load:
+            self.con.execute(f"PRAGMA journal_mode={journal_mode};")
+            self.con.execute(f"PRAGMA synchronous={synchronous};")
 
     def _import_required_modules(self) -> None:
         global csv  # noqa PLW0603
@@ -10332,6 +12815,17 @@ class Flatfile(Sqlite):
         except ModuleNotFoundError as e:
             self._import_failed(e)
 
+        if self.file_format in ["parquet", "feather"]:
+            try:
+                import pyarrow  # noqa: F401
+            except ModuleNotFoundError as e:
+                self.REQUIRES = ["pyarrow"]
+                self._import_failed(e)
+
+    def close(self) -> None:
+        self.write_pending()
+        super().close()
+
     def save_record(
         self, dataset: DataSet, changed_row: dict, where_clause: str = None
     ) -> pd.DataFrame:
@@ -10339,37 +12833,170 @@ class Flatfile(Sqlite):
         result = super().save_record(dataset, changed_row, where_clause)
 
         if result.attrs["exception"] is None:
-            # No it is safe to write our data back out to the CSV file
+            # Mark the file as dirty, and schedule the write
+            self._dirty = True
+            self._schedule_write(dataset)
 
-            # Update the DataSet object's DataFra,e with the changes, so then
-            # the entire DataFrame can be written back to file sequentially
-            dataset.rows.iloc[dataset.current.index] = pd.Series(changed_row)
+        return result
 
-            # open the CSV file for writing
-            with open(self.file_path, "w", newline="\n") as csvfile:
-                # create a csv writer object
-                writer = csv.writer(
-                    csvfile, delimiter=self.delimiter, quotechar=self.quotechar
-                )
+    def write_pending(self) -> None:
+        """Write any pending changes back out to the flatfile.
+
+        The records are read back from the internal SQLite database, so only saved
+        changes are written. The file is written to a temporary file next to the
+        flatfile, which then replaces the flatfile in a single step, so a crash
+        mid-write can never leave a partially written flatfile behind. Inside a unit of
+        work nothing is written until it is committed, see
+        `SQLDriver.end_unit_of_work()`.
+
+        Returns:
+            None
+        """
+        if self.in_unit_of_work:
+            return
+        if self._write_after_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self._write_root.after_cancel(self._write_after_id)
+            self._write_after_id = None
+            self._write_root = None
+
+        if not self._dirty:
+            return
+        self._write_file(self._saved_rows())
+        # only clear the flag once written, so a failed write is retried
+        self._dirty = False
+
+    def _saved_rows(self) -> pd.DataFrame:
+        # Read every record from the internal table, in the order of the flatfile
+        columns = ", ".join(self.quote_column(c) for c in self.columns)
+        with self.uncached():
+            rows = self.execute(
+                f"SELECT {columns} FROM {self.quote_table(self.table)} ORDER BY rowid",
+                silent=True,
+            )
+        if rows.attrs["exception"] is not None:
+            raise rows.attrs["exception"]
+        return rows
+
+    def _write_scheduled(self) -> None:
+        # Called by tk.after(). Tk would only print a traceback to stderr, so log the
+        # error instead; the changes stay pending and are written by the next write.
+        self._write_after_id = None
+        self._write_root = None
+        try:
+            self.write_pending()
+        except Exception as e:  # noqa: BLE001
+            logger.error(
+                f"Unable to write {self.file_path}: {type(e).__name__}: {e}"
+            )
 
-                # Skip the number of lines defined by header_row_num.
-                # Write out the stored pre_header lines
-                for line in self.pre_header:
-                    writer.writerow(line)
-                # write the header row
-                writer.writerow(list(self.columns))
+    def change_tokens(self, tables: List[str]) -> Dict[str, Any]:
+        # The flatfile on disk is the shared copy, so its modification time and size
+        # tell if someone else changed it. Reload it, unless we are about to write our
+        # own changes over it anyway.
+        signature = self._stat_file()
+        if signature != self._file_signature and not self._dirty:
+            self._reload_file()
+            self._file_signature = signature
+        return dict.fromkeys(tables, self._file_signature)
+
+    def _stat_file(self) -> Union[Tuple[int, int], None]:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _reload_file(self) -> None:
+        # Replace the internal table with the current contents of the flatfile
+        logger.info(f"{self.file_path} changed on disk, reloading it")
+        self.execute(f"DROP TABLE {self.table}")
+        if self.file_format != "csv":
+            self._load_columnar()
+            return
+        self._load_file()
 
-                # write the DataFrame out.
-                # Use our columns to exclude the possible virtual pk
-                rows = []
-                for _, row in dataset.rows.iterrows():
-                    rows.append([row[c] for c in self.columns])
+    def begin_unit_of_work(self) -> None:
+        super().begin_unit_of_work()
+        self._dirty_before_unit_of_work = self._dirty
 
-                logger.debug(f"Writing the following data to {self.file_path}")
-                logger.debug(rows)
-                writer.writerows(rows)
+    def end_unit_of_work(self, commit: bool = True) -> None:
+        super().end_unit_of_work(commit)
+        if not commit:
+            # the saves made during the unit of work were rolled back
+            self._dirty = self._dirty_before_unit_of_work
 
-        return result
+    def _schedule_write(self, dataset: DataSet) -> None:
+        # The file is written once the unit of work is committed
+        if self.in_unit_of_work:
+            return
+        window = dataset.frm.window
+        # Without a window there is no event loop to defer the write to
+        if not self.write_delay or not window:
+            self.write_pending()
+            return
+
+        # restart the countdown, so a burst of saves is written once
+        if self._write_after_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self._write_root.after_cancel(self._write_after_id)
+        self._write_root = window.TKroot
+        self._write_after_id = self._write_root.after(
+            self.write_delay, self._write_scheduled
+        )
+
+    def _write_file(self, rows: pd.DataFrame) -> None:
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            if self.file_format == "csv":
+                self._write_csv(fd, rows)
+            else:
+                os.close(fd)
+                self._write_columnar(tmp_path, rows)
+
+            # keep the permissions of the original flatfile
+            with contextlib.suppress(OSError):
+                shutil.copymode(self.file_path, tmp_path)
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+        # our own write is not an external change
+        self._file_signature = self._stat_file()
+
+    def _write_csv(self, fd: int, rows: pd.DataFrame) -> None:
+        with os.fdopen(fd, "w", newline="\n") as csvfile:
+            # create a csv writer object
+            writer = csv.writer(
+                csvfile, delimiter=self.delimiter, quotechar=self.quotechar
+            )
+
+            # Write out the stored pre_header lines, then the header row
+            writer.writerows(self.pre_header)
+            writer.writerow(list(self.columns))
+
+            # write the DataFrame out.
+            # Use our columns to exclude the possible virtual pk
+            logger.debug(f"Writing {len(rows)} rows to {self.file_path}")
+            writer.writerows(rows[self.columns].itertuples(index=False, name=None))
+
+    def _write_columnar(self, path: str, rows: pd.DataFrame) -> None:
+        # Use our columns to exclude the possible virtual pk
+        rows = rows[self.columns].reset_index(drop=True)
+        # Restore the column types the file was loaded with
+        for column, dtype in self._dtypes.items():
+            with contextlib.suppress(ValueError, TypeError):
+                rows[column] = rows[column].astype(dtype)
+
+        logger.debug(f"Writing {len(rows)} rows to {self.file_path}")
+        if self.file_format == "jsonl":
+            rows.to_json(path, orient="records", lines=True, date_format="iso")
+        elif self.file_format == "parquet":
+            rows.to_parquet(path, index=False)
+        elif self.file_format == "feather":
+            rows.to_feather(path)
 
 
 # --------------------------------------------------------------------------------------
@@ -10518,6 +13145,25 @@ class Mysql(SQLDriver):
         self.con.commit()
         cursor.close()
 
+    def enforces_foreign_keys(self) -> bool:
+        rows = self.execute("SELECT @@foreign_key_checks AS fk_checks;", silent=True)
+        return bool(len(rows) and rows.iloc[0]["fk_checks"])
+
+    def schema_fingerprint(self) -> Union[str, None]:
+        # Hash the column and foreign key definitions. GROUP_CONCAT() is truncated at
+        # group_concat_max_len, so the CRC32 of each row is summed instead.
+        query = (
+            "SELECT COUNT(*), SUM(CRC32(CONCAT_WS(':', TABLE_NAME, ORDINAL_POSITION, "
+            "COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_DEFAULT IS NULL, "
+            "IFNULL(COLUMN_DEFAULT, '')))), "
+            "(SELECT SUM(CRC32(CONCAT_WS(':', TABLE_NAME, CONSTRAINT_NAME, "
+            "REFERENCED_TABLE_NAME, UPDATE_RULE, DELETE_RULE))) "
+            "FROM information_schema.REFERENTIAL_CONSTRAINTS "
+            "WHERE CONSTRAINT_SCHEMA = %s) "
+            "FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = %s"
+        )
+        return self._query_fingerprint(query, [self.database] * 2)
+
     def get_tables(self):
         query = (
             "SELECT TABLE_NAME FROM information_schema.tables WHERE table_schema = %s"
@@ -10529,6 +13175,34 @@ class Mysql(SQLDriver):
         # Return a list of column names
         query = f"SELECT * FROM information_schema.columns WHERE table_name = '{table}'"
         rows = self.execute(query, silent=True)
+        return self._column_info_from_rows(table, rows)
+
+    def bulk_column_info(self) -> Dict[str, ColumnInfo]:
+        query = (
+            "SELECT * FROM information_schema.columns WHERE table_schema = %s "
+            "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+        )
+        rows = self.execute(query, [self.database], silent=True)
+        if rows.empty:
+            return {}
+        return {
+            table: self._column_info_from_rows(table, table_rows)
+            for table, table_rows in rows.groupby("TABLE_NAME", sort=False)
+        }
+
+    def bulk_pk_column(self) -> Dict[str, Union[str, None]]:
+        query = (
+            "SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.key_column_usage "
+            "WHERE table_schema = %s AND CONSTRAINT_NAME = 'PRIMARY' "
+            "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+        )
+        rows = self.execute(query, [self.database], silent=True)
+        pk_columns = {}
+        for row in rows.to_dict("records"):
+            pk_columns.setdefault(row["TABLE_NAME"], row["COLUMN_NAME"])
+        return pk_columns
+
+    def _column_info_from_rows(self, table: str, rows: pd.DataFrame) -> ColumnInfo:
         col_info = ColumnInfo(self, table)
         rows = rows.fillna("")
         for _, row in rows.iterrows():
@@ -10589,32 +13263,34 @@ class Mysql(SQLDriver):
 
     def get_relationships(self):
         # Return a list of dicts {from_table,to_table,from_column,to_column,requery}
-        tables = self.get_tables()
+        # Join the constraint rules in, rather than looking them up per foreign key
         relationships = []
-        for from_table in tables:
-            query = (
-                "SELECT * FROM information_schema.key_column_usage WHERE "
-                "referenced_table_name IS NOT NULL AND table_name = %s"
-            )
-            rows = self.execute(query, (from_table,), silent=True)
-
-            for _, row in rows.iterrows():
-                dic = {}
-                # Get the constraint information
-                on_update, on_delete = self.constraint(row["CONSTRAINT_NAME"])
-                if on_update == "CASCADE":
-                    dic["update_cascade"] = True
-                else:
-                    dic["update_cascade"] = False
-                if on_delete == "CASCADE":
-                    dic["delete_cascade"] = True
-                else:
-                    dic["delete_cascade"] = False
-                dic["from_table"] = row["TABLE_NAME"]
-                dic["to_table"] = row["REFERENCED_TABLE_NAME"]
-                dic["from_column"] = row["COLUMN_NAME"]
-                dic["to_column"] = row["REFERENCED_COLUMN_NAME"]
-                relationships.append(dic)
+        query = (
+            "SELECT k.TABLE_NAME, k.COLUMN_NAME, k.REFERENCED_TABLE_NAME, "
+            "k.REFERENCED_COLUMN_NAME, r.UPDATE_RULE, r.DELETE_RULE "
+            "FROM information_schema.key_column_usage k "
+            "JOIN information_schema.referential_constraints r "
+            "ON r.CONSTRAINT_SCHEMA = k.CONSTRAINT_SCHEMA "
+            "AND r.CONSTRAINT_NAME = k.CONSTRAINT_NAME "
+            "WHERE k.table_schema = %s AND k.referenced_table_name IS NOT NULL"
+        )
+        rows = self.execute(query, [self.database], silent=True)
+
+        for row in rows.to_dict("records"):
+            dic = {}
+            if row["UPDATE_RULE"] == "CASCADE":
+                dic["update_cascade"] = True
+            else:
+                dic["update_cascade"] = False
+            if row["DELETE_RULE"] == "CASCADE":
+                dic["delete_cascade"] = True
+            else:
+                dic["delete_cascade"] = False
+            dic["from_table"] = row["TABLE_NAME"]
+            dic["to_table"] = row["REFERENCED_TABLE_NAME"]
+            dic["from_column"] = row["COLUMN_NAME"]
+            dic["to_column"] = row["REFERENCED_COLUMN_NAME"]
+            relationships.append(dic)
         return relationships
 
     # Not required for SQLDriver
@@ -10635,7 +13311,12 @@ class Mysql(SQLDriver):
         return update_rule, delete_rule
 
     def _insert_duplicate_record(
-        self, table: str, columns: str, pk_column: str, pk: int
+        self,
+        table: str,
+        columns: str,
+        pk_column: str,
+        pk: int,
+        select_columns: str = None,
     ) -> pd.DataFrame:
         """Inserts duplicate record, sets attrs["lastrowid"] to new record's pk.
 
@@ -10647,10 +13328,12 @@ class Mysql(SQLDriver):
             columns: Escaped and comman (,) seperated list of columns
             pk_column: Non-escaped pk_column
             pk: Primary key of record
+            select_columns: (optional) The expressions to select for `columns`, if
+                not the columns themselves
         """
         query = (
             f"INSERT INTO {table} ({columns}) "
-            f"SELECT {columns} FROM {table} "
+            f"SELECT {select_columns or columns} FROM {table} "
             f"WHERE {self.quote_column(pk_column)} = {pk};"
         )
         res = self.execute(query)
@@ -10851,6 +13534,27 @@ class Postgres(SQLDriver):
         self.con.commit()
         cursor.close()
 
+    def enforces_foreign_keys(self) -> bool:
+        return True
+
+    def schema_fingerprint(self) -> Union[str, None]:
+        # Hash the column and constraint definitions straight from pg_catalog
+        query = (
+            "SELECT md5(string_agg(concat_ws(':', c.relname, a.attnum, a.attname, "
+            "format_type(a.atttypid, a.atttypmod), a.attnotnull, "
+            "quote_nullable(pg_get_expr(d.adbin, d.adrelid))), ',' "
+            "ORDER BY c.relname, a.attnum)), "
+            "(SELECT md5(string_agg(concat_ws(':', conrelid::regclass, conname, "
+            "pg_get_constraintdef(oid)), ',' ORDER BY conrelid::regclass::text, "
+            "conname)) FROM pg_constraint "
+            "WHERE connamespace = 'public'::regnamespace) "
+            "FROM pg_attribute a JOIN pg_class c ON c.oid = a.attrelid "
+            "LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum "
+            "WHERE c.relnamespace = 'public'::regnamespace AND c.relkind = 'r' "
+            "AND a.attnum > 0 AND NOT a.attisdropped;"
+        )
+        return self._query_fingerprint(query)
+
     def get_tables(self):
         query = (
             "SELECT table_name FROM information_schema.tables WHERE "
@@ -10867,8 +13571,43 @@ class Postgres(SQLDriver):
             "ORDER BY ordinal_position"
         )
         rows = self.execute(query, silent=True)
+        return self._column_info_from_rows(table, rows, self.pk_column(table))
+
+    def bulk_column_info(self) -> Dict[str, ColumnInfo]:
+        query = (
+            "SELECT * FROM information_schema.columns WHERE table_schema = 'public' "
+            "ORDER BY table_name, ordinal_position"
+        )
+        rows = self.execute(query, silent=True)
+        if rows.empty:
+            return {}
+        pk_columns = self.bulk_pk_column()
+        return {
+            table: self._column_info_from_rows(
+                table, table_rows, pk_columns.get(table)
+            )
+            for table, table_rows in rows.groupby("table_name", sort=False)
+        }
+
+    def bulk_pk_column(self) -> Dict[str, Union[str, None]]:
+        query = (
+            "SELECT tc.table_name, kcu.column_name FROM "
+            "information_schema.table_constraints tc JOIN "
+            "information_schema.key_column_usage kcu ON tc.constraint_name = "
+            "kcu.constraint_name AND tc.table_schema = kcu.table_schema "
+            "WHERE tc.constraint_type = 'PRIMARY KEY' AND tc.table_schema = 'public' "
+            "ORDER BY tc.table_name, kcu.ordinal_position;"
+        )
+        rows = self.execute(query, silent=True)
+        pk_columns = {}
+        for row in rows.to_dict("records"):
+            pk_columns.setdefault(row["table_name"], row["column_name"])
+        return pk_columns
+
+    def _column_info_from_rows(
+        self, table: str, rows: pd.DataFrame, pk_column: Union[str, None]
+    ) -> ColumnInfo:
         col_info = ColumnInfo(self, table)
-        pk_column = self.pk_column(table)
         for _, row in rows.iterrows():
             name = row["column_name"]
             domain = row["data_type"].upper()
@@ -10881,7 +13620,8 @@ class Postgres(SQLDriver):
             elif col_class == StrCol:
                 domain_args = [row["character_maximum_length"]]
             notnull = row["is_nullable"] != "YES"
-            default = row["column_default"]
+            # a missing default may come back as NaN rather than None
+            default = None if pd.isna(row["column_default"]) else row["column_default"]
             # Fix the default value by removing the datatype that is appended to the end
             if default is not None and "::" in default:
                 default = default[: default.index("::")]
@@ -10913,40 +13653,38 @@ class Postgres(SQLDriver):
 
     def get_relationships(self):
         # Return a list of dicts {from_table,to_table,from_column,to_column,requery}
-        tables = self.get_tables()
+        # All foreign keys referencing a table in the public schema, in one query
         relationships = []
-        for from_table in tables:
-            query = (
-                "SELECT conname, conrelid::regclass, confrelid::regclass, "
-                "confupdtype, confdeltype, a1.attname AS column_name, a2.attname "
-                "AS referenced_column_name "
-                "FROM pg_constraint "
-                "JOIN pg_attribute AS a1 ON conrelid = a1.attrelid AND "
-                "a1.attnum = ANY(conkey) "
-                "JOIN pg_attribute AS a2 ON confrelid = a2.attrelid AND "
-                "a2.attnum = ANY(confkey) "
-                f"WHERE confrelid = '\"{from_table}\"'::regclass AND contype = 'f'"
-            )
+        query = (
+            "SELECT conname, conrelid::regclass, confrelid::regclass, "
+            "confupdtype, confdeltype, a1.attname AS column_name, a2.attname "
+            "AS referenced_column_name "
+            "FROM pg_constraint "
+            "JOIN pg_class AS rc ON confrelid = rc.oid "
+            "JOIN pg_attribute AS a1 ON conrelid = a1.attrelid AND "
+            "a1.attnum = ANY(conkey) "
+            "JOIN pg_attribute AS a2 ON confrelid = a2.attrelid AND "
+            "a2.attnum = ANY(confkey) "
+            "WHERE rc.relnamespace = 'public'::regnamespace AND contype = 'f'"
+        )
 
-            rows = self.execute(query, (from_table,), silent=True)
+        rows = self.execute(query, silent=True)
 
-            for _, row in rows.iterrows():
-                dic = {}
-                # Get the constraint information
-                # constraint = self.constraint(row['conname'])
-                if row["confupdtype"] == "c":
-                    dic["update_cascade"] = True
-                else:
-                    dic["update_cascade"] = False
-                if row["confdeltype"] == "c":
-                    dic["delete_cascade"] = True
-                else:
-                    dic["delete_cascade"] = False
-                dic["from_table"] = row["conrelid"].strip('"')
-                dic["to_table"] = row["confrelid"].strip('"')
-                dic["from_column"] = row["column_name"]
-                dic["to_column"] = row["referenced_column_name"]
-                relationships.append(dic)
+        for row in rows.to_dict("records"):
+            dic = {}
+            if row["confupdtype"] == "c":
+                dic["update_cascade"] = True
+            else:
+                dic["update_cascade"] = False
+            if row["confdeltype"] == "c":
+                dic["delete_cascade"] = True
+            else:
+                dic["delete_cascade"] = False
+            dic["from_table"] = row["conrelid"].strip('"')
+            dic["to_table"] = row["confrelid"].strip('"')
+            dic["from_column"] = row["column_name"]
+            dic["to_column"] = row["referenced_column_name"]
+            relationships.append(dic)
         return relationships
 
     def min_pk(self, table: str, pk_column: str) -> int:
@@ -10966,6 +13704,13 @@ class Postgres(SQLDriver):
         return rows.iloc[0]["max_pk"].tolist()
 
     def next_pk(self, table: str, pk_column: str) -> int:
+        # Deprecated, see SQLDriver.next_pk(). Note that this consumes a sequence value.
+        warnings.warn(
+            "Postgres.next_pk() is deprecated, new records use "
+            "SQLDriver.temporary_pk() until the database assigns their key",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         # Working with case-sensitive tables is painful in Postgres.  First, the
         # sequence must be quoted in a manner similar to tables, then the quoted
         # sequence name has to be also surrounded in single quotes to be treated
@@ -10979,25 +13724,33 @@ class Postgres(SQLDriver):
         return rows.iloc[0]["nextval"].tolist()
 
     def insert_record(self, table: str, pk: int, pk_column: str, row: dict):
-        # insert_record() for Postgres is a little different from the rest. Instead of
-        # relying on an autoincrement, we first already "reserved" a primary key
-        # earlier, so we will use it directly quote appropriately
+        # insert_record() for Postgres is a little different from the rest. The cursor
+        # does not return a lastrowid, so have the INSERT return the pk the sequence
+        # assigned. Reserving it beforehand with nextval() would waste a sequence value
+        # for every discarded record.
+
+        # Remove the pk column
+        row = {self.quote_column(k): v for k, v in row.items() if k != pk_column}
 
-        # add pk back in if its missing
-        row[pk_column] = pk
+        # Set empty fields to None
+        for k, v in row.items():
+            if v in EMPTY:
+                row[k] = None
 
         # quote
-        row = {self.quote_column(k): v for k, v in row.items()}
         table = self.quote_table(table)
 
         query = (
             f"INSERT INTO {table} ({', '.join(key for key in row)}) VALUES "
-            f"({','.join('%s' for _ in range(len(row)))}); "
+            f"({','.join('%s' for _ in range(len(row)))}) "
+            f"RETURNING {self.quote_column(pk_column)};"
         )
         values = [value for key, value in row.items()]
         result = self.execute(query, tuple(values))
+        if result.attrs["exception"]:
+            return result
 
-        result.attrs["lastid"] = pk
+        result.attrs["lastrowid"] = result.iloc[0][pk_column].tolist()
         return result
 
 
@@ -11144,6 +13897,31 @@ class Sqlserver(SQLDriver):
         self.con.commit()
         cursor.close()
 
+    def savepoint(self) -> str:
+        name = f"pysimplesql_{next(self._savepoints)}"
+        self.execute(f"SAVE TRANSACTION {name}", silent=True)
+        return name
+
+    def release_savepoint(self, name: str) -> None:
+        # SQL Server savepoints can't be released, they end with the transaction
+        pass
+
+    def rollback_to_savepoint(self, name: str) -> None:
+        self.execute(f"ROLLBACK TRANSACTION {name}", silent=True)
+        if self.query_cache is not None:
+            self.query_cache.clear()
+
+    def enforces_foreign_keys(self) -> bool:
+        return True
+
+    def schema_fingerprint(self) -> Union[str, None]:
+        # modify_date changes when a table, key or default constraint is altered
+        query = (
+            "SELECT COUNT(*), MAX(modify_date) FROM sys.objects "
+            "WHERE is_ms_shipped = 0;"
+        )
+        return self._query_fingerprint(query)
+
     def get_tables(self):
         query = (
             "SELECT table_name FROM information_schema.tables WHERE table_catalog = ?"
@@ -11155,7 +13933,6 @@ class Sqlserver(SQLDriver):
         # Return a list of column names
         query = "SELECT * FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_NAME = ?"
         rows = self.execute(query, [table], silent=True)
-        col_info = ColumnInfo(self, table)
         # Get the primary key column(s)
         pk_columns = []
         pk_query = """
@@ -11178,6 +13955,73 @@ class Sqlserver(SQLDriver):
         gen_rows = self.execute(gen_query, [table], silent=True)
         for _, row in gen_rows.iterrows():
             generated_columns.append(row[0])
+        return self._column_info_from_rows(
+            table, rows, pk_columns, generated_columns
+        )
+
+    def bulk_column_info(self) -> Dict[str, ColumnInfo]:
+        # The same three queries as column_info(), but for every table at once
+        query = (
+            "SELECT * FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_CATALOG = ? "
+            "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+        )
+        rows = self.execute(query, [self.database], silent=True)
+        if rows.empty:
+            return {}
+
+        pk_columns = {}
+        pk_query = (
+            "SELECT TABLE_NAME, COLUMN_NAME FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE "
+            "WHERE TABLE_CATALOG = ?"
+        )
+        pk_rows = self.execute(pk_query, [self.database], silent=True)
+        for pk_row in pk_rows.to_dict("records"):
+            pk_columns.setdefault(pk_row["TABLE_NAME"], []).append(
+                pk_row["COLUMN_NAME"]
+            )
+
+        generated_columns = {}
+        gen_query = (
+            "SELECT OBJECT_NAME(object_id) AS table_name, name "
+            "FROM sys.columns "
+            "WHERE is_computed = 1;"
+        )
+        gen_rows = self.execute(gen_query, silent=True)
+        for gen_row in gen_rows.to_dict("records"):
+            generated_columns.setdefault(gen_row["table_name"], []).append(
+                gen_row["name"]
+            )
+
+        return {
+            table: self._column_info_from_rows(
+                table,
+                table_rows,
+                pk_columns.get(table, []),
+                generated_columns.get(table, []),
+            )
+            for table, table_rows in rows.groupby("TABLE_NAME", sort=False)
+        }
+
+    def bulk_pk_column(self) -> Dict[str, Union[str, None]]:
+        query = (
+            "SELECT TABLE_NAME, COLUMN_NAME FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE "
+            "WHERE TABLE_CATALOG = ? AND CONSTRAINT_NAME LIKE 'PK%' "
+            "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+        )
+        rows = self.execute(query, [self.database], silent=True)
+        pk_columns = {}
+        for row in rows.to_dict("records"):
+            pk_columns.setdefault(row["TABLE_NAME"], row["COLUMN_NAME"])
+        return pk_columns
+
+    def _column_info_from_rows(
+        self,
+        table: str,
+        rows: pd.DataFrame,
+        pk_columns: List[str],
+        generated_columns: List[str],
+    ) -> ColumnInfo:
+        col_info = ColumnInfo(self, table)
         rows = rows.fillna("")
         # setup all the variables to be passed to col_info
         for _, row in rows.iterrows():
@@ -11223,36 +14067,33 @@ class Sqlserver(SQLDriver):
 
     def get_relationships(self):
         # Return a list of dicts {from_table,to_table,from_column,to_column,requery}
-        tables = self.get_tables()
+        # sys.foreign_keys covers the whole database, so one query is enough
         relationships = []
-        for from_table in tables:
-            query = (
-                "SELECT "
-                "   OBJECT_NAME(f.parent_object_id) AS from_table, "
-                "   OBJECT_NAME(f.referenced_object_id) AS to_table, "
-                "   COL_NAME(fc.parent_object_id, fc.parent_column_id) AS from_column, "
-                "   COL_NAME(fc.referenced_object_id, fc.referenced_column_id) AS to_column, "  # noqa: E501
-                "   f.update_referential_action_desc AS update_cascade, "
-                "   f.delete_referential_action_desc AS delete_cascade "
-                "FROM "
-                "   sys.foreign_keys AS f "
-                "   INNER JOIN sys.foreign_key_columns AS fc "
-                "       ON f.object_id = fc.constraint_object_id "
-                "WHERE "
-                f"   OBJECT_NAME(f.parent_object_id) = '{from_table}'"
-            )
+        query = (
+            "SELECT "
+            "   OBJECT_NAME(f.parent_object_id) AS from_table, "
+            "   OBJECT_NAME(f.referenced_object_id) AS to_table, "
+            "   COL_NAME(fc.parent_object_id, fc.parent_column_id) AS from_column, "
+            "   COL_NAME(fc.referenced_object_id, fc.referenced_column_id) AS to_column, "  # noqa: E501
+            "   f.update_referential_action_desc AS update_cascade, "
+            "   f.delete_referential_action_desc AS delete_cascade "
+            "FROM "
+            "   sys.foreign_keys AS f "
+            "   INNER JOIN sys.foreign_key_columns AS fc "
+            "       ON f.object_id = fc.constraint_object_id "
+        )
+
+        rows = self.execute(query, silent=True)
 
-            rows = self.execute(query, silent=True)
-
-            for _, row in rows.iterrows():
-                dic = {}
-                dic["from_table"] = row["from_table"]
-                dic["to_table"] = row["to_table"]
-                dic["from_column"] = row["from_column"]
-                dic["to_column"] = row["to_column"]
-                dic["update_cascade"] = row["update_cascade"] == "CASCADE"
-                dic["delete_cascade"] = row["delete_cascade"] == "CASCADE"
-                relationships.append(dic)
+        for row in rows.to_dict("records"):
+            dic = {}
+            dic["from_table"] = row["from_table"]
+            dic["to_table"] = row["to_table"]
+            dic["from_column"] = row["from_column"]
+            dic["to_column"] = row["to_column"]
+            dic["update_cascade"] = row["update_cascade"] == "CASCADE"
+            dic["delete_cascade"] = row["delete_cascade"] == "CASCADE"
+            relationships.append(dic)
         return relationships
 
     def pk_column(self, table):
@@ -11273,12 +14114,17 @@ class Sqlserver(SQLDriver):
         return None
 
     def _insert_duplicate_record(
-        self, table: str, columns: str, pk_column: str, pk: int
+        self,
+        table: str,
+        columns: str,
+        pk_column: str,
+        pk: int,
+        select_columns: str = None,
     ) -> pd.DataFrame:
         query = (
             f"INSERT INTO {table} ({columns}) "
             f"OUTPUT inserted.{self.quote_column(pk_column)} "
-            f"SELECT {columns} FROM {table} "
+            f"SELECT {select_columns or columns} FROM {table} "
             f"WHERE {self.quote_column(pk_column)} = {pk};"
         )
         res = self.execute(query)
@@ -11339,6 +14185,16 @@ class MSAccess(SQLDriver):
         "TIMESTAMP": DateTimeCol,
     }
 
+    # Typed ResultSet getters, by the Java class name reported for a column.
+    # Columns of other classes are read with getObject().
+    RESULT_GETTERS: ClassVar[Dict[str, str]] = {
+        "java.lang.String": "getString",
+        "java.math.BigDecimal": "getBigDecimal",
+        "java.sql.Date": "getDate",
+        "java.sql.Time": "getTime",
+        "java.sql.Timestamp": "getTimestamp",
+    }
+
     def __init__(
         self,
         database_file: Union[str, Path],
@@ -11352,6 +14208,8 @@ class MSAccess(SQLDriver):
         sql_char: SqlChar = sql_char,
         infer_datetype_from_default_function: bool = True,
         use_newer_jackcess: bool = False,
+        schema_cache: Union[bool, str] = False,
+        fetch_size: int = 1000,
     ) -> None:
         """Initialize the MSAccess class.
 
@@ -11377,6 +14235,10 @@ class MSAccess(SQLDriver):
             use_newer_jackcess: If True, uses a newer version of the Jackcess library
                 for improved compatibility, specifically allowing handling of
                 'attachment' columns. Defaults to False.
+            schema_cache: (optional) Default:False. True or a file path to cache the
+                schema introspection between runs. See `SchemaCache`.
+            fetch_size: (optional) Default:1000. The number of rows the JDBC driver
+                fetches per round trip.
         """
         self.database_file = str(database_file)
         self.overwrite_file = overwrite_file
@@ -11387,6 +14249,9 @@ class MSAccess(SQLDriver):
         self.delete_cascade = delete_cascade
         self.infer_datetype_from_default_function = infer_datetype_from_default_function
         self.use_newer_jackcess = use_newer_jackcess
+        self.schema_cache = schema_cache
+        self.fetch_size = fetch_size
+        self._jdbc_savepoints = {}
 
         super().__post_init__(sql_char)
 
@@ -11495,12 +14360,14 @@ class MSAccess(SQLDriver):
         try:
             if values:
                 stmt = self.con.prepareStatement(query)
+                stmt.setFetchSize(self.fetch_size)
                 for index, value in enumerate(values, start=1):
                     adapted_value = self.adapt(value)
                     stmt.setObject(index, adapted_value)
                 has_result_set = stmt.execute()
             else:
                 stmt = self.con.createStatement()
+                stmt.setFetchSize(self.fetch_size)
                 has_result_set = stmt.execute(query)
         except Exception as e:  # noqa: BLE001
             exception = e
@@ -11513,31 +14380,48 @@ class MSAccess(SQLDriver):
 
         if has_result_set:
             rs = stmt.getResultSet()
-            metadata = rs.getMetaData()
-            column_count = metadata.getColumnCount()
+            readers = self._column_readers(rs)
             rows = []
-            lastrowid = None
 
             while rs.next():
                 row = {}
-                for i in range(1, column_count + 1):
-                    column_name = str(metadata.getColumnName(i))
-                    value = rs.getObject(i)
-                    value = self.convert(value)
-                    row[column_name] = value
+                for column_name, getter, i, converter in readers:
+                    value = getter(i)
+                    row[column_name] = None if value is None else converter(value)
                 rows.append(row)
 
-                # Set the last row ID
-                if "insert" in query.lower():
-                    res = self.execute("SELECT @@IDENTITY AS ID")
-                    lastrowid = res.iloc[0]["ID"]
-
-            return Result.set(
-                [dict(row) for row in rows], lastrowid, exception, column_info
-            )
-
-        stmt.getUpdateCount()
-        return Result.set([], None, exception, column_info)
+            return Result.set(rows, None, exception, column_info)
+
+        lastrowid = None
+        if exception is None:
+            stmt.getUpdateCount()
+            # Look up the new identity once for the statement
+            if query.lstrip()[:6].upper() == "INSERT":
+                lastrowid = self._identity()
+        return Result.set([], lastrowid, exception, column_info)
+
+    def _column_readers(self, rs) -> List[Tuple[str, Callable, int, Callable]]:
+        # Resolve the getter and converter of each column once from the metadata,
+        # rather than checking the type of every value.
+        metadata = rs.getMetaData()
+        converters = {
+            str(java_type.class_.getName()): converter_fn
+            for java_type, converter_fn in self.converters.items()
+        }
+        readers = []
+        for i in range(1, metadata.getColumnCount() + 1):
+            class_name = str(metadata.getColumnClassName(i))
+            getter = getattr(rs, self.RESULT_GETTERS.get(class_name, "getObject"))
+            converter = converters.get(class_name, self.convert)
+            readers.append((str(metadata.getColumnName(i)), getter, i, converter))
+        return readers
+
+    def _identity(self) -> Union[int, None]:
+        rs = self.con.createStatement().executeQuery("SELECT @@IDENTITY")
+        if rs.next():
+            value = rs.getObject(1)
+            return None if value is None else int(value)
+        return None
 
     def execute_script(self, script, encoding) -> None:
         with open(script, "r", encoding=encoding) as file:
@@ -11549,6 +14433,34 @@ class MSAccess(SQLDriver):
                 if q:
                     self.execute(q)
 
+    # UCanAccess connections autocommit, and savepoints are set through JDBC
+    def begin(self) -> None:
+        self.con.setAutoCommit(False)
+
+    def end_unit_of_work(self, commit: bool = True) -> None:
+        super().end_unit_of_work(commit)
+        self._jdbc_savepoints.clear()
+        self.con.setAutoCommit(True)
+
+    @contextlib.contextmanager
+    def _probe_connection(self):
+        # The connection autocommits outside of a unit of work, so it sees the commits
+        # of others without a connection of its own
+        yield not self.in_unit_of_work
+
+    def savepoint(self) -> str:
+        name = f"pysimplesql_{next(self._savepoints)}"
+        self._jdbc_savepoints[name] = self.con.setSavepoint(name)
+        return name
+
+    def release_savepoint(self, name: str) -> None:
+        self.con.releaseSavepoint(self._jdbc_savepoints.pop(name))
+
+    def rollback_to_savepoint(self, name: str) -> None:
+        self.con.rollback(self._jdbc_savepoints.pop(name))
+        if self.query_cache is not None:
+            self.query_cache.clear()
+
     def column_info(self, table):
         meta_data = self.con.getMetaData()
 
@@ -11616,6 +14528,9 @@ class MSAccess(SQLDriver):
             return str(rs.getString("column_name"))
         return None
 
+    def schema_cache_key(self) -> str:
+        return f"{self.NAME}:{os.path.abspath(self.database_file)}"
+
     def get_tables(self):
         metadata = self.con.getMetaData()
         rs = metadata.getTables(None, None, "%", ["TABLE"])
@@ -11629,10 +14544,14 @@ class MSAccess(SQLDriver):
     def get_relationships(self):
         # Get the mapping of uppercase table and column names to their original case
         table_mapping = {table.upper(): table for table in self.get_tables()}
-        column_mappings = {
-            table: {col.name.upper(): col.name for col in self.column_info(table)}
-            for table in self.get_tables()
-        }
+        # Fetch the columns of all tables in one metadata call
+        column_mappings = {}
+        rs = self.con.getMetaData().getColumns(None, None, "%", None)
+        while rs.next():
+            table = str(rs.getString("TABLE_NAME"))
+            table = table_mapping.get(table.upper(), table)
+            column = str(rs.getString("COLUMN_NAME"))
+            column_mappings.setdefault(table, {})[column.upper()] = column
 
         query = (
             "SELECT"
@@ -11678,6 +14597,11 @@ class MSAccess(SQLDriver):
         rows = self.execute(f"SELECT MAX({pk_column}) as max_pk FROM {table}")
         return rows.iloc[0]["MAX_PK"].tolist()  # returned as upper case
 
+    def expressions_query(self, expressions: List[str]) -> str:
+        # UCanAccess runs on HSQLDB, which needs a FROM clause
+        columns = ", ".join(f"{e} AS val{i}" for i, e in enumerate(expressions))
+        return f"SELECT {columns} FROM (VALUES(0));"
+
     def _get_column_definitions(self, table_name: str):
         # Creates a comma separated list of column names and types to be used in a
         # CREATE TABLE statement
@@ -11689,19 +14613,20 @@ class MSAccess(SQLDriver):
         return cols[:-2]
 
     def _insert_duplicate_record(
-        self, table: str, columns: str, pk_column: str, pk: int
+        self,
+        table: str,
+        columns: str,
+        pk_column: str,
+        pk: int,
+        select_columns: str = None,
     ) -> pd.DataFrame:
         query = (
             f"INSERT INTO {table} ({columns}) "
-            f"SELECT {columns} FROM {table} "
+            f"SELECT {select_columns or columns} FROM {table} "
             f"WHERE {pk_column} = {pk};"
         )
-        res = self.execute(query)
-        if res.attrs["exception"]:
-            return res
-        res = self.execute("SELECT @@IDENTITY AS ID")
-        res.attrs["lastrowid"] = res.iloc[0]["ID"].tolist()
-        return res
+        # execute() already sets the lastrowid from @@IDENTITY for INSERTs
+        return self.execute(query)
 
     def _create_access_file(self) -> bool:
         try:
@@ -11757,20 +14682,15 @@ class MSAccess(SQLDriver):
                 value.doubleValue()
             ),
             jpype.JPackage("java").lang.Double: lambda value: float(value),
+            # The instant is in ISO format, so its first 10 characters are the date.
+            # This matches parsing it and formatting with DATE_FORMAT, without the
+            # per-value strptime/strftime.
             jpype.JPackage("java")
-            .sql.Timestamp: lambda value: dt.datetime.strptime(
-                value.toInstant().toString()[:-1],
-                TIMESTAMP_FORMAT_MICROSECOND
-                if "." in value.toInstant().toString()[:-1]
-                else TIMESTAMP_FORMAT,
-            )
-            .strftime(DATE_FORMAT),
+            .sql.Timestamp: lambda value: str(value.toInstant().toString())[:10],
             jpype.JPackage("java")
-            .sql.Date: lambda value: dt.datetime.strptime(value.toString(), DATE_FORMAT)
-            .date(),
+            .sql.Date: lambda value: dt.date.fromisoformat(str(value.toString())),
             jpype.JPackage("java")
-            .sql.Time: lambda value: dt.datetime.strptime(value.toString(), TIME_FORMAT)
-            .time(),
+            .sql.Time: lambda value: dt.time.fromisoformat(str(value.toString())),
         }
 
 
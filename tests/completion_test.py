@@ -0,0 +1,51 @@
+"""Tests for the autocompletion index."""
+
+import random
+
+import pytest
+
+from pysimplesql.pysimplesql import _CompletionIndex
+
+
+def _brute_force(values, prefix):
+    hits = [i for i, value in enumerate(values) if value.casefold().startswith(prefix)]
+    if not hits:
+        return hits, None
+    # the shortest hit, and the first of those
+    closest = min(hits, key=lambda i: (len(values[i]), i))
+    return hits, values[closest]
+
+
+@pytest.mark.parametrize(
+    "prefix", ["", "a", "ap", "app", "apple", "applesauce", "b", "ba", "z", "ÄP"]
+)
+def test_find(prefix) -> None:
+    """Hits and the closest match are found regardless of case."""
+    values = ["Apple", "apply", "Banana", "application", "app", "band", "Äpfel", "ap"]
+    index = _CompletionIndex(values)
+    hits, closest = index.find(prefix.casefold())
+    expected_hits, expected_closest = _brute_force(values, prefix.casefold())
+    assert sorted(hits.tolist()) == expected_hits
+    assert closest == expected_closest
+
+
+def test_find_empty() -> None:
+    """An empty completion list has no hits."""
+    hits, closest = _CompletionIndex([]).find("a")
+    assert not len(hits)
+    assert closest is None
+
+
+def test_find_matches_brute_force() -> None:
+    """Lookups in a larger list match a linear search."""
+    rng = random.Random(0)
+    values = [
+        "".join(rng.choice("abAB") for _ in range(rng.randint(0, 6)))
+        for _ in range(500)
+    ]
+    index = _CompletionIndex(values)
+    for prefix in ["", "a", "ab", "ba", "aab", "bbbb", "abab", "c"]:
+        hits, closest = index.find(prefix)
+        expected_hits, expected_closest = _brute_force(values, prefix)
+        assert sorted(hits.tolist()) == expected_hits
+        assert closest == expected_closest
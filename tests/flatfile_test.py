@@ -0,0 +1,134 @@
+"""Tests for the Flatfile driver that run without a GUI."""
+
+import pandas as pd
+import pytest
+
+import pysimplesql as ss
+
+
+def _write_csv(tmp_path, text):
+    path = tmp_path / "flatfile.csv"
+    path.write_text(text)
+    return str(path)
+
+
+def _rows(driver):
+    return driver.execute(f"SELECT * FROM {driver.table}").to_numpy().tolist()
+
+
+def test_load_trailing_blank_line(tmp_path) -> None:
+    """A blank line at the end of the file is not loaded as a record."""
+    path = _write_csv(tmp_path, "name\na\nb\nc\n\n")
+    driver = ss.Flatfile(path)
+    assert _rows(driver) == [[1, "a"], [2, "b"], [3, "c"]]
+
+
+def test_load_skips_short_line(tmp_path) -> None:
+    """A line with too few fields is skipped, the others are loaded."""
+    path = _write_csv(tmp_path, "id,name\n1,a\n2\n3,c\n")
+    driver = ss.Flatfile(path, pk_col="id")
+    assert _rows(driver) == [["1", "a"], ["3", "c"]]
+
+
+@pytest.mark.parametrize("fast_load", [True, False])
+@pytest.mark.parametrize("batch_size", [1, 2, 100])
+def test_load_failed_batch_is_not_duplicated(tmp_path, fast_load, batch_size) -> None:
+    """A line failing its batch is skipped, the rest load exactly once."""
+    path = _write_csv(tmp_path, "id,name\n1,a\n2,b\n2,dup\n3,c\n\n4,d\n")
+    driver = ss.Flatfile(path, pk_col="id", batch_size=batch_size, fast_load=fast_load)
+    assert _rows(driver) == [["1", "a"], ["2", "b"], ["3", "c"], ["4", "d"]]
+
+
+def test_load_progress_callback(tmp_path) -> None:
+    """The progress callback is passed the lines loaded after each batch."""
+    path = _write_csv(tmp_path, "name\n" + "".join(f"{i}\n" for i in range(5)))
+    progress = []
+    ss.Flatfile(path, batch_size=2, progress_callback=progress.append)
+    assert progress == [2, 4, 5]
+
+
+def test_save_writes_flatfile(tmp_path) -> None:
+    """Saving writes the saved records out, not unsaved edits of others."""
+    path = _write_csv(tmp_path, "name,age\na,1\nb,2\n")
+    frm = ss.Form(ss.Flatfile(path))
+    frm.popup = ss.Popup()
+    dataset = frm["Flatfile"]
+    dataset.last(update_elements=False)
+    dataset.current.set_value("age", "9")
+    dataset.rows.loc[dataset.rows.index[0], "age"] = "unsaved"
+    result = dataset.save_record(display_message=False)
+    assert result == ss.SAVE_SUCCESS + ss.SHOW_MESSAGE
+    with open(path) as f:
+        assert f.read() == "name,age\na,1\nb,9\n"
+
+
+def test_rollback_after_load(tmp_path) -> None:
+    """fast_load turns the journal back on, so a rollback undoes a change."""
+    path = _write_csv(tmp_path, "name\n" + "".join(f"{i:>40}\n" for i in range(20000)))
+    driver = ss.Flatfile(path)
+    assert driver.con.execute("PRAGMA journal_mode;").fetchone()[0] == "memory"
+    driver.execute("UPDATE Flatfile SET name = 'changed' WHERE pk > 100")
+    driver.execute("DELETE FROM Flatfile WHERE pk > 5")
+    driver.rollback()
+    assert len(driver.execute("SELECT * FROM Flatfile WHERE name = 'changed'")) == 0
+    assert len(driver.execute("SELECT * FROM Flatfile")) == 20000
+
+
+def test_unsupported_file_format(tmp_path) -> None:
+    """An unknown file_format is rejected before anything is loaded."""
+    path = _write_csv(tmp_path, "name\na\n")
+    with pytest.raises(ValueError, match="file_format"):
+        ss.Flatfile(path, file_format="xlsx")
+
+
+@pytest.mark.parametrize("commit", [True, False])
+def test_unit_of_work_holds_write(tmp_path, commit) -> None:
+    """Saves in a unit of work are only written out once it is committed."""
+    path = _write_csv(tmp_path, "name,age\na,1\nb,2\n")
+    driver = ss.Flatfile(path)
+    frm = ss.Form(driver)
+    frm.popup = ss.Popup()
+    dataset = frm["Flatfile"]
+    driver.begin_unit_of_work()
+    dataset.current.set_value("age", "9")
+    dataset.save_record(display_message=False)
+    with open(path) as f:
+        assert f.read() == "name,age\na,1\nb,2\n"
+    driver.end_unit_of_work(commit)
+    with open(path) as f:
+        assert f.read() == (
+            "name,age\na,9\nb,2\n" if commit else "name,age\na,1\nb,2\n"
+        )
+
+
+@pytest.mark.parametrize("extension", [".jsonl", ".parquet", ".feather"])
+def test_columnar_round_trip(tmp_path, extension) -> None:
+    """Columnar flatfiles load typed columns, and are saved back in their format."""
+    if extension != ".jsonl":
+        pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"flatfile{extension}")
+    original = pd.DataFrame({"name": ["a", "b"], "age": [1, 2], "score": [0.5, 1.5]})
+    writers = {
+        ".jsonl": lambda: original.to_json(path, orient="records", lines=True),
+        ".parquet": lambda: original.to_parquet(path, index=False),
+        ".feather": lambda: original.to_feather(path),
+    }
+    writers[extension]()
+
+    driver = ss.Flatfile(path)
+    assert _rows(driver) == [[1, "a", 1, 0.5], [2, "b", 2, 1.5]]
+    frm = ss.Form(driver)
+    frm.popup = ss.Popup()
+    dataset = frm["Flatfile"]
+    dataset.last(update_elements=False)
+    dataset.current.set_value("age", 9)
+    assert dataset.save_record(display_message=False) & ss.SAVE_SUCCESS
+
+    readers = {
+        ".jsonl": lambda: pd.read_json(path, lines=True),
+        ".parquet": lambda: pd.read_parquet(path),
+        ".feather": lambda: pd.read_feather(path),
+    }
+    saved = readers[extension]()
+    assert saved.to_numpy().tolist() == [["a", 1, 0.5], ["b", 9, 1.5]]
+    assert saved.dtypes.to_dict() == original.dtypes.to_dict()
@@ -0,0 +1,201 @@
+"""Tests for LazyTable, run on a stand-in for its ttk.Treeview."""
+
+import pytest
+
+import pysimplesql as ss
+from pysimplesql.pysimplesql import _unmoved_items
+
+
+class _Treeview:
+    """Keeps the attached items in order, and records the calls that cost Tk time."""
+
+    def __init__(self) -> None:
+        self.children = []
+        self.items = {}
+        self.selected = ()
+        self.written = []
+        self.tags = {}
+
+    def configure(self, **kwargs) -> None:
+        pass
+
+    config = configure
+
+    def bind(self, sequence, func, add=None) -> None:
+        pass
+
+    def get_children(self):
+        return tuple(self.children)
+
+    def insert(self, parent, index, iid):
+        self.children.append(iid)
+        self.items[iid] = {}
+        return iid
+
+    def detach(self, iid) -> None:
+        self.children.remove(iid)
+
+    def delete(self, iid) -> None:
+        if iid in self.children:
+            self.children.remove(iid)
+        del self.items[iid]
+
+    def move(self, iid, parent, index) -> None:
+        if iid in self.children:
+            self.children.remove(iid)
+        self.children.insert(index, iid)
+
+    def item(self, iid, **kwargs) -> None:
+        self.items[iid].update(kwargs)
+        self.written.append(iid)
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, iid) -> None:
+        self.selected = (iid,)
+
+    def selection_remove(self, items) -> None:
+        self.selected = ()
+
+    def tag_configure(self, tag, **kwargs) -> None:
+        self.tags[tag] = kwargs
+
+    def yview_moveto(self, fraction) -> None:
+        pass
+
+    def shown(self):
+        """The values of the attached items, top to bottom."""
+        return [self.items[iid]["values"] for iid in self.children]
+
+
+def _rows(count, start=0):
+    return [ss.TableRow(pk, ["", f"row {pk}"]) for pk in range(start, start + count)]
+
+
+def _table(rows, num_rows=3) -> ss.LazyTable:
+    table = ss.LazyTable([["", ""]], headings=["", "name"], num_rows=num_rows, key="t")
+    table.Widget = table.widget = _Treeview()
+    table.update(values=rows)
+    return table
+
+
+def test_pool_size_is_fixed() -> None:
+    """However many rows there are, only the rows in view are Treeview items."""
+    rows = _rows(1000)
+    table = _table(rows)
+    assert table.widget.shown() == rows[:3]
+    assert len(table.widget.items) == 3
+    table.update(values=_rows(5000))
+    assert len(table.widget.items) == 3
+
+
+def test_scrolling() -> None:
+    """Scrolling rebinds the pool to the rows in view."""
+    rows = _rows(100)
+    table = _table(rows)
+    table._yview("scroll", 1, "units")
+    assert table.widget.shown() == rows[1:4]
+    table._yview("scroll", 1, "pages")
+    assert table.widget.shown() == rows[4:7]
+    table._yview("moveto", "1.0")
+    assert table.widget.shown() == rows[-3:]
+
+
+def test_selection_follows_pk() -> None:
+    """The selection is kept by pk while the selected row is out of view."""
+    rows = _rows(100)
+    table = _table(rows)
+    table.update(select_rows=[1])
+    assert table.SelectedRows is rows[1]
+    table._scroll_to(50)
+    assert table.widget.selection() == ()
+    assert table.SelectedRows is rows[1]
+    table._scroll_to(0)
+    assert table.widget.selection() == (table.widget.children[1],)
+
+
+def test_lazy_loading_is_deprecated() -> None:
+    """The ignored lazy_loading argument warns."""
+    with pytest.warns(DeprecationWarning, match="lazy_loading"):
+        ss.LazyTable([["", ""]], headings=["", "name"], num_rows=3, lazy_loading=True)
+
+
+def test_refresh_writes_changed_rows_only() -> None:
+    """A refresh only writes the items whose row changed."""
+    rows = _rows(100)
+    table = _table(rows)
+    table.widget.written.clear()
+    changed = [*rows[:1], ss.TableRow(1, ["", "changed"]), *rows[2:]]
+    table.update(values=changed)
+    assert len(table.widget.written) == 1
+    assert table.widget.shown() == changed[:3]
+
+
+def test_scroll_by_one_writes_one_row() -> None:
+    """Scrolling by a row reuses the items still in view."""
+    table = _table(_rows(100))
+    table.widget.written.clear()
+    table._scroll_to(1)
+    assert len(table.widget.written) == 1
+
+
+def test_reorder_moves_items() -> None:
+    """Sorting the rows in view moves their items instead of rewriting them."""
+    rows = _rows(3)
+    table = _table(rows)
+    table.widget.written.clear()
+    table.update(values=rows[::-1])
+    assert table.widget.written == []
+    assert table.widget.shown() == rows[::-1]
+
+
+@pytest.mark.parametrize(
+    ("current", "desired", "unmoved"),
+    [
+        ([1, 2, 3], [1, 2, 3], {1, 2, 3}),
+        ([1, 2, 3], [3, 1, 2], {1, 2}),
+        ([1, 2, 3, 4], [2, 1, 4, 3], {1, 3}),
+        ([1, 2], [3, 2], {2}),
+        ([], [1], set()),
+    ],
+)
+def test_unmoved_items(current, desired, unmoved) -> None:
+    """The longest run of items already in order stays put."""
+    result = _unmoved_items(current, desired)
+    assert len(result) == len(unmoved)
+    assert [item for item in desired if item in result] == [
+        item for item in current if item in result
+    ]
+
+
+def test_patch_row() -> None:
+    """Patching a row in view rewrites just that item."""
+    rows = _rows(100)
+    table = _table(rows)
+    table.widget.written.clear()
+    patched = ss.TableRow(2, ["", "patched"])
+    assert table.patch_row(patched)
+    assert table.widget.written == [table.widget.children[2]]
+    assert table.widget.shown()[2] == patched
+    assert table.values[2] is patched
+
+
+def test_patch_row_out_of_view() -> None:
+    """Patching a row out of view writes nothing, and unknown pks are refused."""
+    table = _table(_rows(100))
+    table.widget.written.clear()
+    assert table.patch_row(ss.TableRow(50, ["", "patched"]))
+    assert table.widget.written == []
+    assert not table.patch_row(ss.TableRow(1000, ["", "missing"]))
+
+
+def test_shared_row_tags() -> None:
+    """Rows share two alternating tags, and unsaved rows add the marker tag."""
+    rows = _rows(3)
+    rows[1][0] = ss.themepack.marker_unsaved
+    table = _table(rows)
+    assert sorted(table.widget.tags) == sorted(table.row_tags)
+    tags = [table.widget.items[iid]["tags"] for iid in table.widget.children]
+    alternate, row = table.row_tags
+    assert tags == [(alternate,), (row, table.marker_tag), (alternate,)]
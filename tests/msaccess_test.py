@@ -0,0 +1,98 @@
+"""Tests for the MSAccess driver that run without a JVM, on stand-in JDBC objects."""
+
+import pysimplesql as ss
+
+
+class _JavaType:
+    def __init__(self, name) -> None:
+        self.class_ = self
+        self.name = name
+
+    def getName(self):  # noqa: N802
+        return self.name
+
+
+class _ResultSet:
+    def __init__(self, columns, rows) -> None:
+        # columns: [(name, java class name)]
+        self.columns = columns
+        self.rows = rows
+        self.position = -1
+        self.calls = []
+
+    def getMetaData(self):  # noqa: N802
+        return self
+
+    def getColumnCount(self):  # noqa: N802
+        return len(self.columns)
+
+    def getColumnName(self, i):  # noqa: N802
+        return self.columns[i - 1][0]
+
+    def getColumnClassName(self, i):  # noqa: N802
+        return self.columns[i - 1][1]
+
+    def next(self):
+        self.position += 1
+        return self.position < len(self.rows)
+
+    def getString(self, i):  # noqa: N802
+        self.calls.append("getString")
+        return self.rows[self.position][i - 1]
+
+    def getObject(self, i):  # noqa: N802
+        self.calls.append("getObject")
+        return self.rows[self.position][i - 1]
+
+
+def _driver() -> ss.MSAccess:
+    # skip __init__, which starts a JVM
+    driver = object.__new__(ss.MSAccess)
+    driver.converters = {
+        _JavaType("java.lang.String"): lambda value: f"str:{value}",
+        _JavaType("java.lang.Integer"): lambda value: value * 10,
+    }
+    return driver
+
+
+def test_column_readers() -> None:
+    """Each column gets its typed getter and converter up front."""
+    rs = _ResultSet(
+        [("name", "java.lang.String"), ("qty", "java.lang.Integer"), ("x", "Other")],
+        [["a", 1, "raw"]],
+    )
+    readers = _driver()._column_readers(rs)
+    assert [(name, i) for name, _, i, _ in readers] == [
+        ("name", 1),
+        ("qty", 2),
+        ("x", 3),
+    ]
+    rs.next()
+    assert [converter(getter(i)) for _, getter, i, converter in readers[:2]] == [
+        "str:a",
+        10,
+    ]
+    assert rs.calls == ["getString", "getObject"]
+
+
+class _Connection:
+    def __init__(self, rs) -> None:
+        self.rs = rs
+        self.queries = []
+
+    def createStatement(self):  # noqa: N802
+        return self
+
+    def executeQuery(self, query):  # noqa: N802
+        self.queries.append(query)
+        return self.rs
+
+
+def test_identity() -> None:
+    """The new identity is looked up with a single query."""
+    driver = _driver()
+    driver.con = _Connection(_ResultSet([("ID", "java.lang.Integer")], [[7]]))
+    assert driver._identity() == 7
+    assert driver.con.queries == ["SELECT @@IDENTITY"]
+    driver.con = _Connection(_ResultSet([("ID", "java.lang.Integer")], []))
+    assert driver._identity() is None
@@ -0,0 +1,653 @@
+"""Tests for the SQLDriver features that run against an in-memory Sqlite database."""
+
+import sqlite3
+
+import PySimpleGUI as sg
+import pytest
+
+import pysimplesql as ss
+
+
+def _table_rows(driver, table):
+    return driver.execute(f"SELECT * FROM {table} ORDER BY id").to_numpy().tolist()
+
+
+def _count(driver, table):
+    return len(driver.execute(f"SELECT * FROM {table}"))
+
+
+# --------------------------------------------------------------------------------------
+# Instrumentation
+# --------------------------------------------------------------------------------------
+def test_query_hooks_and_stats(caplog) -> None:
+    """Queries are passed to the hooks, counted, and logged when slow."""
+    driver = ss.Sqlite(
+        ":memory:", sql_commands="CREATE TABLE t(id INTEGER PRIMARY KEY, name TEXT);"
+    )
+    started, ended = [], []
+    driver.on_query_start = lambda event: started.append(event.duration)
+    driver.on_query_end = ended.append
+    driver.slow_query_threshold = 0
+    driver.stats.reset()
+
+    with driver.operation("save"):
+        driver.execute("INSERT INTO t VALUES (1, 'a')")
+    driver.execute("SELECT * FROM missing")
+
+    assert started == [None, None]
+    assert [event.operation for event in ended] == ["save", "query"]
+    assert ended[0].duration >= 0
+    assert ended[1].exception is not None
+    assert driver.stats.count == 2
+    assert driver.stats.errors == 1
+    assert driver.stats.slow == 2
+    assert driver.stats.operations == {"save": 1, "query": 1}
+    assert "Slow query" in caplog.text
+
+
+def test_dataset_queries_are_attributed() -> None:
+    """Queries run by a DataSet action carry the action and the DataSet."""
+    driver = ss.Sqlite(
+        ":memory:",
+        sql_commands=(
+            "CREATE TABLE t(id INTEGER PRIMARY KEY, name TEXT);"
+            "INSERT INTO t VALUES (1, 'a');"
+        ),
+    )
+    frm = ss.Form(driver)
+    events = []
+    driver.on_query_end = events.append
+    frm["t"].requery(select_first=False, update_elements=False)
+    assert events
+    assert {(event.operation, event.dataset) for event in events} == {
+        ("requery", frm["t"])
+    }
+
+
+# --------------------------------------------------------------------------------------
+# Query cache
+# --------------------------------------------------------------------------------------
+@pytest.fixture
+def cached_driver():
+    """A Sqlite driver with a QueryCache."""
+    driver = ss.Sqlite(
+        ":memory:",
+        sql_commands=(
+            "CREATE TABLE t(id INTEGER PRIMARY KEY, name TEXT);"
+            "INSERT INTO t VALUES (1, 'a');"
+        ),
+    )
+    driver.query_cache = ss.QueryCache()
+    return driver
+
+
+def test_query_cache_hit(cached_driver) -> None:
+    """A repeated SELECT is answered from the cache."""
+    cached_driver.execute("SELECT * FROM t")
+    hits = cached_driver.stats.cache_hits
+    rows = cached_driver.execute("SELECT  *  FROM t")
+    assert cached_driver.stats.cache_hits == hits + 1
+    assert rows.to_numpy().tolist() == [[1, "a"]]
+
+
+def test_query_cache_invalidated_by_write(cached_driver) -> None:
+    """Writing to a table drops the cached results that read from it."""
+    cached_driver.execute("SELECT * FROM t")
+    cached_driver.execute("UPDATE t SET name = 'b' WHERE id = 1")
+    assert _table_rows(cached_driver, "t") == [[1, "b"]]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT 1 AS val0;",
+        "SELECT CURRENT_TIMESTAMP AS val0;",
+        "SELECT * FROM t WHERE name < datetime('now')",
+        "SELECT random() AS r FROM t",
+    ],
+)
+def test_query_cache_skips_volatile_queries(cached_driver, query) -> None:
+    """Table-less and volatile queries are never cached."""
+    cached_driver.execute(query)
+    hits = cached_driver.stats.cache_hits
+    cached_driver.execute(query)
+    assert cached_driver.stats.cache_hits == hits
+
+
+def test_uncached(cached_driver) -> None:
+    """Queries run inside uncached() neither use nor fill the cache."""
+    cache = cached_driver.query_cache
+    with cached_driver.uncached():
+        cached_driver.execute("SELECT * FROM t")
+    assert cached_driver.query_cache is cache
+    assert cache.get("SELECT * FROM t") is None
+
+
+# --------------------------------------------------------------------------------------
+# Temporary primary keys
+# --------------------------------------------------------------------------------------
+def test_temporary_pks_are_negative() -> None:
+    """Temporary pks count down from -1, without touching the database."""
+    driver = ss.Sqlite(
+        ":memory:", sql_commands="CREATE TABLE t(id INTEGER PRIMARY KEY);"
+    )
+    queries = driver.stats.count
+    assert [driver.temporary_pk("t", "id") for _ in range(3)] == [-1, -2, -3]
+    assert driver.stats.count == queries
+
+
+def test_insert_replaces_temporary_pk() -> None:
+    """A new record has a temporary pk until it is saved."""
+    driver = ss.Sqlite(
+        ":memory:",
+        sql_commands=(
+            "CREATE TABLE t(id INTEGER PRIMARY KEY, name TEXT);"
+            "INSERT INTO t VALUES (5, 'a');"
+        ),
+    )
+    frm = ss.Form(driver)
+    frm.popup = ss.Popup()
+    dataset = frm["t"]
+    dataset.insert_record(values={"name": "b"}, skip_prompt_save=True)
+    assert dataset.current.pk < 0
+    assert dataset.save_record(display_message=False, update_elements=False)
+    assert dataset.current.pk == 6
+    assert _table_rows(driver, "t") == [[5, "a"], [6, "b"]]
+
+
+# --------------------------------------------------------------------------------------
+# Schema cache
+# --------------------------------------------------------------------------------------
+SCHEMA = """
+CREATE TABLE p(id INTEGER PRIMARY KEY, name TEXT NOT NULL DEFAULT 'x');
+CREATE TABLE c(id INTEGER PRIMARY KEY, p_id INTEGER REFERENCES p(id), name TEXT);
+"""
+
+
+def test_bulk_introspection_matches_per_table() -> None:
+    """The set-based introspection finds what the per-table queries find."""
+    driver = ss.Sqlite(":memory:", sql_commands=SCHEMA + TWO_DEPTHS)
+    column_infos = driver.bulk_column_info()
+    pk_columns = driver.bulk_pk_column()
+    tables = driver.get_tables()
+    assert sorted(column_infos) == sorted(pk_columns) == sorted(tables)
+    for table in tables:
+        assert list(column_infos[table]) == list(driver.column_info(table))
+        assert pk_columns[table] == driver.pk_column(table)
+
+
+def test_schema_cache_skips_introspection(tmp_path) -> None:
+    """A driver whose schema is cached introspects nothing, until the schema changes."""
+    database, cache = str(tmp_path / "schema.db"), str(tmp_path / "schema.json")
+    ss.Sqlite(database, sql_commands=SCHEMA, schema_cache=cache).close()
+
+    driver = ss.Sqlite(database, schema_cache=cache)
+    frm = ss.Form(driver)
+    assert driver.schema.enabled
+    assert "introspection" not in driver.stats.operations
+    assert frm["p"].column_info["name"].default == "'x'"
+    assert [(r.child_table, r.fk_column) for r in driver.relationships] == [
+        ("c", "p_id")
+    ]
+    driver.close()
+
+    con = sqlite3.connect(database)
+    con.execute("ALTER TABLE c ADD COLUMN note TEXT")
+    con.close()
+    driver = ss.Sqlite(database, schema_cache=cache)
+    assert driver.stats.operations["introspection"]
+    assert "note" in driver.schema.column_info("c")
+    driver.close()
+
+
+# --------------------------------------------------------------------------------------
+# Performance profile
+# --------------------------------------------------------------------------------------
+def test_performance_profile(tmp_path) -> None:
+    """The profile turns on WAL, and plain SELECTs go through the reader connection."""
+    driver = ss.Sqlite(
+        str(tmp_path / "profile.db"),
+        sql_commands="CREATE TABLE t(id INTEGER PRIMARY KEY, name TEXT);",
+        performance_profile={"cache_size": -1024},
+    )
+    assert driver.execute("PRAGMA journal_mode;").iloc[0, 0] == "wal"
+    assert driver.con.execute("PRAGMA cache_size;").fetchone()[0] == -1024
+    assert driver.reader_con is not None
+    assert driver._connection_for("SELECT * FROM t") is driver.reader_con
+    # the reader would not see the write connection's uncommitted changes
+    driver.execute("INSERT INTO t VALUES (1, 'a')")
+    assert driver._connection_for("SELECT * FROM t") is driver.con
+    assert _table_rows(driver, "t") == [[1, "a"]]
+    driver.commit()
+    assert driver._connection_for("SELECT * FROM t") is driver.reader_con
+    assert _table_rows(driver, "t") == [[1, "a"]]
+    driver.close()
+
+
+def test_performance_profile_skips_memory() -> None:
+    """In-memory databases are left as they are."""
+    driver = ss.Sqlite(":memory:", performance_profile=True)
+    assert driver.reader_con is None
+    assert driver.execute("PRAGMA journal_mode;").iloc[0, 0] == "memory"
+
+
+# --------------------------------------------------------------------------------------
+# Function defaults
+# --------------------------------------------------------------------------------------
+def test_function_defaults_cached_only_if_deterministic() -> None:
+    """Deterministic function defaults are reused, all others evaluated every time."""
+    driver = ss.Sqlite(
+        ":memory:",
+        sql_commands=(
+            "CREATE TABLE t("
+            "id INTEGER PRIMARY KEY, "
+            "code TEXT DEFAULT (upper('x')), "
+            "n INTEGER DEFAULT (counter()), "
+            "r INTEGER DEFAULT (abs(random()))"
+            ");"
+        ),
+    )
+    calls = iter(range(100))
+    driver.con.create_function("counter", 0, lambda: next(calls))
+    frm = ss.Form(driver)
+    dataset = frm["t"]
+    first = dataset.column_info.default_row_dict(dataset)
+    second = dataset.column_info.default_row_dict(dataset)
+    assert first["code"] == second["code"] == "X"
+    assert second["n"] == first["n"] + 1
+    assert list(dataset.column_info._function_default_values) == ["upper('x')"]
+
+
+# --------------------------------------------------------------------------------------
+# Watching for changes
+# --------------------------------------------------------------------------------------
+@pytest.fixture
+def watched_driver(tmp_path):
+    """A Sqlite driver on a database file that other connections can change."""
+    driver = ss.Sqlite(
+        str(tmp_path / "watch.db"),
+        sql_commands="CREATE TABLE t(id INTEGER PRIMARY KEY, name TEXT);",
+    )
+    yield driver
+    driver.close()
+
+
+def test_change_tokens_move_on_other_commit(watched_driver, tmp_path) -> None:
+    """A commit by another connection changes the token of the table."""
+    before = watched_driver.change_tokens(["t"])
+    assert watched_driver.change_tokens(["t"]) == before
+    other = sqlite3.connect(tmp_path / "watch.db")
+    other.execute("INSERT INTO t VALUES (1, 'a')")
+    other.commit()
+    other.close()
+    assert watched_driver.change_tokens(["t"]) != before
+
+
+def test_change_tokens_leave_transaction_open(watched_driver) -> None:
+    """Probing skips an open transaction instead of committing it."""
+    watched_driver.change_tokens(["t"])
+    watched_driver.execute("INSERT INTO t VALUES (1, 'a')")
+    assert watched_driver.change_tokens(["t"]) == {}
+    assert watched_driver.con.in_transaction
+    watched_driver.rollback()
+    assert _count(watched_driver, "t") == 0
+
+
+# --------------------------------------------------------------------------------------
+# Cascading deletes
+# --------------------------------------------------------------------------------------
+TREE = """
+CREATE TABLE c(id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE o(
+    id INTEGER PRIMARY KEY,
+    c_id INTEGER REFERENCES c(id) ON UPDATE CASCADE ON DELETE CASCADE,
+    name TEXT
+);
+CREATE TABLE l(
+    id INTEGER PRIMARY KEY,
+    o_id INTEGER REFERENCES o(id) ON UPDATE CASCADE ON DELETE CASCADE,
+    name TEXT
+);
+INSERT INTO c VALUES (1, 'a'), (2, 'b');
+INSERT INTO o VALUES (1, 1, 'o1'), (2, 1, 'o2'), (3, 2, 'o3');
+INSERT INTO l VALUES (1, 1, 'l1'), (2, 1, 'l2'), (3, 2, 'l3'), (4, 3, 'l4');
+"""
+
+
+def _form(sql: str, table: str, foreign_keys: bool = True) -> ss.Form:
+    driver = ss.Sqlite(":memory:", sql_commands=sql)
+    driver.execute(f"PRAGMA foreign_keys = {int(foreign_keys)};")
+    frm = ss.Form(driver)
+    frm[table].set_by_pk(1, update_elements=False)
+    return frm
+
+
+@pytest.mark.parametrize("foreign_keys", [True, False])
+def test_delete_cascades_to_grandchildren(foreign_keys) -> None:
+    """Deleting a record deletes its whole tree of dependents."""
+    frm = _form(TREE, "c", foreign_keys)
+    result = frm.driver.delete_record(frm["c"])
+    assert result.attrs["exception"] is None
+    assert _table_rows(frm.driver, "c") == [[2, "b"]]
+    assert _table_rows(frm.driver, "o") == [[3, 2, "o3"]]
+    assert _table_rows(frm.driver, "l") == [[4, 3, "l4"]]
+
+
+# --------------------------------------------------------------------------------------
+# Duplicating records
+# --------------------------------------------------------------------------------------
+def test_duplicate_copies_whole_tree() -> None:
+    """Duplicating with children copies every level, pointing at the copies."""
+    frm = _form(TREE, "c")
+    result = frm.driver.duplicate_record(frm["c"], True)
+    assert result.attrs["exception"] is None
+    new_pk = result.attrs["lastrowid"]
+    assert new_pk == 3
+    orders = frm.driver.execute(f"SELECT id, name FROM o WHERE c_id = {new_pk}")
+    assert sorted(orders["name"]) == ["o1", "o2"]
+    order_pks = ", ".join(str(pk) for pk in orders["id"])
+    lines = frm.driver.execute(f"SELECT name FROM l WHERE o_id IN ({order_pks})")
+    assert sorted(lines["name"]) == ["l1", "l2", "l3"]
+    # the original tree is untouched
+    assert _count(frm.driver, "c") == 3
+    assert _count(frm.driver, "o") == 5
+    assert _count(frm.driver, "l") == 7
+
+
+def test_duplicate_without_children() -> None:
+    """Duplicating without children only copies the record itself."""
+    frm = _form(TREE, "c")
+    result = frm.driver.duplicate_record(frm["c"], False)
+    assert result.attrs["exception"] is None
+    assert _count(frm.driver, "c") == 3
+    assert _count(frm.driver, "o") == 3
+    assert _count(frm.driver, "l") == 4
+
+
+DIAMOND = """
+CREATE TABLE a(id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE b(
+    id INTEGER PRIMARY KEY,
+    a_id INTEGER REFERENCES a(id) ON UPDATE CASCADE,
+    name TEXT
+);
+CREATE TABLE c(
+    id INTEGER PRIMARY KEY,
+    a_id INTEGER REFERENCES a(id) ON UPDATE CASCADE,
+    name TEXT
+);
+CREATE TABLE d(
+    id INTEGER PRIMARY KEY,
+    b_id INTEGER REFERENCES b(id) ON UPDATE CASCADE,
+    c_id INTEGER REFERENCES c(id) ON UPDATE CASCADE,
+    name TEXT
+);
+INSERT INTO a VALUES (1, 'a1'), (2, 'a2');
+INSERT INTO b VALUES (1, 1, 'b1'), (2, 2, 'b2');
+INSERT INTO c VALUES (1, 1, 'c1'), (2, 2, 'c2');
+INSERT INTO d VALUES (1, 1, 1, 'd1'), (2, 1, 2, 'd2'), (3, 2, 2, 'd3');
+"""
+
+
+def test_duplicate_remaps_every_foreign_key() -> None:
+    """A table with two duplicated parents points at both of the copies."""
+    frm = _form(DIAMOND, "a")
+    result = frm.driver.duplicate_record(frm["a"], True)
+    assert result.attrs["exception"] is None
+    assert _table_rows(frm.driver, "b")[-1] == [3, 3, "b1"]
+    assert _table_rows(frm.driver, "c")[-1] == [3, 3, "c1"]
+    assert _table_rows(frm.driver, "d")[3:] == [[4, 3, 3, "d1"], [5, 3, 2, "d2"]]
+
+
+# --------------------------------------------------------------------------------------
+# Element mapping
+# --------------------------------------------------------------------------------------
+class _Widget:
+    def __init__(self) -> None:
+        self.bindings = []
+
+    def bind(self, sequence, func, add=None) -> None:
+        self.bindings.append((sequence, func))
+
+
+def test_mapped_elements_by_table() -> None:
+    """Mapped elements are looked up by table, in the order they were mapped."""
+    driver = ss.Sqlite(":memory:", sql_commands=UNIT_OF_WORK)
+    frm = ss.Form(driver)
+    keys = ["c.name", "p.name", "c.p_id"]
+    elements = [sg.Input(key=key) for key in keys]
+    for element, key in zip(elements, keys):
+        table, column = key.split(".")
+        frm.map_element(element, frm[table], column)
+    assert [m.element for m in frm.mapped_elements("c")] == [elements[0], elements[2]]
+    assert [m.element for m in frm.mapped_elements("p")] == [elements[1]]
+    assert frm.mapped_elements("missing") == []
+
+
+def test_mapped_events() -> None:
+    """The first mapping of an event runs, until it is replaced."""
+    driver = ss.Sqlite(":memory:", sql_commands=UNIT_OF_WORK)
+    frm = ss.Form(driver)
+    # process_events() only needs to know that a window is bound
+    frm.window = True
+    calls = []
+    frm.map_event("go", lambda: calls.append("first"))
+    frm.map_event("go", lambda: calls.append("second"))
+    assert frm.process_events("go", {})
+    frm.replace_event("go", lambda: calls.append("replaced"))
+    assert frm.process_events("go", {})
+    assert not frm.process_events("other", {})
+    assert calls == ["first", "replaced"]
+
+
+def test_remapping_binds_widget_once() -> None:
+    """Mapping an element again reuses its bindings, which invalidate the new map."""
+    driver = ss.Sqlite(
+        ":memory:", sql_commands="CREATE TABLE t(id INTEGER PRIMARY KEY, name TEXT);"
+    )
+    frm = ss.Form(driver)
+    element = sg.Input(key="t.name")
+    element.widget = _Widget()
+    frm.map_element(element, frm["t"], "name")
+    bindings = len(element.widget.bindings)
+    assert bindings
+    frm.map_element(element, frm["t"], "name")
+    assert len(element.widget.bindings) == bindings
+    mapped = frm.element_map[-1]
+    mapped.needs_update("value", 1)
+    element.widget.bindings[0][1](None)
+    assert mapped.needs_update("value", 1)
+
+
+# --------------------------------------------------------------------------------------
+# Coalesced refreshes
+# --------------------------------------------------------------------------------------
+class _Root:
+    def __init__(self) -> None:
+        self.idle = []
+
+    def after_idle(self, func):
+        self.idle.append(func)
+        return f"after#{len(self.idle)}"
+
+    def after_cancel(self, after_id) -> None:
+        pass
+
+
+class _Window:
+    def __init__(self) -> None:
+        self.TKroot = _Root()
+
+
+def _recording_form(monkeypatch):
+    frm = ss.Form(ss.Sqlite(":memory:", sql_commands=UNIT_OF_WORK))
+    calls = []
+    for name in ["update_fields", "update_selectors", "update_element_states"]:
+        monkeypatch.setattr(
+            frm, name, lambda key, *args, name=name: calls.append((name, key, *args))
+        )
+    monkeypatch.setattr(frm, "update_actions", lambda key: None)
+    return frm, calls
+
+
+def test_update_elements_runs_at_once_without_window(monkeypatch) -> None:
+    """Without a Tk event loop, updates are not scheduled."""
+    frm, calls = _recording_form(monkeypatch)
+    frm.update_elements("p")
+    assert ("update_fields", "p", []) in calls
+
+
+def test_update_elements_coalesced(monkeypatch) -> None:
+    """Updates requested while handling an event run once, when Tk is idle."""
+    frm, calls = _recording_form(monkeypatch)
+    frm.window = _Window()
+    frm.update_elements("p", omit_elements=["a", "b"])
+    frm.update_elements("p", omit_elements=["b"])
+    frm.update_elements("c", edit_protect_only=True)
+    assert calls == []
+    assert len(frm.window.TKroot.idle) == 1
+
+    frm.window.TKroot.idle[0]()
+    assert sorted(calls) == [
+        ("update_element_states", "c", False),
+        ("update_element_states", "p", False),
+        ("update_fields", "p", ["b"]),
+        ("update_selectors", "p", ["b"]),
+    ]
+    calls.clear()
+    frm.flush()
+    assert calls == []
+
+
+# --------------------------------------------------------------------------------------
+# Unit of work
+# --------------------------------------------------------------------------------------
+UNIT_OF_WORK = """
+CREATE TABLE p(id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE c(
+    id INTEGER PRIMARY KEY,
+    p_id INTEGER REFERENCES p(id),
+    name TEXT CHECK (name <> 'bad')
+);
+INSERT INTO p VALUES (1, 'a');
+INSERT INTO c VALUES (1, 1, 'x');
+"""
+
+
+def _unit_of_work_form() -> ss.Form:
+    driver = ss.Sqlite(":memory:", sql_commands=UNIT_OF_WORK)
+    frm = ss.Form(driver, unit_of_work=True, save_quiet=True)
+    frm.popup = ss.Popup()
+    # failed saves always show a popup, which needs a display
+    frm.popup.ok = lambda *args, **kwargs: None
+    return frm
+
+
+def test_unit_of_work_commits_all_tables() -> None:
+    """A successful unit of work commits every table."""
+    frm = _unit_of_work_form()
+    frm["p"].current.set_value("name", "A2")
+    frm["c"].current.set_value("name", "y")
+    result = frm.save_records(update_elements=False)
+    assert result & ss.SAVE_SUCCESS
+    assert _table_rows(frm.driver, "p") == [[1, "A2"]]
+    assert _table_rows(frm.driver, "c") == [[1, 1, "y"]]
+    assert not frm.driver.in_unit_of_work
+
+
+def test_unit_of_work_rolls_back_all_tables() -> None:
+    """A failed table rolls back the tables saved before it."""
+    frm = _unit_of_work_form()
+    frm["p"].current.set_value("name", "A2")
+    frm["c"].current.set_value("name", "bad")
+    result = frm.save_records(update_elements=False)
+    assert result & ss.SAVE_FAIL
+    assert _table_rows(frm.driver, "p") == [[1, "a"]]
+    assert _table_rows(frm.driver, "c") == [[1, 1, "x"]]
+    assert not frm.driver.con.in_transaction
+
+
+TWO_DEPTHS = """
+CREATE TABLE a(id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE b(id INTEGER PRIMARY KEY, a_id INTEGER REFERENCES a(id), name TEXT);
+CREATE TABLE x(
+    id INTEGER PRIMARY KEY,
+    a_id INTEGER REFERENCES a(id),
+    b_id INTEGER REFERENCES b(id),
+    name TEXT
+);
+CREATE TABLE y(id INTEGER PRIMARY KEY, x_id INTEGER REFERENCES x(id), name TEXT);
+INSERT INTO a VALUES (1, 'a1'), (2, 'a2');
+INSERT INTO b VALUES (1, 1, 'b1');
+INSERT INTO x VALUES (1, 1, NULL, 'x1'), (2, 2, NULL, 'x2');
+INSERT INTO y VALUES (1, 1, 'y1'), (2, 2, 'y2');
+"""
+
+
+def test_delete_table_reachable_at_two_depths() -> None:
+    """A table with no rows on its deeper level is still deleted before its children.
+
+    x is a child of a, and a grandchild through b. Only the first path finds rows,
+    so y, the child of x, has to be deleted first while foreign keys are enforced.
+    """
+    frm = _form(TWO_DEPTHS, "a")
+    # cascade by hand, the database only enforces the foreign keys
+    fks = [
+        ("b", "a_id", "a"),
+        ("x", "a_id", "a"),
+        ("x", "b_id", "b"),
+        ("y", "x_id", "x"),
+    ]
+    for child, fk, parent in fks:
+        frm.driver.add_relationship("LEFT JOIN", child, fk, parent, "id", True, True)
+    result = frm.driver.delete_record(frm["a"])
+    assert result.attrs["exception"] is None
+    assert _table_rows(frm.driver, "a") == [[2, "a2"]]
+    assert _count(frm.driver, "b") == 0
+    assert _table_rows(frm.driver, "x") == [[2, 2, None, "x2"]]
+    assert _table_rows(frm.driver, "y") == [[2, 2, "y2"]]
+
+
+# --------------------------------------------------------------------------------------
+# Selector rows
+# --------------------------------------------------------------------------------------
+SELECTOR = """
+CREATE TABLE p(id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE c(id INTEGER PRIMARY KEY, p_id INTEGER REFERENCES p(id), name TEXT);
+INSERT INTO p VALUES (1, 'a');
+INSERT INTO p VALUES (2, 'b');
+INSERT INTO c VALUES (1, 1, 'x');
+INSERT INTO c VALUES (2, 2, 'y');
+INSERT INTO c VALUES (3, 1, 'z');
+"""
+
+
+def _selector_rows(dataset, selector):
+    lst, pks, changed = dataset._selector_element_rows(selector)
+    return [(row.get_pk(), str(row)) for row in lst], pks.tolist(), changed
+
+
+@pytest.mark.parametrize("where_value", [1, "1"], ids=["int", "str"])
+def test_selector_rows_where_column(where_value) -> None:
+    """The where_column filter matches integer and string values alike."""
+    frm = ss.Form(ss.Sqlite(":memory:", sql_commands=SELECTOR))
+    selector = {"where_column": "p_id", "where_value": where_value}
+    rows, pks, _ = _selector_rows(frm["c"], selector)
+    assert rows == [(1, "x"), (3, "z")]
+    assert pks == [1, 3]
+
+
+def test_selector_rows_are_cached() -> None:
+    """The rows are rebuilt only when the pks or descriptions change."""
+    frm = ss.Form(ss.Sqlite(":memory:", sql_commands=SELECTOR))
+    dataset = frm["c"]
+    selector = {"where_column": None, "where_value": None}
+    first = dataset._selector_element_rows(selector)
+    assert first[2]
+    second = dataset._selector_element_rows(selector)
+    assert not second[2]
+    assert second[0] is first[0]
+    dataset.current.set_value("name", "changed")
+    rows, _, changed = _selector_rows(dataset, selector)
+    assert changed
+    assert rows[0] == (1, "changed")